@@ -1,33 +1,129 @@
 """The bosch_control_panel_cc880 integration."""
 import logging
+import time
+from typing import Any
 
 from bosch.control_panel.cc880p.cp import CP
 from bosch.control_panel.cc880p.models.cp import CpVersion
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entity import Entity
 
+from .clock_drift import ClockDriftTracker
+from .command_queue import CommandQueue
+from .connector import DeferredConnector
 from .const import (
+    CONF_DEFAULT_FAST_POLLING_PERIOD,
+    CONF_DEFAULT_IDLE_POLLING_PERIOD,
+    CONF_DEFAULT_POLLING_PERIOD,
+    CONF_DEFAULT_STATE_WRITE_DELAY,
+    CONF_DEFAULT_ZONE_FLAP_THRESHOLD,
+    CONF_DEFAULT_ZONE_MIN_ON_TIME,
+    CONF_DEFAULT_ZONE_OFF_DELAY,
+    CONF_FAST_POLLING_PERIOD,
     CONF_HOST,
+    CONF_IDLE_POLLING_PERIOD,
     CONF_INSTALLER_CODE,
     CONF_MODEL,
     CONF_POLLING_PERIOD,
     CONF_PORT,
+    CONF_STATE_WRITE_DELAY,
+    CONF_ZONE_FLAP_THRESHOLD,
+    CONF_ZONE_MIN_ON_TIME,
+    CONF_ZONE_OFF_DELAY,
+    CP_WATCHDOG_PERIOD,
+    DATA_AREA_DISPATCHER,
     DATA_BOSCH,
-    DEVICE_ID,
+    DATA_CLOCK_DRIFT,
+    DATA_COMMAND_QUEUE,
+    DATA_CONNECTOR,
+    DATA_METRICS,
+    DATA_OPTIONS_UPDATE_UNSUBSCRIBER,
+    DATA_POLL_SCHEDULER,
+    DATA_SNAPSHOT,
+    DATA_STATE_WRITER,
+    DATA_ZONE_DISPATCHER,
+    DATA_ZONE_FILTERS,
+    DATA_ZONE_HISTORY,
     DOMAIN,
     HW_VERSION,
+    LEGACY_DEVICE_ID,
+    LEGACY_UNIQUE_ID_PREFIX,
     MANUFACTURER,
     MODEL,
     PLATFORMS,
     SW_VERSION,
-    TITLE,
+    ZONE_HISTORY_CAPACITY,
 )
+from .dispatcher import AreaDispatcher, ZoneDispatcher
+from .handoff import async_get_handoff
+from .metrics import PanelMetrics
+from .poll_scheduler import AdaptivePollScheduler
+from .snapshot import PanelSnapshot, async_remove_snapshot
+from .state_writer import StateWriteScheduler
+from .zone_filter import ZoneFilters
+from .zone_history import ZoneHistory
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def get_config(entry: ConfigEntry, key: str, default: Any = None) -> Any:
+    """Get a configuration value, giving precedence to the entry options.
+
+    Args:
+        entry (ConfigEntry): The config entry
+        key (str): The configuration key
+        default (Any, optional): Value used if not configured. Defaults to None.
+
+    Returns:
+        Any: The configured value
+    """
+    return entry.options.get(key, entry.data.get(key, default))
+
+
+def _get_poll_periods(entry: ConfigEntry) -> dict[str, float]:
+    """Get the fast, normal and idle polling periods (in seconds)."""
+    return {
+        "fast_period": get_config(
+            entry, CONF_FAST_POLLING_PERIOD, CONF_DEFAULT_FAST_POLLING_PERIOD
+        )
+        / 1000,
+        "normal_period": get_config(
+            entry, CONF_POLLING_PERIOD, CONF_DEFAULT_POLLING_PERIOD
+        )
+        / 1000,
+        "idle_period": get_config(
+            entry, CONF_IDLE_POLLING_PERIOD, CONF_DEFAULT_IDLE_POLLING_PERIOD
+        )
+        / 1000,
+    }
+
+
+def _get_state_write_delay(entry: ConfigEntry) -> float:
+    """Get the time window (in seconds) to coalesce the state writes."""
+    return (
+        get_config(entry, CONF_STATE_WRITE_DELAY, CONF_DEFAULT_STATE_WRITE_DELAY)
+        / 1000
+    )
+
+
+def _get_zone_filter_settings(entry: ConfigEntry) -> dict[str, float]:
+    """Get the minimum on-time, off-delay (in seconds) and flap threshold."""
+    return {
+        "min_on_time": get_config(
+            entry, CONF_ZONE_MIN_ON_TIME, CONF_DEFAULT_ZONE_MIN_ON_TIME
+        )
+        / 1000,
+        "off_delay": get_config(entry, CONF_ZONE_OFF_DELAY, CONF_DEFAULT_ZONE_OFF_DELAY)
+        / 1000,
+        "flap_threshold": get_config(
+            entry, CONF_ZONE_FLAP_THRESHOLD, CONF_DEFAULT_ZONE_FLAP_THRESHOLD
+        ),
+    }
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Entry function during initialization of bosch control panel.
 
@@ -41,25 +137,99 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """
 
     _LOGGER.info("Async Setup Entry Start")
+    started = time.monotonic()
 
     # Default data is empty
     hass.data.setdefault(DOMAIN, {})
 
-    # Create the control panel
-    _alarm = await CP(
-        ip=entry.data[CONF_HOST],
-        port=entry.data[CONF_PORT],
-        model=CpVersion[entry.data[CONF_MODEL]].value,
-        installer_code=entry.data[CONF_INSTALLER_CODE],
-        poll_period=entry.data[CONF_POLLING_PERIOD] / 1000,
-        loop=hass.loop,
-    ).start()
+    # Reuse the connection validated by the config flow if still available
+    if pending := async_get_handoff(hass).async_take(entry.data):
+        _alarm = pending.alarm
+        _LOGGER.info(
+            "Reusing the connection validated by the config flow. Saved %.2fs",
+            pending.handshake,
+        )
+    else:
+        # Create the control panel. It is connected in the background
+        _alarm = CP(
+            ip=entry.data[CONF_HOST],
+            port=entry.data[CONF_PORT],
+            model=CpVersion[entry.data[CONF_MODEL]].value,
+            installer_code=entry.data[CONF_INSTALLER_CODE],
+            poll_period=CP_WATCHDOG_PERIOD,
+            loop=hass.loop,
+        )
+
+    # Seed the model with the last known state, before any listener reads it
+    _snapshot = PanelSnapshot(hass, entry.entry_id, _alarm.control_panel)
+    if not _alarm.connected and await _snapshot.async_restore():
+        _LOGGER.info("Restored the last known state of the control panel")
+    _alarm.add_listener(_snapshot)
+
+    # Latencies and counters of the hot paths
+    _metrics = PanelMetrics()
+    _alarm.add_listener(_metrics)
+
+    # Single listener routing the zone events to the affected zone entity
+    _zone_dispatcher = ZoneDispatcher(_metrics)
+    _alarm.add_listener(_zone_dispatcher)
+
+    # Single listener routing the area events to the affected area entity
+    _area_dispatcher = AreaDispatcher(_alarm.control_panel)
+    _alarm.add_listener(_area_dispatcher)
+
+    # History of the zone triggers, queried by the zone history service/sensors
+    _zone_history = ZoneHistory(
+        len(_alarm.control_panel.zones), ZONE_HISTORY_CAPACITY
+    )
+    _alarm.add_listener(_zone_history)
 
-    hass.data[DOMAIN][entry.entry_id] = {DATA_BOSCH: _alarm}
+    # Poll the control panel according to its activity
+    _poll_scheduler = AdaptivePollScheduler(
+        hass, _alarm, _metrics, **_get_poll_periods(entry)
+    )
+    _poll_scheduler.async_start()
+
+    # Serialize the commands sent to the control panel
+    _command_queue = CommandQueue(hass, _alarm, _metrics)
+    _command_queue.async_start()
+
+    # Keep the panel clock in time, setting it only when it drifts away
+    _clock_drift = ClockDriftTracker(hass, _command_queue)
+    _alarm.add_listener(_clock_drift)
+
+    # Connect without holding up the setup of the entry
+    _connector = DeferredConnector(
+        hass, _alarm, on_attempt_failed=_snapshot.async_expire
+    )
+
+    hass.data[DOMAIN][entry.entry_id] = {
+        DATA_BOSCH: _alarm,
+        DATA_STATE_WRITER: StateWriteScheduler(
+            hass, _metrics, _get_state_write_delay(entry)
+        ),
+        DATA_ZONE_DISPATCHER: _zone_dispatcher,
+        DATA_ZONE_FILTERS: ZoneFilters(
+            hass, _metrics, **_get_zone_filter_settings(entry)
+        ),
+        DATA_AREA_DISPATCHER: _area_dispatcher,
+        DATA_POLL_SCHEDULER: _poll_scheduler,
+        DATA_COMMAND_QUEUE: _command_queue,
+        DATA_CONNECTOR: _connector,
+        DATA_METRICS: _metrics,
+        DATA_ZONE_HISTORY: _zone_history,
+        DATA_CLOCK_DRIFT: _clock_drift,
+        DATA_SNAPSHOT: _snapshot,
+        DATA_OPTIONS_UPDATE_UNSUBSCRIBER: entry.add_update_listener(
+            options_update_listener
+        ),
+    }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    _LOGGER.info("Async Load Entry Done")
+    _connector.async_start()
+
+    _LOGGER.info("Async Load Entry Done in %.3fs", time.monotonic() - started)
 
     return True
 
@@ -73,7 +243,28 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry,
         PLATFORMS
     ):
-        _alarm: CP = hass.data[DOMAIN].pop(entry.entry_id)[DATA_BOSCH]
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        data[DATA_OPTIONS_UPDATE_UNSUBSCRIBER]()
+        _writer: StateWriteScheduler = data[DATA_STATE_WRITER]
+        _writer.async_shutdown()
+        _LOGGER.info(
+            "Saved %d of %d state writes", _writer.saved, _writer.requested
+        )
+        _connector: DeferredConnector = data[DATA_CONNECTOR]
+        await _connector.async_stop()
+        _poll_scheduler: AdaptivePollScheduler = data[DATA_POLL_SCHEDULER]
+        await _poll_scheduler.async_stop()
+        _clock_drift: ClockDriftTracker = data[DATA_CLOCK_DRIFT]
+        _clock_drift.async_stop()
+        _command_queue: CommandQueue = data[DATA_COMMAND_QUEUE]
+        await _command_queue.async_stop()
+        _alarm: CP = data[DATA_BOSCH]
+        _alarm.remove_listener(data[DATA_ZONE_DISPATCHER])
+        _alarm.remove_listener(data[DATA_AREA_DISPATCHER])
+        _alarm.remove_listener(data[DATA_METRICS])
+        _alarm.remove_listener(data[DATA_ZONE_HISTORY])
+        _alarm.remove_listener(_clock_drift)
+        _alarm.remove_listener(data[DATA_SNAPSHOT])
         await _alarm.stop()
         _LOGGER.info("Async Unload Entry Done")
     else:
@@ -82,24 +273,94 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the data stored for a config entry.
+
+    Args:
+        hass (HomeAssistant): Homeassistant object
+        entry (ConfigEntry): The config entry being removed
+    """
+    await async_remove_snapshot(hass, entry.entry_id)
+
+
 async def options_update_listener(
     hass: HomeAssistant,
     entry: ConfigEntry
 ) -> None:
     """Update the currently available control panel.
 
+    The options are applied in place, keeping the connection to the control
+    panel and its current state.
+
     Args:
         hass (HomeAssistant): The Homeassistant object
         entry (ConfigEntry): The options needed to update the control panel
     """
-    # _alarm = hass.data[DOMAIN][entry.entry_id][DATA_BOSCH]
-    # _alarm.update_options(entry.options)
-    return
+    _LOGGER.info("Applying the options %s", entry.options)
+    data = hass.data[DOMAIN][entry.entry_id]
+    _poll_scheduler: AdaptivePollScheduler = data[DATA_POLL_SCHEDULER]
+    _poll_scheduler.set_periods(**_get_poll_periods(entry))
+    _writer: StateWriteScheduler = data[DATA_STATE_WRITER]
+    _writer.delay = _get_state_write_delay(entry)
+    _zone_filters: ZoneFilters = data[DATA_ZONE_FILTERS]
+    _zone_filters.set_settings(**_get_zone_filter_settings(entry))
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an old config entry.
+
+    Version 1 entries used fixed unique ids, allowing a single control panel.
+    Their entities and device are moved to ids prefixed by the entry id.
+
+    Args:
+        hass (HomeAssistant): Homeassistant object
+        entry (ConfigEntry): The config entry to migrate
+
+    Returns:
+        bool: True if the entry was migrated. False otherwise
+    """
+    _LOGGER.info("Migrating the config entry from version %s", entry.version)
+
+    if entry.version == 1:
+
+        @callback
+        def _migrate_unique_id(entity: er.RegistryEntry) -> dict[str, str] | None:
+            if not entity.unique_id.startswith(LEGACY_UNIQUE_ID_PREFIX):
+                return None
+            suffix = entity.unique_id.removeprefix(LEGACY_UNIQUE_ID_PREFIX)
+            return {"new_unique_id": f"{entry.entry_id}_{suffix}"}
+
+        await er.async_migrate_entries(hass, entry.entry_id, _migrate_unique_id)
+
+        device_registry = dr.async_get(hass)
+        if device := device_registry.async_get_device(
+            identifiers={(DOMAIN, LEGACY_DEVICE_ID)}
+        ):
+            device_registry.async_update_device(
+                device.id, new_identifiers={(DOMAIN, entry.entry_id)}
+            )
+
+        hass.config_entries.async_update_entry(
+            entry,
+            unique_id=f"{entry.data[CONF_HOST]}:{entry.data[CONF_PORT]}",
+            version=2,
+        )
+
+    _LOGGER.info("Migrated the config entry to version %s", entry.version)
+    return True
 
 
 class BoschControlPanelDevice(Entity):
     """Class used to link all the control panel etities into a device."""
 
+    def __init__(self, entry: ConfigEntry) -> None:
+        """Initialize the device of the control panel.
+
+        Args:
+            entry (ConfigEntry): The config entry of the control panel
+        """
+        self._entry: ConfigEntry = entry
+
     @property
     def device_info(self) -> dict[str, str]:
         """Get the device information.
@@ -108,8 +369,8 @@ class BoschControlPanelDevice(Entity):
             dict[str, str]: THe dictionary with the information of the device
         """
         return {
-            "identifiers": {(DOMAIN, DEVICE_ID)},
-            "name": TITLE,
+            "identifiers": {(DOMAIN, self._entry.entry_id)},
+            "name": self._entry.title,
             "manufacturer": MANUFACTURER,
             "model": MODEL,
             "sw_version": SW_VERSION,
@@ -2,17 +2,16 @@
 
 from datetime import datetime, timedelta
 import logging
+import math
 
 from bosch.control_panel.cc880p.cp import CP
 from bosch.control_panel.cc880p.models.cp import (
     Area,
     ArmingMode,
     Availability,
-    ControlPanelEntity,
     Id,
     Output,
     Siren,
-    Time,
     Zone,
 )
 from bosch.control_panel.cc880p.models.listener import BaseControlPanelListener
@@ -35,11 +34,53 @@ from homeassistant.const import (
     STATE_ALARM_TRIGGERED,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers import config_validation as cv
-
-from . import BoschControlPanelDevice
-from .const import DATA_BOSCH, DOMAIN, SERVICE_OUTPUT, SERVICE_SIREN
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HomeAssistant,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_platform
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from . import BoschControlPanelDevice, get_config
+from .command_queue import CommandQueue
+from .const import (
+    ATTR_END,
+    ATTR_MASK,
+    ATTR_OFF,
+    ATTR_ON,
+    ATTR_START,
+    ATTR_VALUE,
+    ATTR_ZONES,
+    CONF_DEFAULT_OPTIMISTIC_TIMEOUT,
+    CONF_OPTIMISTIC_TIMEOUT,
+    CONFIRMATION_RESPONSES,
+    DATA_AREA_DISPATCHER,
+    DATA_BOSCH,
+    DATA_COMMAND_QUEUE,
+    DATA_POLL_SCHEDULER,
+    DATA_SNAPSHOT,
+    DATA_STATE_WRITER,
+    DATA_ZONE_HISTORY,
+    DOMAIN,
+    PRIMARY_AREA,
+    SERVICE_OUTPUT,
+    SERVICE_OUTPUTS,
+    SERVICE_SIREN,
+    SERVICE_ZONE_HISTORY,
+    ZONE_TRIGGERS_WINDOW,
+)
+from .dispatcher import AreaDispatcher
+from .panel_state import PanelStateBits
+from .poll_scheduler import AdaptivePollScheduler
+from .snapshot import PanelSnapshot
+from .state_writer import StateWriteScheduler
+from .zone_history import ZoneHistory
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,14 +88,35 @@ _LOGGER = logging.getLogger(__name__)
 ICON = "mdi:security"
 
 # Schema for executing the siren on/off service
-SERVICE_SIREN_SCHEMA = vol.Schema({vol.Required(CONF_COMMAND): cv.string})
+SERVICE_SIREN_SCHEMA = {vol.Required(CONF_COMMAND): cv.string}
 
 # Schema to set an output on/off
-SERVICE_OUTPUT_SCHEMA = vol.Schema(
-    {vol.Required(CONF_ID): cv.positive_int, vol.Required(CONF_COMMAND): cv.string}
-)
-
-TWO_MINUTES = 60 * 2
+SERVICE_OUTPUT_SCHEMA = {
+    vol.Required(CONF_ID): cv.positive_int,
+    vol.Required(CONF_COMMAND): cv.string,
+}
+
+# Schema to set several outputs on/off, by list of ids and/or by bitmask
+SERVICE_OUTPUTS_SCHEMA = {
+    vol.Optional(ATTR_ON, default=[]): vol.All(cv.ensure_list, [cv.positive_int]),
+    vol.Optional(ATTR_OFF, default=[]): vol.All(cv.ensure_list, [cv.positive_int]),
+    vol.Optional(ATTR_MASK, default=0): cv.positive_int,
+    vol.Optional(ATTR_VALUE, default=0): cv.positive_int,
+}
+
+# Schema to query the history of the zone triggers
+SERVICE_ZONE_HISTORY_SCHEMA = {
+    vol.Optional(ATTR_START): cv.datetime,
+    vol.Optional(ATTR_END): cv.datetime,
+    vol.Optional(ATTR_ZONES, default=[]): vol.All(cv.ensure_list, [cv.positive_int]),
+}
+
+# State presented for each arming mode of the control panel
+_MODE_TO_STATE = {
+    ArmingMode.DISARMED: STATE_ALARM_DISARMED,
+    ArmingMode.ARMED_AWAY: STATE_ALARM_ARMED_AWAY,
+    ArmingMode.ARMED_STAY: STATE_ALARM_ARMED_NIGHT,
+}
 
 
 async def async_setup_entry(
@@ -64,9 +126,50 @@ async def async_setup_entry(
     _LOGGER.debug("Async Setup Entry Alarm Control Panel")
 
     # Get the instance of the control panel
-    _alarm: CP = hass.data[DOMAIN][config_entry.entry_id][DATA_BOSCH]
-
-    async_add_entities([BoschAlarmControlPanel(_alarm)])
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    _alarm: CP = data[DATA_BOSCH]
+    _writer: StateWriteScheduler = data[DATA_STATE_WRITER]
+    _poll_scheduler: AdaptivePollScheduler = data[DATA_POLL_SCHEDULER]
+    _command_queue: CommandQueue = data[DATA_COMMAND_QUEUE]
+    _dispatcher: AreaDispatcher = data[DATA_AREA_DISPATCHER]
+    _zone_history: ZoneHistory = data[DATA_ZONE_HISTORY]
+    _snapshot: PanelSnapshot = data[DATA_SNAPSHOT]
+
+    async_add_entities(
+        BoschAlarmControlPanel(
+            config_entry,
+            _alarm,
+            _writer,
+            _poll_scheduler,
+            _command_queue,
+            _dispatcher,
+            _zone_history,
+            _snapshot,
+            idd,
+        )
+        for idd in _alarm.control_panel.areas
+    )
+
+    # The services target the control panel entities, one per config entry
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_SIREN, SERVICE_SIREN_SCHEMA, "async_siren_service"
+    )
+    platform.async_register_entity_service(
+        SERVICE_OUTPUT, SERVICE_OUTPUT_SCHEMA, "async_output_service"
+    )
+    platform.async_register_entity_service(
+        SERVICE_OUTPUTS,
+        SERVICE_OUTPUTS_SCHEMA,
+        "async_outputs_service",
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    platform.async_register_entity_service(
+        SERVICE_ZONE_HISTORY,
+        SERVICE_ZONE_HISTORY_SCHEMA,
+        "async_zone_history_service",
+        supports_response=SupportsResponse.ONLY,
+    )
 
 
 async def async_unload_entry(hass: HomeAssistant, config_entry):
@@ -97,33 +200,85 @@ def _strtobool(val):
 class BoschAlarmControlPanel(
     BoschControlPanelDevice, AlarmControlPanelEntity, BaseControlPanelListener
 ):
-    """Bosch Control Panel."""
+    """Area of the Bosch Control Panel.
 
-    def __init__(self, alarm: CP) -> None:
-        """Initialize the control panel.
+    The primary area is armed/disarmed through the keypad, where the panel
+    verifies the user code, and holds the attributes of the whole panel. The
+    keypad has no way to select the area, and the panel has no other way to
+    verify a code, so the other areas can only be armed (away) directly: they
+    are disarmed with the code, from the primary area or the keypad.
+    """
+
+    # The bitmasks aren't worth keeping in the recorder history, the zones
+    # having their own entities
+    _unrecorded_attributes = frozenset({"outputs", "zones_triggered", "zones_enabled"})
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        alarm: CP,
+        writer: StateWriteScheduler,
+        poll_scheduler: AdaptivePollScheduler,
+        command_queue: CommandQueue,
+        dispatcher: AreaDispatcher,
+        zone_history: ZoneHistory,
+        snapshot: PanelSnapshot,
+        idd: Id,
+    ) -> None:
+        """Initialize the area of the control panel.
 
         Args:
+            entry (ConfigEntry): The config entry of the control panel
             alarm (CP): Object representation of the control panel
+            writer (StateWriteScheduler): Scheduler of the state writes
+            poll_scheduler (AdaptivePollScheduler): Scheduler of the panel polls
+            command_queue (CommandQueue): Queue of the panel commands
+            dispatcher (AreaDispatcher): Dispatcher of the area events
+            zone_history (ZoneHistory): History of the zone triggers
+            snapshot (PanelSnapshot): Last known state of the control panel
+            idd (Id): The number/id of this area
         """
+        super().__init__(entry)
         self._state = STATE_UNKNOWN
         self._transition_state: str | None = None
+        # Mode sent to the panel and not yet confirmed by a status update
+        self._expected_mode: ArmingMode | None = None
+        self._cancel_confirmation: CALLBACK_TYPE | None = None
+        # Responses still to receive before reverting the mode not confirmed
+        self._responses_to_revert: int | None = None
         self._alarm: CP = alarm
+        self._writer: StateWriteScheduler = writer
+        self._poll_scheduler: AdaptivePollScheduler = poll_scheduler
+        self._command_queue: CommandQueue = command_queue
+        self._dispatcher: AreaDispatcher = dispatcher
+        self._zone_history: ZoneHistory = zone_history
+        self._snapshot: PanelSnapshot = snapshot
+        self._id: Id = idd
+        self._area: Area = alarm.control_panel.areas[idd]
+        self._primary: bool = idd == PRIMARY_AREA
         self._manual_trigger: bool = False
+        self._bits = PanelStateBits(alarm.control_panel)
+        # Cached state attributes. Rebuilt only after being invalidated
+        self._attributes: dict[str, str | int] | None = None
 
     @property
     def code_format(self):
         """Regex for code format or None if no code is required."""
-        return CodeFormat.NUMBER
+        return CodeFormat.NUMBER if self._primary else None
 
     @property
     def unique_id(self):
         """Return a unique ID to use for this device."""
-        return "bosch_control_panel"
+        if self._primary:
+            return f"{self._entry.entry_id}_control_panel"
+        return f"{self._entry.entry_id}_area_{self._id}"
 
     @property
     def name(self):
         """Return the name of the device."""
-        return "bosch_control_panel"
+        if self._primary:
+            return "bosch_control_panel"
+        return f"bosch_control_panel_area_{self._id}"
 
     @property
     def changed_by(self) -> str:
@@ -137,7 +292,7 @@ class BoschAlarmControlPanel(
     @property
     def code_arm_required(self):
         """Whether the code is required for arm actions."""
-        return True
+        return self._primary
 
     @property
     def icon(self):
@@ -147,7 +302,7 @@ class BoschAlarmControlPanel(
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self._alarm.control_panel.availability.available
+        return self._snapshot.available
 
     @property
     def assumed_state(self) -> bool:
@@ -163,43 +318,36 @@ class BoschAlarmControlPanel(
         # Else if siren is triggered, show that the siren was triggered
         elif self._alarm.control_panel.siren.on:
             self._state = STATE_ALARM_TRIGGERED
-        # Else show any other alarm state
+        # Else show any other alarm state, anticipating the one not yet confirmed
         else:
-            mode = self._alarm.control_panel.areas[1].mode
-            if mode == ArmingMode.DISARMED and self._state != STATE_ALARM_DISARMED:
-                self._state = STATE_ALARM_DISARMED
-            elif (
-                mode == ArmingMode.ARMED_AWAY and self._state != STATE_ALARM_ARMED_AWAY
-            ):
-                self._state = STATE_ALARM_ARMED_AWAY
-            elif (
-                mode == ArmingMode.ARMED_STAY and self._state != STATE_ALARM_ARMED_NIGHT
-            ):
-                self._state = STATE_ALARM_ARMED_NIGHT
+            mode = self._expected_mode or self._area.mode
+            self._state = _MODE_TO_STATE.get(mode, self._state)
 
         return self._state
 
     @property
-    def _attr_extra_state_attributes(self):
+    def extra_state_attributes(self) -> dict[str, str | int] | None:
         """Return the state attributes."""
-        c_p = self._alarm.control_panel
-        state_attr = {
-            "time": f"{c_p.time_utc.hour:02d}:{c_p.time_utc.minute:02d}:00",
-            "siren": int(c_p.siren.on),
-            "outputs": " ".join([str(int(out.on)) for _, out in c_p.outputs.items()]),
-            "zones_triggered": " ".join(
-                [str(int(zone.triggered)) for _, zone in c_p.zones.items()]
-            ),
-            "zones_enabled": " ".join(
-                [str(int(zone.enabled)) for _, zone in c_p.zones.items()]
-            ),
-        }
+        if not self._primary:
+            return None
 
-        return state_attr
+        if self._attributes is None:
+            c_p = self._alarm.control_panel
+            self._attributes = {
+                "siren": int(c_p.siren.on),
+                "outputs": self._bits.outputs_str,
+                "zones_triggered": self._bits.zones_triggered_str,
+                "zones_enabled": self._bits.zones_enabled_str,
+            }
+
+        return self._attributes
 
     @property
     def supported_features(self) -> int:
         """Return the list of supported features."""
+        if not self._primary:
+            # Only armed, disarming needs the code
+            return AlarmControlPanelEntityFeature.ARM_AWAY
         return (
             AlarmControlPanelEntityFeature.TRIGGER
             # | AlarmControlPanelEntityFeature.ARM_NIGHT
@@ -208,41 +356,50 @@ class BoschAlarmControlPanel(
 
     async def async_added_to_hass(self) -> None:
         """Initialize the control panel when it is added to hass."""
-        _LOGGER.info("Starting the Bosch Control Panel")
-        self.hass.services.async_register(
-            DOMAIN, SERVICE_SIREN, self._siren_service, schema=SERVICE_SIREN_SCHEMA
-        )
-        self.hass.services.async_register(
-            DOMAIN, SERVICE_OUTPUT, self._out_service, schema=SERVICE_OUTPUT_SCHEMA
+        _LOGGER.info("Starting the Bosch Control Panel Area %d", self._id)
+        self._dispatcher.add_area(self._id, self)
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, self._snapshot.signal_expired, self._async_schedule_write
+            )
         )
-        self._alarm.add_listener(self)
 
-        _LOGGER.info("Started the Bosch Control Panel")
+        _LOGGER.info("Started the Bosch Control Panel Area %d", self._id)
 
     async def async_will_remove_from_hass(self) -> None:
         """Cleanup the control panel when it is about to be removed from hass."""
-        _LOGGER.info("Stopping the Bosch Control Panel")
-        self._alarm.remove_listener(self)
-        self.hass.services.async_remove(DOMAIN, SERVICE_SIREN)
-        self.hass.services.async_remove(DOMAIN, SERVICE_OUTPUT)
-        _LOGGER.info("Stopped the Bosch Control Panel")
+        _LOGGER.info("Stopping the Bosch Control Panel Area %d", self._id)
+        self._dispatcher.remove_area(self._id)
+        self._async_clear_confirmation()
+        self._writer.async_cancel(self)
+        _LOGGER.info("Stopped the Bosch Control Panel Area %d", self._id)
 
     async def async_alarm_disarm(self, code=None):
         """Disarm the alarm.
 
         Args:
             code (str, optional): The code to disarm. Defaults to None.
+
+        Raises:
+            HomeAssistantError: If the area can't be disarmed with a code
         """
         _LOGGER.info("Disarming")
+        if not self._primary:
+            # The code can't be verified for this area
+            raise HomeAssistantError(
+                f"Area {self._id} can only be disarmed from the primary area"
+            )
         if self._manual_trigger:
             # Disable Siren and get the status forcing update
-            await self._alarm.set_siren(False)
+            await self._command_queue.async_set_siren(False)
             # Clear the manual trigger
             self._manual_trigger = False
         # If alarm is armed anyway, proceed with the disarm, otherwise don't do anything
         elif self.state not in [STATE_ALARM_DISARMING, STATE_ALARM_DISARMED]:
             await self._change_state(
-                code=f"{code}#", transition_state=STATE_ALARM_DISARMING
+                code=f"{code}#",
+                transition_state=STATE_ALARM_DISARMING,
+                expected_mode=ArmingMode.DISARMED,
             )
 
     async def async_alarm_arm_night(self, code=None):
@@ -252,9 +409,14 @@ class BoschAlarmControlPanel(
             code (str, optional): The code to arm. Defaults to None.
         """
         _LOGGER.info("Arming Night")
-        if self.state == STATE_ALARM_DISARMED:
+        if not self._primary:
+            # Areas are armed directly only in away mode
+            _LOGGER.warning("Area %d can't be armed in night mode", self._id)
+        elif self.state == STATE_ALARM_DISARMED:
             await self._change_state(
-                code=f"{code}*", transition_state=STATE_ALARM_ARMING
+                code=f"{code}*",
+                transition_state=STATE_ALARM_ARMING,
+                expected_mode=ArmingMode.ARMED_STAY,
             )
 
     async def async_alarm_arm_away(self, code=None):
@@ -266,7 +428,9 @@ class BoschAlarmControlPanel(
         _LOGGER.info("Arming Away")
         if self.state == STATE_ALARM_DISARMED:
             await self._change_state(
-                code=f"{code}#", transition_state=STATE_ALARM_ARMING
+                code=f"{code}#",
+                transition_state=STATE_ALARM_ARMING,
+                expected_mode=ArmingMode.ARMED_AWAY,
             )
 
     async def async_alarm_trigger(self, code=None):
@@ -276,7 +440,7 @@ class BoschAlarmControlPanel(
             code (str, optional): The code to trigger the alarm. Defaults to None.
         """
         _LOGGER.info("Triggering the Alarm")
-        await self._alarm.set_siren(True)
+        await self._command_queue.async_set_siren(True)
         self._manual_trigger = True
 
     async def async_alarm_arm_custom_bypass(self, code=None) -> None:
@@ -287,85 +451,230 @@ class BoschAlarmControlPanel(
         """
         _LOGGER.info("Arming with custom")
 
-    async def _change_state(self, code, transition_state):
+    async def _change_state(self, code, transition_state, expected_mode):
+        self._async_clear_confirmation()
+        confirming = False
         try:
             # Change the status to the transition state
             self._transition_state = transition_state
-            # Force update of the transition state
-            await self.async_update_ha_state(force_refresh=True)
-            # Send the code to change the state
-            await self._alarm.send_keys(keys=code)
+            # Poll faster until the panel reports the new state
+            self._poll_scheduler.async_set_transition(True)
+            # Write the transition state right away
+            self.async_write_ha_state()
+            # Send the command to change the state
+            if self._primary:
+                await self._command_queue.async_send_keys(code)
+            else:
+                # Only arming reaches here, see async_alarm_disarm
+                await self._command_queue.async_set_arming(self._id, True)
             self._transition_state = None
-            # Force to get the status again
-            # This is needed because the control panel doesn't return the
-            # current status in the first message
-            await self._alarm.get_status()
+            # The control panel doesn't return the new status in the response
+            # to the command. Instead of blocking on another status request,
+            # present the expected mode until the next polls confirm it
+            if self._area.mode != expected_mode:
+                self._async_expect_mode(expected_mode)
+                confirming = True
+            self._writer.async_schedule(self)
         except Exception as ex:  # pylint: disable=broad-except
             _LOGGER.error("Couldn't change the alarm to %s: %s", transition_state, ex)
             self._transition_state = None
             # Force update of the transition state
-            await self.async_update_ha_state(force_refresh=True)
-
-    def _time_synced(self) -> bool:
-        cp_time = self._alarm.control_panel.time.time
-        cur_time = datetime.now().time().replace(second=0, microsecond=0)
-        cp_timedelta = timedelta(hours=cp_time.hour, minutes=cp_time.minute)
-        cur_timedelta = timedelta(hours=cur_time.hour, minutes=cur_time.minute)
-        diff_seconds = abs(cur_timedelta - cp_timedelta).total_seconds()
+            self._writer.async_schedule(self)
+        finally:
+            if not confirming:
+                self._poll_scheduler.async_set_transition(False)
+
+    @callback
+    def _async_expect_mode(self, mode: ArmingMode) -> None:
+        timeout = get_config(
+            self._entry, CONF_OPTIMISTIC_TIMEOUT, CONF_DEFAULT_OPTIMISTIC_TIMEOUT
+        )
+        self._expected_mode = mode
+        self._responses_to_revert = None
+        self._cancel_confirmation = async_call_later(
+            self.hass, timeout, self._async_confirmation_expired
+        )
 
-        return diff_seconds < TWO_MINUTES
+    @callback
+    def _async_clear_confirmation(self) -> None:
+        if self._cancel_confirmation:
+            self._cancel_confirmation()
+            self._cancel_confirmation = None
+        self._responses_to_revert = None
+        if self._expected_mode is not None:
+            self._expected_mode = None
+            self._poll_scheduler.async_set_transition(False)
+
+    @callback
+    def _async_schedule_write(self) -> None:
+        self._writer.async_schedule(self)
+
+    @callback
+    def _async_confirmation_expired(self, _now: datetime) -> None:
+        # The panel had time to change. Reverted unless a poll after the
+        # timeout confirms it (e.g. a wrong code leaves the panel unchanged)
+        self._cancel_confirmation = None
+        self._responses_to_revert = CONFIRMATION_RESPONSES
+
+    @callback
+    def _async_revert_expected_mode(self) -> None:
+        _LOGGER.warning(
+            "The control panel didn't confirm the %s mode, reverting to %s",
+            self._expected_mode,
+            self._area.mode,
+        )
+        self._async_clear_confirmation()
+        self._writer.async_schedule(self)
 
-    async def _sync_time(self):
-        try:
-            if self._time_synced():
-                # Need to set the time in the control panel
-                _LOGGER.info("Time is synchronized")
-            else:
-                _LOGGER.warning("Synchronizing the time")
-                await self._alarm.set_time()
-        except Exception:  # pylint: disable=broad-exception-caught
-            _LOGGER.exception("Time synchronization failed")
-
-    async def _siren_service(self, call: ServiceCall):
-        status = bool(_strtobool(call.data[CONF_COMMAND]))
-        await self._alarm.set_siren(status)
+    async def async_siren_service(self, **kwargs) -> None:
+        """Set the siren on/off (siren service)."""
+        status = bool(_strtobool(kwargs[CONF_COMMAND]))
+        await self._command_queue.async_set_siren(status)
         self._manual_trigger = status
 
-    async def _out_service(self, call: ServiceCall):
-        idd: Id = call.data[CONF_ID]
-        status = bool(_strtobool(call.data[CONF_COMMAND]))
-        await self._alarm.set_output(idd, status)
+    async def async_output_service(self, **kwargs) -> None:
+        """Set an output on/off (output service)."""
+        idd: Id = kwargs[CONF_ID]
+        status = bool(_strtobool(kwargs[CONF_COMMAND]))
+        await self._command_queue.async_set_output(idd, status)
+
+    async def async_outputs_service(self, **kwargs) -> ServiceResponse:
+        """Set several outputs on/off at once (outputs service).
+
+        The outputs are given by the lists of ids to switch on and off, and/or
+        by a mask of the outputs to set (bit 0 is output 1) with their value.
+
+        Returns:
+            ServiceResponse: The timing of the command sent for each output
+        """
+        targets: dict[Id, bool] = {}
+        for idd in self._alarm.control_panel.outputs:
+            bit = 1 << (idd - 1)
+            if kwargs[ATTR_MASK] & bit:
+                targets[idd] = bool(kwargs[ATTR_VALUE] & bit)
+
+        for idd, on in [(idd, True) for idd in kwargs[ATTR_ON]] + [
+            (idd, False) for idd in kwargs[ATTR_OFF]
+        ]:
+            if idd not in self._alarm.control_panel.outputs:
+                raise HomeAssistantError(f"The output {idd} doesn't exist")
+            if targets.get(idd, on) != on:
+                raise HomeAssistantError(f"Conflicting states for the output {idd}")
+            targets[idd] = on
+
+        timings = await self._command_queue.async_set_outputs(targets)
+
+        commands = []
+        for idd, timing in timings.items():
+            if isinstance(timing, Exception):
+                _LOGGER.error("Couldn't set the output %d: %s", idd, timing)
+                commands.append({"output": idd, "error": str(timing)})
+            elif timing is not None:
+                commands.append(
+                    {
+                        "output": idd,
+                        "on": targets[idd],
+                        "queue_wait": round(timing.queue_wait, 4),
+                        "execution": round(timing.execution, 4),
+                    }
+                )
+        return {
+            "commands": commands,
+            "skipped": [idd for idd, timing in timings.items() if timing is None],
+        }
+
+    async def async_zone_history_service(self, **kwargs) -> ServiceResponse:
+        """Query the history of the zone triggers (zone_history service).
+
+        Defaults to the triggers of all the zones within the last
+        ZONE_TRIGGERS_WINDOW seconds.
+
+        Returns:
+            ServiceResponse: The number of triggers and the last trigger of each
+                zone, and the triggers within the time range
+        """
+        end = dt_util.as_utc(kwargs.get(ATTR_END) or dt_util.utcnow())
+        start = dt_util.as_utc(
+            kwargs.get(ATTR_START) or end - timedelta(seconds=ZONE_TRIGGERS_WINDOW)
+        )
+        zones = kwargs[ATTR_ZONES]
+        for idd in zones:
+            if idd not in self._alarm.control_panel.zones:
+                raise HomeAssistantError(f"The zone {idd} doesn't exist")
+
+        history = self._zone_history
+        counts = history.buffer.counts(
+            history.n_zones, start.timestamp(), end.timestamp()
+        )
+        last = history.buffer.last(history.n_zones)
+        return {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "zones": {
+                idd: {
+                    "triggers": int(counts[idd - 1]),
+                    "last_trigger": None
+                    if math.isnan(last[idd - 1])
+                    else dt_util.utc_from_timestamp(last[idd - 1]).isoformat(),
+                }
+                for idd in zones or range(1, history.n_zones + 1)
+            },
+            "triggers": [
+                {
+                    "zone": idd,
+                    "time": dt_util.utc_from_timestamp(timestamp).isoformat(),
+                }
+                for idd, timestamp in history.buffer.events(
+                    start.timestamp(), end.timestamp(), zones
+                )
+            ],
+        }
 
     async def on_availability_changed(self, entity: Availability):  # noqa: D102
         _LOGGER.debug("Availability changed: %s", entity)
-        await self.async_update_ha_state(force_refresh=True)
+        if not entity.available:
+            # Nothing can be confirmed until reconnected
+            self._async_clear_confirmation()
+        self._writer.async_schedule(self)
+
+    async def on_data(self, data: bytes):  # noqa: D102
+        if self._responses_to_revert is None:
+            return
+        self._responses_to_revert -= 1
+        if self._responses_to_revert <= 0:
+            self._async_revert_expected_mode()
 
     async def on_siren_changed(self, entity: Siren):  # noqa: D102
         _LOGGER.debug("Siren changed: %s", entity)
-        await self.async_update_ha_state(force_refresh=True)
+        self._attributes = None
+        self._writer.async_schedule(self)
 
-    async def on_area_changed(self, entity: Area):
+    async def on_area_changed(self, entity: Area):  # noqa: D102
         _LOGGER.debug("Area changed: %s", entity)
-        await self.async_update_ha_state(force_refresh=True)
+        if self._expected_mode is not None:
+            if entity.mode != self._expected_mode:
+                _LOGGER.warning(
+                    "The control panel changed to %s instead of %s",
+                    entity.mode,
+                    self._expected_mode,
+                )
+            # Either confirmed or superseded by the panel, which is the truth
+            self._async_clear_confirmation()
+        self._writer.async_schedule(self)
 
     async def on_zone_changed(
         self, id: Id, entity: Zone
     ):  # pylint: disable=redefined-builtin
         _LOGGER.debug("Zone[%d] changed: %s", id, entity)
-        await self.async_update_ha_state(force_refresh=True)
+        if self._bits.set_zone(id, entity):
+            self._attributes = None
+            self._writer.async_schedule(self)
 
     async def on_output_changed(
         self, id: Id, entity: Output
     ):  # pylint: disable=redefined-builtin
         _LOGGER.debug("Output[%d] changed: %s", id, entity)
-        await self.async_update_ha_state(force_refresh=True)
-
-    async def on_time_changed(self, entity: Time):  # pylint: disable=redefined-builtin
-        _LOGGER.debug("Time changed: %s", entity)
-        await self._sync_time()
-        await self.async_update_ha_state(force_refresh=True)
+        if self._bits.set_output(id, entity):
+            self._attributes = None
+            self._writer.async_schedule(self)
 
-    async def on_changed(  # pylint: disable=redefined-builtin
-        self, entity: ControlPanelEntity, id: Id | None = None
-    ):
-        await self.async_update_ha_state(force_refresh=True)
@@ -10,11 +10,23 @@ from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
-from homeassistant.const import STATE_UNKNOWN
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from . import BoschControlPanelDevice
-from .const import DATA_BOSCH, DOMAIN
+from .const import (
+    DATA_BOSCH,
+    DATA_SNAPSHOT,
+    DATA_STATE_WRITER,
+    DATA_ZONE_DISPATCHER,
+    DATA_ZONE_FILTERS,
+    DOMAIN,
+)
+from .dispatcher import ZoneDispatcher
+from .snapshot import PanelSnapshot
+from .state_writer import StateWriteScheduler
+from .zone_filter import ZoneFilter, ZoneFilters
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,9 +35,16 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
     """Set up entry."""
     _LOGGER.debug("Async Setup Entry Bosch Alarm Zone")
 
-    _alarm: CP = hass.data[DOMAIN][config_entry.entry_id][DATA_BOSCH]
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    _alarm: CP = data[DATA_BOSCH]
+    _writer: StateWriteScheduler = data[DATA_STATE_WRITER]
+    _dispatcher: ZoneDispatcher = data[DATA_ZONE_DISPATCHER]
+    _filters: ZoneFilters = data[DATA_ZONE_FILTERS]
+    _snapshot: PanelSnapshot = data[DATA_SNAPSHOT]
     async_add_entities(
-        BoschAlarmZone(_alarm, id, zone)
+        BoschAlarmZone(
+            config_entry, _alarm, _writer, _dispatcher, _filters, _snapshot, id, zone
+        )
         for id, zone in _alarm.control_panel.zones.items()
     )
 
@@ -45,31 +64,60 @@ class BoschAlarmZone(
 ):
     """Zone of bosch control panel."""
 
-    def __init__(self, alarm: CP, idd: Id, zone: Zone) -> None:
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        alarm: CP,
+        writer: StateWriteScheduler,
+        dispatcher: ZoneDispatcher,
+        filters: ZoneFilters,
+        snapshot: PanelSnapshot,
+        idd: Id,
+        zone: Zone,
+    ) -> None:
         """Initialize Bosh Alarm Zone object.
 
         Args:
+            entry (ConfigEntry): The config entry of the control panel
             alarm (CP): The bosch control panel object
+            writer (StateWriteScheduler): Scheduler of the state writes
+            dispatcher (ZoneDispatcher): Dispatcher of the zone events
+            filters (ZoneFilters): Filters of the zones, in front of the writes
+            snapshot (PanelSnapshot): Last known state of the control panel
             idd (Id): The number/id of this zone
             zone (Zone): Zone object
         """
+        super().__init__(entry)
         self._alarm: CP = alarm
+        self._writer: StateWriteScheduler = writer
+        self._dispatcher: ZoneDispatcher = dispatcher
+        self._filters: ZoneFilters = filters
+        self._filter: ZoneFilter | None = None
+        self._snapshot: PanelSnapshot = snapshot
         self._id: Id = idd
         self._zone: Zone = zone
-        self._is_on = False
-        self._state = STATE_UNKNOWN
         self._attr_device_class = BinarySensorDeviceClass.MOTION
 
     async def async_added_to_hass(self) -> None:
         """Initialize the zone when it is added to hass."""
         _LOGGER.info("Starting the Bosch Control Panel Zone %d", self._id)
-        self._alarm.add_listener(self)
-        await self.async_update_ha_state(force_refresh=True)
+        self._filter = self._filters.async_add(
+            self._id, self._zone.triggered, self._async_schedule_write
+        )
+        self._dispatcher.add_zone(self._id, self)
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, self._snapshot.signal_expired, self._async_schedule_write
+            )
+        )
         _LOGGER.info("Started the Bosch Control Panel Zone %d", self._id)
 
     async def async_will_remove_from_hass(self) -> None:
         """Cleanup the zone when it is about to be removed from hass."""
-        self._alarm.remove_listener(self)
+        self._dispatcher.remove_zone(self._id)
+        self._filters.async_remove(self._id)
+        self._filter = None
+        self._writer.async_cancel(self)
         _LOGGER.info("Stopping the Bosch Control Panel Zone %d", self._id)
         _LOGGER.info("Stopped the Bosch Control Panel Zone %d", self._id)
 
@@ -80,12 +128,14 @@ class BoschAlarmZone(
         Returns:
             bool: True of is triggered. False otherwise
         """
-        return self._zone.triggered
+        if self._filter is None:
+            return self._zone.triggered
+        return self._filter.state
 
     @property
     def unique_id(self):
         """Return a unique ID to use for this device."""
-        return f"bosch_zone_{self._id}"
+        return f"{self._entry.entry_id}_zone_{self._id}"
 
     @property
     def name(self):
@@ -95,15 +145,19 @@ class BoschAlarmZone(
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self._alarm.control_panel.availability.available
+        return self._snapshot.available
 
     async def on_zone_trigger_changed(
         self, id: Id, entity: Zone
     ):  # pylint: disable=redefined-builtin
-        if id == self._id:
-            _LOGGER.debug("Zone[%d] trigger changed: %s", id, entity)
-            await self.async_update_ha_state(force_refresh=True)
+        _LOGGER.debug("Zone[%d] trigger changed: %s", id, entity)
+        if self._filter is not None:
+            self._filter.async_update(entity.triggered)
+
+    @callback
+    def _async_schedule_write(self) -> None:
+        self._writer.async_schedule(self)
 
     async def on_availability_changed(self, entity: Availability):  # noqa: D102
         _LOGGER.debug("Availability changed: %s", entity)
-        await self.async_update_ha_state(force_refresh=True)
+        self._writer.async_schedule(self)
@@ -0,0 +1,188 @@
+"""Clock drift tracking of the bosch_control_panel_cc880 integration."""
+
+from collections import deque
+from datetime import datetime, time as dt_time
+import logging
+import statistics
+import time
+from typing import Any
+
+from bosch.control_panel.cc880p.models.cp import Availability, Time
+from bosch.control_panel.cc880p.models.listener import BaseControlPanelListener
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .command_queue import CommandQueue
+from .const import (
+    CLOCK_DRIFT_MIN_SPAN,
+    CLOCK_DRIFT_SAMPLES,
+    CLOCK_SYNC_HORIZON,
+    CLOCK_SYNC_THRESHOLD,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_DAY = 24 * 60 * 60
+_MINUTE = 60
+
+
+def _seconds_of_day(value: dt_time) -> float:
+    return (
+        value.hour * 3600 + value.minute * 60 + value.second + value.microsecond / 1e6
+    )
+
+
+def _clock_offset(panel: dt_time, host: dt_time) -> float:
+    """Offset (in seconds) of the panel clock, within -12h and +12h.
+
+    The difference is taken modulo one day, so that the clocks on each side
+    of midnight are still seen as close.
+    """
+    offset = (_seconds_of_day(panel) - _seconds_of_day(host)) % _DAY
+    return offset - _DAY if offset >= _DAY / 2 else offset
+
+
+class ClockDriftTracker(BaseControlPanelListener):
+    """Track the drift of the panel clock, setting it only when needed.
+
+    The panel only reports hours and minutes, so its clock is sampled when
+    the reported minute ticks: the panel clock is then at the start of that
+    minute, within a polling period. The samples taken against the host
+    clock give the current offset, and their least-squares fit against the
+    host monotonic time gives the drift rate. Instead of checking the clock
+    on every change, the time is set once the offset is beyond
+    CLOCK_SYNC_THRESHOLD, or scheduled for when the drift is predicted to
+    get there.
+    """
+
+    def __init__(self, hass: HomeAssistant, command_queue: CommandQueue) -> None:
+        """Initialize the clock drift tracker.
+
+        Args:
+            hass (HomeAssistant): Homeassistant object
+            command_queue (CommandQueue): Queue used to set the panel time
+        """
+        self._hass = hass
+        self._command_queue = command_queue
+        # (host monotonic time, offset) of the samples taken at minute ticks
+        self._samples: deque[tuple[float, float]] = deque(maxlen=CLOCK_DRIFT_SAMPLES)
+        self._last_minute: int | None = None
+        self._available: bool = False
+        self._cancel_sync: CALLBACK_TYPE | None = None
+        self._next_sync: float | None = None
+        self.offset: float | None = None
+        self.syncs: int = 0
+
+    @property
+    def drift_rate(self) -> float | None:
+        """Drift of the panel clock (in seconds per day), None if unknown."""
+        if len(self._samples) < 3:
+            return None
+        times, offsets = zip(*self._samples)
+        if times[-1] - times[0] < CLOCK_DRIFT_MIN_SPAN:
+            return None
+        slope, _ = statistics.linear_regression(times, offsets)
+        return slope * _DAY
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the scheduled synchronization."""
+        self._async_cancel_sync()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the clock drift."""
+        return {
+            "offset": self.offset,
+            "drift_rate": self.drift_rate,
+            "samples": len(self._samples),
+            "syncs": self.syncs,
+            "next_sync": None
+            if self._next_sync is None
+            else round(self._next_sync - time.monotonic(), 1),
+        }
+
+    def _sample(self, panel: dt_time) -> None:
+        now = time.monotonic()
+        # Same clock as the one used to set the panel time
+        host = datetime.now().time()
+        minute = panel.hour * 60 + panel.minute
+        ticked = self._last_minute is not None and minute == (
+            self._last_minute + 1
+        ) % (_DAY // _MINUTE)
+        self._last_minute = minute
+
+        if ticked:
+            # The panel clock just entered this minute
+            self.offset = _clock_offset(panel, host)
+            self._samples.append((now, self.offset))
+        else:
+            # First reading or clock set: only known within a minute
+            self._samples.clear()
+            self.offset = _clock_offset(panel, host) + _MINUTE / 2
+
+    def _schedule_sync(self) -> None:
+        self._async_cancel_sync()
+        if self.offset is None or not self._available:
+            return
+
+        if abs(self.offset) >= CLOCK_SYNC_THRESHOLD:
+            delay = 0.0
+        elif (rate := self.drift_rate) and (rate > 0) == (self.offset > 0):
+            # Time for the offset to get beyond the threshold at this rate
+            remaining = CLOCK_SYNC_THRESHOLD - abs(self.offset)
+            delay = remaining / abs(rate) * _DAY
+            if delay > CLOCK_SYNC_HORIZON:
+                return
+        else:
+            return
+
+        _LOGGER.debug(
+            "Panel clock offset %.0fs, drift %s s/day. Setting the time in %.0fs",
+            self.offset,
+            self.drift_rate,
+            delay,
+        )
+        self._next_sync = time.monotonic() + delay
+        self._cancel_sync = async_call_later(self._hass, delay, self._async_sync)
+
+    @callback
+    def _async_cancel_sync(self) -> None:
+        if self._cancel_sync:
+            self._cancel_sync()
+            self._cancel_sync = None
+        self._next_sync = None
+
+    @callback
+    def _async_sync(self, _now: datetime) -> None:
+        self._cancel_sync = None
+        self._next_sync = None
+        self._hass.async_create_background_task(
+            self._set_time(), f"{DOMAIN} set time"
+        )
+
+    async def _set_time(self):
+        _LOGGER.warning(
+            "Setting the time of the control panel (offset %.0fs)", self.offset
+        )
+        try:
+            await self._command_queue.async_set_time()
+            self.syncs += 1
+        except Exception:  # pylint: disable=broad-exception-caught
+            _LOGGER.exception("Time synchronization failed")
+        else:
+            # The offset changed, possibly within the same minute
+            self._samples.clear()
+            self._last_minute = None
+
+    async def on_availability_changed(self, entity: Availability):  # noqa: D102
+        # The ticks are only meaningful between consecutive readings
+        self._last_minute = None
+        # The first reading of the clock comes before the panel is available
+        self._available = entity.available
+        self._schedule_sync()
+
+    async def on_time_changed(self, entity: Time):  # noqa: D102
+        self._sample(entity.time)
+        self._schedule_sync()
@@ -0,0 +1,312 @@
+"""Queue of the commands sent to the bosch control panel."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from enum import IntEnum
+import heapq
+import logging
+import time
+from typing import Any
+
+from bosch.control_panel.cc880p.cp import CP
+from bosch.control_panel.cc880p.models.cp import Id
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .metrics import PanelMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CommandPriority(IntEnum):
+    """Priority of the commands. Lower values are executed first."""
+
+    ALARM = 0
+    OUTPUT = 1
+    MAINTENANCE = 2
+
+
+@dataclass
+class Command:
+    """Command waiting to be sent to the control panel."""
+
+    name: str
+    func: Callable[..., Awaitable[Any]]
+    # Kept out of the repr, the keys sent hold the code of the keypad
+    args: tuple = field(repr=False)
+    key: Hashable | None
+    enqueued: float
+    futures: list[asyncio.Future] = field(default_factory=list)
+
+
+@dataclass
+class CommandTiming:
+    """Latencies of an executed command (in seconds)."""
+
+    queue_wait: float
+    execution: float
+
+
+@dataclass
+class CommandStats:
+    """Latency statistics of a type of command (in seconds)."""
+
+    count: int = 0
+    coalesced: int = 0
+    failed: int = 0
+    queue_wait_last: float = 0.0
+    queue_wait_max: float = 0.0
+    queue_wait_total: float = 0.0
+    execution_last: float = 0.0
+    execution_max: float = 0.0
+    execution_total: float = 0.0
+
+    def record(self, queue_wait: float, execution: float) -> None:
+        """Record the latencies of an executed command."""
+        self.count += 1
+        self.queue_wait_last = queue_wait
+        self.queue_wait_max = max(self.queue_wait_max, queue_wait)
+        self.queue_wait_total += queue_wait
+        self.execution_last = execution
+        self.execution_max = max(self.execution_max, execution)
+        self.execution_total += execution
+
+
+class CommandQueue:
+    """Serialize the commands sent to the control panel.
+
+    Commands are executed one at a time, by priority and then by order of
+    arrival. Arming, disarming and siren commands are executed before the
+    output commands, and a pending output command is replaced by any newer
+    command to the same output.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, alarm: CP, metrics: PanelMetrics
+    ) -> None:
+        """Initialize the command queue.
+
+        Args:
+            hass (HomeAssistant): Homeassistant object
+            alarm (CP): Object representation of the control panel
+            metrics (PanelMetrics): Metrics where the commands are recorded
+        """
+        self._hass = hass
+        self._alarm = alarm
+        self._metrics = metrics
+        self._heap: list[tuple[int, int, Command]] = []
+        self._pending: dict[Hashable, Command] = {}
+        self._seq: int = 0
+        self._event = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.stats: dict[str, CommandStats] = {}
+
+    @callback
+    def async_start(self) -> None:
+        """Start executing the queued commands."""
+        if not self._task:
+            self._task = self._hass.async_create_background_task(
+                self._worker(), f"{DOMAIN} command queue"
+            )
+
+    async def async_stop(self) -> None:
+        """Stop executing commands, cancelling the pending ones."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+        for _, _, command in self._heap:
+            for future in command.futures:
+                future.cancel()
+        self._heap.clear()
+        self._pending.clear()
+
+    async def async_send_keys(self, keys: str) -> Any:
+        """Queue the keys to send to the control panel (arm/disarm)."""
+        return await self.async_submit(
+            "send_keys", CommandPriority.ALARM, self._alarm.send_keys, keys
+        )
+
+    async def async_set_siren(self, on: bool) -> Any:
+        """Queue setting the siren on/off."""
+        return await self.async_submit(
+            "set_siren", CommandPriority.ALARM, self._alarm.set_siren, on
+        )
+
+    async def async_set_arming(self, idd: Id, arm: bool) -> Any:
+        """Queue arming (away)/disarming an area.
+
+        A pending command to the same area is replaced by this one.
+        """
+        return await self.async_submit(
+            "set_arming",
+            CommandPriority.ALARM,
+            self._alarm.set_arming,
+            idd,
+            arm,
+            key=("area", idd),
+        )
+
+    async def async_set_output(self, idd: Id, on: bool) -> Any:
+        """Queue setting an output on/off.
+
+        A pending command to the same output is replaced by this one.
+        """
+        return await self.async_submit(
+            "set_output",
+            CommandPriority.OUTPUT,
+            self._alarm.set_output,
+            idd,
+            on,
+            key=("output", idd),
+        )
+
+    async def async_set_outputs(
+        self, targets: dict[Id, bool]
+    ) -> dict[Id, CommandTiming | Exception | None]:
+        """Queue setting several outputs on/off at once.
+
+        Outputs already in the target state (and without any pending command)
+        are skipped, never reaching the control panel. The others are queued
+        together, being executed back to back.
+
+        Args:
+            targets (dict[Id, bool]): The target state of each output
+
+        Returns:
+            dict[Id, CommandTiming | Exception | None]: The timing of the
+                command of each output, the exception if it failed or None if
+                skipped
+        """
+        outputs = self._alarm.control_panel.outputs
+        changes = {
+            idd: on
+            for idd, on in targets.items()
+            if ("output", idd) in self._pending or outputs[idd].on != on
+        }
+        results = await asyncio.gather(
+            *(
+                self._async_enqueue(
+                    "set_output",
+                    CommandPriority.OUTPUT,
+                    self._alarm.set_output,
+                    idd,
+                    on,
+                    key=("output", idd),
+                )
+                for idd, on in changes.items()
+            ),
+            return_exceptions=True,
+        )
+
+        timings: dict[Id, CommandTiming | Exception | None] = dict.fromkeys(targets)
+        for idd, result in zip(changes, results):
+            timings[idd] = result if isinstance(result, Exception) else result[1]
+        return timings
+
+    async def async_set_time(self) -> Any:
+        """Queue setting the control panel time to the current time."""
+        return await self.async_submit(
+            "set_time", CommandPriority.MAINTENANCE, self._alarm.set_time
+        )
+
+    async def async_submit(
+        self,
+        name: str,
+        priority: CommandPriority,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        key: Hashable | None = None,
+    ) -> Any:
+        """Queue a command and wait for its result.
+
+        Args:
+            name (str): The name of the command, used for its statistics
+            priority (CommandPriority): The priority of the command
+            func (Callable[..., Awaitable[Any]]): The CP method to call
+            *args (Any): The arguments of the command
+            key (Hashable, optional): Commands with the same key are coalesced,
+                executing only the last one. Defaults to None (no coalescing).
+
+        Returns:
+            Any: The result of the command
+        """
+        result, _ = await self._async_enqueue(name, priority, func, *args, key=key)
+        return result
+
+    async def _async_enqueue(
+        self,
+        name: str,
+        priority: CommandPriority,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        key: Hashable | None = None,
+    ) -> tuple[Any, CommandTiming]:
+        future = self._hass.loop.create_future()
+
+        if key is not None and (command := self._pending.get(key)):
+            # Replace the arguments of the pending command by the newest ones
+            command.args = args
+            command.futures.append(future)
+            self.stats.setdefault(name, CommandStats()).coalesced += 1
+        else:
+            command = Command(
+                name=name,
+                func=func,
+                args=args,
+                key=key,
+                enqueued=time.monotonic(),
+                futures=[future],
+            )
+            if key is not None:
+                self._pending[key] = command
+            self._seq += 1
+            heapq.heappush(self._heap, (priority, self._seq, command))
+            self._event.set()
+
+        return await future
+
+    async def _worker(self):
+        while True:
+            await self._event.wait()
+            while self._heap:
+                _, _, command = heapq.heappop(self._heap)
+                if command.key is not None:
+                    self._pending.pop(command.key, None)
+                await self._execute(command)
+            self._event.clear()
+
+    async def _execute(self, command: Command):
+        stats = self.stats.setdefault(command.name, CommandStats())
+        started = time.monotonic()
+        try:
+            result = await command.func(*command.args)
+        except asyncio.CancelledError:
+            for future in command.futures:
+                future.cancel()
+            raise
+        except Exception as ex:  # pylint: disable=broad-except
+            stats.failed += 1
+            for future in command.futures:
+                if not future.done():
+                    future.set_exception(ex)
+        else:
+            timing = CommandTiming(
+                queue_wait=started - command.enqueued,
+                execution=time.monotonic() - started,
+            )
+            for future in command.futures:
+                if not future.done():
+                    future.set_result((result, timing))
+        finally:
+            finished = time.monotonic()
+            stats.record(started - command.enqueued, finished - started)
+            self._metrics.command.record(finished - started)
+            _LOGGER.debug(
+                "Command %s waited %.3fs and took %.3fs",
+                command.name,
+                started - command.enqueued,
+                finished - started,
+            )
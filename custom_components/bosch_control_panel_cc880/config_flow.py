@@ -1,15 +1,22 @@
 """Config flow for bosch_control_panel_cc880 integration."""
+import asyncio
 from ipaddress import ip_address
 import logging
+import time
 from typing import Any
 
 from bosch.control_panel.cc880p.cp import CP
 from bosch.control_panel.cc880p.models.cp import CpVersion
 import voluptuous as vol
 
-from homeassistant.config_entries import CONN_CLASS_LOCAL_POLL, ConfigFlow
+from homeassistant.config_entries import (
+    CONN_CLASS_LOCAL_POLL,
+    ConfigEntry,
+    ConfigFlow,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_BASE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.selector import (
     SelectSelector,
@@ -20,16 +27,33 @@ from homeassistant.helpers.selector import (
 from .config_validation import SchemaType, SchemaTypes
 from .const import (  # pylint:disable=unused-import
     CONF_CODE_REGEX,
+    CONF_DEFAULT_FAST_POLLING_PERIOD,
+    CONF_DEFAULT_IDLE_POLLING_PERIOD,
+    CONF_DEFAULT_OPTIMISTIC_TIMEOUT,
     CONF_DEFAULT_POLLING_PERIOD,
     CONF_DEFAULT_PORT,
+    CONF_DEFAULT_STATE_WRITE_DELAY,
+    CONF_DEFAULT_ZONE_FLAP_THRESHOLD,
+    CONF_DEFAULT_ZONE_MIN_ON_TIME,
+    CONF_DEFAULT_ZONE_OFF_DELAY,
+    CONF_FAST_POLLING_PERIOD,
     CONF_HOST,
+    CONF_IDLE_POLLING_PERIOD,
     CONF_INSTALLER_CODE,
     CONF_MODEL,
+    CONF_OPTIMISTIC_TIMEOUT,
     CONF_POLLING_PERIOD,
     CONF_PORT,
+    CONF_STATE_WRITE_DELAY,
+    CONF_ZONE_FLAP_THRESHOLD,
+    CONF_ZONE_MIN_ON_TIME,
+    CONF_ZONE_OFF_DELAY,
+    CP_WATCHDOG_PERIOD,
     DOMAIN,
     TITLE,
 )
+from .discovery import DiscoveryResult, async_get_local_networks, async_scan
+from .handoff import async_get_handoff
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,6 +80,27 @@ SCHEMA_TYPES = SchemaTypes(
         CONF_POLLING_PERIOD: SchemaType(
             int, vol.All(cv.positive_int, msg="invalid_polling_period")
         ),
+        CONF_FAST_POLLING_PERIOD: SchemaType(
+            int, vol.All(cv.positive_int, msg="invalid_polling_period")
+        ),
+        CONF_IDLE_POLLING_PERIOD: SchemaType(
+            int, vol.All(cv.positive_int, msg="invalid_polling_period")
+        ),
+        CONF_STATE_WRITE_DELAY: SchemaType(
+            int, vol.All(cv.positive_int, msg="invalid_state_write_delay")
+        ),
+        CONF_OPTIMISTIC_TIMEOUT: SchemaType(
+            int, vol.All(cv.positive_int, msg="invalid_optimistic_timeout")
+        ),
+        CONF_ZONE_MIN_ON_TIME: SchemaType(
+            int, vol.All(cv.positive_int, msg="invalid_zone_filter")
+        ),
+        CONF_ZONE_OFF_DELAY: SchemaType(
+            int, vol.All(cv.positive_int, msg="invalid_zone_filter")
+        ),
+        CONF_ZONE_FLAP_THRESHOLD: SchemaType(
+            int, vol.All(cv.positive_int, msg="invalid_zone_filter")
+        ),
     }
 )
 
@@ -118,6 +163,86 @@ def _presentation_schema(data: dict[str, Any] = None):
     return _schema(data, False)
 
 
+def _options_schema(
+    entry: ConfigEntry, data: dict[str, Any] = None, validation=False
+):
+    """Get the schema of the options.
+
+    The defaults are taken from the previous inputs if any, then from the
+    current options of the entry and then from the entry data.
+    """
+    current = {**entry.data, **entry.options, **(data or {})}
+    schemas = SCHEMA_TYPES.get_schemas(validation)
+
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_POLLING_PERIOD,
+                default=current.get(CONF_POLLING_PERIOD, CONF_DEFAULT_POLLING_PERIOD),
+            ): schemas[CONF_POLLING_PERIOD],
+            vol.Required(
+                CONF_FAST_POLLING_PERIOD,
+                default=current.get(
+                    CONF_FAST_POLLING_PERIOD, CONF_DEFAULT_FAST_POLLING_PERIOD
+                ),
+            ): schemas[CONF_FAST_POLLING_PERIOD],
+            vol.Required(
+                CONF_IDLE_POLLING_PERIOD,
+                default=current.get(
+                    CONF_IDLE_POLLING_PERIOD, CONF_DEFAULT_IDLE_POLLING_PERIOD
+                ),
+            ): schemas[CONF_IDLE_POLLING_PERIOD],
+            vol.Required(
+                CONF_STATE_WRITE_DELAY,
+                default=current.get(
+                    CONF_STATE_WRITE_DELAY, CONF_DEFAULT_STATE_WRITE_DELAY
+                ),
+            ): schemas[CONF_STATE_WRITE_DELAY],
+            vol.Required(
+                CONF_OPTIMISTIC_TIMEOUT,
+                default=current.get(
+                    CONF_OPTIMISTIC_TIMEOUT, CONF_DEFAULT_OPTIMISTIC_TIMEOUT
+                ),
+            ): schemas[CONF_OPTIMISTIC_TIMEOUT],
+            vol.Required(
+                CONF_ZONE_MIN_ON_TIME,
+                default=current.get(
+                    CONF_ZONE_MIN_ON_TIME, CONF_DEFAULT_ZONE_MIN_ON_TIME
+                ),
+            ): schemas[CONF_ZONE_MIN_ON_TIME],
+            vol.Required(
+                CONF_ZONE_OFF_DELAY,
+                default=current.get(CONF_ZONE_OFF_DELAY, CONF_DEFAULT_ZONE_OFF_DELAY),
+            ): schemas[CONF_ZONE_OFF_DELAY],
+            vol.Required(
+                CONF_ZONE_FLAP_THRESHOLD,
+                default=current.get(
+                    CONF_ZONE_FLAP_THRESHOLD, CONF_DEFAULT_ZONE_FLAP_THRESHOLD
+                ),
+            ): schemas[CONF_ZONE_FLAP_THRESHOLD],
+        }
+    )
+
+
+def _validate_options(entry: ConfigEntry, data: dict[str, Any]) -> dict[str, Any]:
+    """Validate the options.
+
+    Args:
+        entry (ConfigEntry): The config entry being configured
+        data : The options to validate
+    """
+    errors = {}
+    try:
+        _options_schema(entry, validation=True)(data)
+    except vol.MultipleInvalid as exc:
+        for error in exc.errors:
+            errors[error.path[0]] = error.msg
+    except:  # pylint: disable=bare-except
+        errors[CONF_BASE] = "unknown"
+
+    return errors
+
+
 async def _validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the inputs.
 
@@ -143,16 +268,21 @@ async def _validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str
         port=data[CONF_PORT],
         model=CpVersion[data[CONF_MODEL]].value,
         installer_code=data[CONF_INSTALLER_CODE],
-        poll_period=data[CONF_POLLING_PERIOD] / 1000,
+        poll_period=CP_WATCHDOG_PERIOD,
         loop=hass.loop,
     )
+    start = time.monotonic()
     try:
         await cp.start()
         assert cp.control_panel.availability.available
     except Exception:  # pylint: disable=broad-exception-caught
         errors[CONF_BASE] = "cannot_connect"
-    finally:
+
+    if errors:
         await cp.stop()
+    else:
+        # Keep the connection open, to be reused by the entry setup
+        async_get_handoff(hass).async_offer(data, cp, time.monotonic() - start)
 
     return errors
 
@@ -160,22 +290,150 @@ async def _validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str
 class ControlPanelConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for bosch_control_panel_cc880."""
 
-    VERSION = 1
+    VERSION = 2
     CONNECTION_CLASS = CONN_CLASS_LOCAL_POLL
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return ControlPanelOptionsFlow(config_entry)
+
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._scan_task: asyncio.Task[DiscoveryResult] | None = None
+        self._scan_result: DiscoveryResult | None = None
+        self._discovered: list[str] = []
+
     async def async_step_user(self, user_input=None):
-        """Handle the initial step."""
+        """Handle the initial step, choosing how to find the control panel."""
 
         _LOGGER.info("Async Step User")
+        return self.async_show_menu(
+            step_id="user", menu_options=["discovery", "manual"]
+        )
+
+    async def async_step_discovery(self, user_input=None):
+        """Scan the local network for control panels."""
+
+        _LOGGER.info("Async Step Discovery")
+
+        if not self._scan_task:
+            self._scan_task = self.hass.async_create_task(
+                self._async_scan(), f"{DOMAIN} discovery"
+            )
+        if not self._scan_task.done():
+            return self.async_show_progress(
+                step_id="discovery",
+                progress_action="scan",
+                progress_task=self._scan_task,
+            )
+
+        self._scan_result = self._scan_task.result()
+        configured = self._async_current_ids()
+        self._discovered = [
+            host
+            for host in self._scan_result.hosts
+            if f"{host}:{CONF_DEFAULT_PORT}" not in configured
+        ]
+        return self.async_show_progress_done(
+            next_step_id="pick" if self._discovered else "no_panels_found"
+        )
+
+    async def _async_scan(self) -> DiscoveryResult:
+        return await async_scan(await async_get_local_networks(self.hass))
+
+    async def async_step_no_panels_found(self, user_input=None):
+        """Abort the flow, no control panels were found."""
+        return self.async_abort(reason="no_panels_found")
+
+    async def async_step_pick(self, user_input=None):
+        """Pick one of the discovered control panels.
+
+        The installer code is only sent to the picked host, when validating
+        its connection.
+        """
+
+        _LOGGER.info("Async Step Pick")
+
+        if user_input is not None:
+            # Continue with the connection setup of the picked control panel
+            return self.async_show_form(
+                step_id="manual",
+                data_schema=_presentation_schema(
+                    {CONF_HOST: user_input[CONF_HOST], CONF_PORT: CONF_DEFAULT_PORT}
+                ),
+            )
+
+        return self.async_show_form(
+            step_id="pick",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOST): SelectSelector(
+                        SelectSelectorConfig(
+                            options=self._discovered,
+                            mode=SelectSelectorMode.LIST,
+                        )
+                    )
+                }
+            ),
+            description_placeholders={
+                "found": str(len(self._discovered)),
+                "scanned": str(self._scan_result.scanned),
+                "duration": f"{self._scan_result.duration:.1f}",
+            },
+        )
+
+    async def async_step_manual(self, user_input=None):
+        """Handle the connection setup of the control panel."""
+
+        _LOGGER.info("Async Step Manual")
         errors = {}
 
         if user_input is not None:
+            # A control panel is identified by its address
+            await self.async_set_unique_id(
+                f"{user_input[CONF_HOST]}:{user_input[CONF_PORT]}"
+            )
+            self._abort_if_unique_id_configured()
+
             errors = await _validate_input(self.hass, user_input)
             if not errors:
-                return self.async_create_entry(title=TITLE, data=user_input)
+                return self.async_create_entry(
+                    title=f"{TITLE} {user_input[CONF_HOST]}", data=user_input
+                )
 
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
             data_schema=_presentation_schema(user_input),
             errors=errors,
         )
+
+
+class ControlPanelOptionsFlow(OptionsFlow):
+    """Handle the options of bosch_control_panel_cc880.
+
+    The options are applied to the running control panel, without
+    reconnecting to it.
+    """
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(self, user_input=None):
+        """Handle the options step."""
+
+        _LOGGER.info("Async Step Options")
+        errors = {}
+
+        if user_input is not None:
+            errors = _validate_options(self.config_entry, user_input)
+            if not errors:
+                return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=_options_schema(self.config_entry, user_input),
+            errors=errors,
+        )
@@ -0,0 +1,134 @@
+"""Deferred connection to the bosch control panel."""
+
+import asyncio
+from collections.abc import Callable
+import contextlib
+import logging
+import time
+
+from bosch.control_panel.cc880p.cp import CP
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    CONNECT_RETRY_MAX,
+    CONNECT_RETRY_MIN,
+    CONNECT_STOP_TIMEOUT,
+    CONNECT_TIMEOUT,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DeferredConnector:
+    """Connect to the control panel in the background.
+
+    The entry is set up without waiting for the control panel, whose entities
+    stay unavailable until the connection is established. As with
+    ConfigEntryNotReady, a failed attempt is retried with an exponential
+    backoff. Once connected, the reconnections are handled by the CP itself.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        alarm: CP,
+        timeout: float = CONNECT_TIMEOUT,
+        on_attempt_failed: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize the deferred connector.
+
+        Args:
+            hass (HomeAssistant): Homeassistant object
+            alarm (CP): Object representation of the control panel
+            timeout (float, optional): Time (in seconds) allowed for each
+                connection attempt. Defaults to CONNECT_TIMEOUT.
+            on_attempt_failed (Callable[[], None], optional): Called after
+                each failed attempt. Defaults to None.
+        """
+        self._hass = hass
+        self._alarm = alarm
+        self._timeout = timeout
+        self._on_attempt_failed = on_attempt_failed
+        self._task: asyncio.Task | None = None
+        self._stopping: bool = False
+        self._started: float = time.monotonic()
+        self._attempts: int = 0
+        self._time_to_connect: float | None = None
+
+    @property
+    def attempts(self) -> int:
+        """Number of connection attempts done."""
+        return self._attempts
+
+    @property
+    def time_to_connect(self) -> float | None:
+        """Time (in seconds) it took to connect, or None if not connected yet."""
+        return self._time_to_connect
+
+    @callback
+    def async_start(self) -> None:
+        """Start connecting to the control panel."""
+        self._started = time.monotonic()
+        if self._alarm.connected:
+            self._time_to_connect = 0.0
+        elif not self._task:
+            self._task = self._hass.async_create_background_task(
+                self._connect(), f"{DOMAIN} connect"
+            )
+
+    async def async_stop(self) -> None:
+        """Stop connecting to the control panel.
+
+        The attempt in progress is waited for, as it stops the reconnection
+        task the CP creates when its start is interrupted.
+        """
+        task, self._task = self._task, None
+        if task:
+            self._stopping = True
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, asyncio.TimeoutError):
+                await asyncio.wait_for(task, CONNECT_STOP_TIMEOUT)
+
+    async def _connect(self):
+        delay = CONNECT_RETRY_MIN
+        while True:
+            self._attempts += 1
+            # The start is awaited in this task, not in the task of wait_for,
+            # so that the CP is stopped below before its reconnection task
+            # runs. The CP swallows the cancellations of its start, the ones
+            # of the timeout and the ones of async_stop alike
+            timeout = asyncio.timeout(self._timeout)
+            with contextlib.suppress(asyncio.TimeoutError):
+                async with timeout:
+                    await self._alarm.start()
+            if timeout.expired():
+                _LOGGER.warning(
+                    "Connection attempt timed out after %ss", self._timeout
+                )
+
+            if self._alarm.connected:
+                break
+
+            # Stop the reconnection task created by the CP on every start
+            await self._alarm.stop()
+            if self._stopping:
+                return
+            if self._on_attempt_failed:
+                self._on_attempt_failed()
+            _LOGGER.warning(
+                "Control panel not ready yet (attempt %d). Retrying in %ss",
+                self._attempts,
+                delay,
+            )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, CONNECT_RETRY_MAX)
+
+        self._time_to_connect = time.monotonic() - self._started
+        self._task = None
+        _LOGGER.info(
+            "Connected to the control panel in %.2fs (%d attempt(s))",
+            self._time_to_connect,
+            self._attempts,
+        )
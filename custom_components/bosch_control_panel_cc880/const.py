@@ -6,14 +6,37 @@ from homeassistant.const import Platform
 
 DOMAIN: Final = "bosch_control_panel_cc880"
 
-PLATFORMS: Final = [Platform.ALARM_CONTROL_PANEL, Platform.BINARY_SENSOR]
+PLATFORMS: Final = [
+    Platform.ALARM_CONTROL_PANEL,
+    Platform.BINARY_SENSOR,
+    Platform.SENSOR,
+]
 
 DATA_BOSCH: Final = "bosch"
+DATA_STATE_WRITER: Final = "state_writer"
+DATA_ZONE_DISPATCHER: Final = "zone_dispatcher"
+DATA_AREA_DISPATCHER: Final = "area_dispatcher"
+DATA_POLL_SCHEDULER: Final = "poll_scheduler"
+DATA_HANDOFF: Final = "handoff"
+DATA_COMMAND_QUEUE: Final = "command_queue"
+DATA_CONNECTOR: Final = "connector"
+DATA_METRICS: Final = "metrics"
+DATA_POLLER: Final = "poller"
+DATA_ZONE_HISTORY: Final = "zone_history"
+DATA_ZONE_FILTERS: Final = "zone_filters"
+DATA_CLOCK_DRIFT: Final = "clock_drift"
+DATA_SNAPSHOT: Final = "snapshot"
 
 DATA_OPTIONS_UPDATE_UNSUBSCRIBER: Final = "options_update_unsubscriber"
 
 TITLE: Final = "Bosch Alarm"
-DEVICE_ID: Final = "bosch_control_panel"
+# Area whose entity also holds the attributes of the whole control panel
+PRIMARY_AREA: Final = 1
+
+# Device identifier used before supporting multiple control panels
+LEGACY_DEVICE_ID: Final = "bosch_control_panel"
+# Prefix of the entity unique ids used before supporting multiple panels
+LEGACY_UNIQUE_ID_PREFIX: Final = "bosch_"
 MANUFACTURER: Final = "Bosch"
 MODEL: Final = "cc880p"
 SW_VERSION: Final = "v1.16"
@@ -25,14 +48,118 @@ CONF_PORT: Final = "port"
 CONF_MODEL: Final = "model"
 CONF_INSTALLER_CODE: Final = "installer_code"
 CONF_POLLING_PERIOD: Final = "polling_period"
+CONF_FAST_POLLING_PERIOD: Final = "fast_polling_period"
+CONF_IDLE_POLLING_PERIOD: Final = "idle_polling_period"
+CONF_STATE_WRITE_DELAY: Final = "state_write_delay"
+CONF_OPTIMISTIC_TIMEOUT: Final = "optimistic_timeout"
+CONF_ZONE_MIN_ON_TIME: Final = "zone_min_on_time"
+CONF_ZONE_OFF_DELAY: Final = "zone_off_delay"
+CONF_ZONE_FLAP_THRESHOLD: Final = "zone_flap_threshold"
 
 # Only digits between 4 and 7 characters
 CONF_DEFAULT_PORT: Final = 8899
 # Pooling period in milliseconds
 CONF_DEFAULT_POLLING_PERIOD = 1000
+# Pooling period while arming/disarming or with the siren on, in milliseconds
+CONF_DEFAULT_FAST_POLLING_PERIOD: Final = 250
+# Pooling period while disarmed and without zone activity, in milliseconds
+CONF_DEFAULT_IDLE_POLLING_PERIOD: Final = 5000
+# Time window to coalesce the state writes of the entities, in milliseconds
+CONF_DEFAULT_STATE_WRITE_DELAY: Final = 50
+# Time for the panel to report an arming/disarming, in seconds
+CONF_DEFAULT_OPTIMISTIC_TIMEOUT: Final = 5
+# Time a zone must stay triggered before being reported on, in milliseconds
+CONF_DEFAULT_ZONE_MIN_ON_TIME: Final = 0
+# Time a zone must stay untriggered before being reported off, in milliseconds
+CONF_DEFAULT_ZONE_OFF_DELAY: Final = 0
+# Triggers within ZONE_FLAP_WINDOW for a zone to be held on. 0 disables it
+CONF_DEFAULT_ZONE_FLAP_THRESHOLD: Final = 0
 CONF_CODE_REGEX: Final = r"^\d{4,7}$"
 
 CONF_STEP_CONNECTION = "conn"
 
+# Time (in seconds) a connection validated by the config flow is kept open
+CONNECTION_HANDOFF_TTL: Final = 60
+
+# Time (in seconds) a zone trigger keeps the polling out of the idle mode
+ZONE_ACTIVITY_WINDOW: Final = 60
+# Time window (in seconds) used to measure the achieved poll rate
+POLL_RATE_WINDOW: Final = 60
+# Polls due within this time (in seconds) are started in the same wake-up
+POLL_COALESCE_WINDOW: Final = 0.02
+# Minimum period (in seconds) of the keep-alive/reconnection loop of each CP
+CP_WATCHDOG_PERIOD: Final = 10
+# Responses after the optimistic timeout for an unconfirmed mode to be
+# reverted. The first one is received before the area state it carries
+CONFIRMATION_RESPONSES: Final = 2
+
+# Time window (in seconds) used to measure the rate of panel events
+EVENT_RATE_WINDOW: Final = 60
+# Upper bounds (in seconds) of the latency histogram buckets
+LATENCY_BUCKETS: Final = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Version of the stored panel snapshot and delay (in seconds) to save it
+SNAPSHOT_STORAGE_VERSION: Final = 1
+SNAPSHOT_SAVE_DELAY: Final = 10
+
+# Time (in seconds) allowed for each connection attempt on startup
+CONNECT_TIMEOUT: Final = 10
+# Minimum and maximum time (in seconds) between the connection attempts
+CONNECT_RETRY_MIN: Final = 1
+CONNECT_RETRY_MAX: Final = 60
+# Time (in seconds) allowed for the connection attempt to stop
+CONNECT_STOP_TIMEOUT: Final = 5
+
+# Maximum number of hosts probed at the same time by the discovery
+DISCOVERY_CONCURRENCY: Final = 64
+# Time (in seconds) allowed for each host to connect to the discovery probe
+DISCOVERY_TIMEOUT: Final = 1.0
+# Time (in seconds) each host has to stay silent, as the control panels do,
+# once connected to the discovery probe
+DISCOVERY_LISTEN_TIMEOUT: Final = 0.5
+# Smallest prefix of a scanned network. Larger networks are narrowed to the
+# network of this prefix around the address of the host
+DISCOVERY_MIN_PREFIX: Final = 22
+
+# Time window (in seconds) of the zone flap suppression
+ZONE_FLAP_WINDOW: Final = 60
+# Offset (in seconds) of the panel clock from which its time is set
+CLOCK_SYNC_THRESHOLD: Final = 120
+# Clock samples (one per minute) used to estimate the drift rate of the panel
+CLOCK_DRIFT_SAMPLES: Final = 1440
+# Minimum time span (in seconds) of the samples to estimate the drift rate
+CLOCK_DRIFT_MIN_SPAN: Final = 3600
+# Time (in seconds) within which a predicted synchronization is scheduled
+CLOCK_SYNC_HORIZON: Final = 24 * 60 * 60
+
+# Maximum number of zone triggers kept in the history of each control panel
+ZONE_HISTORY_CAPACITY: Final = 4096
+# Time window (in seconds) of the zone trigger count sensors
+ZONE_TRIGGERS_WINDOW: Final = 3600
+
 SERVICE_SIREN: Final = "siren"
 SERVICE_OUTPUT: Final = "output"
+SERVICE_OUTPUTS: Final = "outputs"
+SERVICE_ZONE_HISTORY: Final = "zone_history"
+
+ATTR_ON: Final = "on"
+ATTR_OFF: Final = "off"
+ATTR_MASK: Final = "mask"
+ATTR_VALUE: Final = "value"
+ATTR_START: Final = "start"
+ATTR_END: Final = "end"
+ATTR_ZONES: Final = "zones"
@@ -0,0 +1,85 @@
+"""Diagnostics support for the bosch_control_panel_cc880 integration."""
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .clock_drift import ClockDriftTracker
+from .command_queue import CommandQueue
+from .connector import DeferredConnector
+from .const import (
+    CONF_INSTALLER_CODE,
+    DATA_BOSCH,
+    DATA_CLOCK_DRIFT,
+    DATA_COMMAND_QUEUE,
+    DATA_CONNECTOR,
+    DATA_METRICS,
+    DATA_POLL_SCHEDULER,
+    DATA_STATE_WRITER,
+    DATA_ZONE_FILTERS,
+    DATA_ZONE_HISTORY,
+    DOMAIN,
+)
+from .metrics import PanelMetrics
+from .poll_scheduler import AdaptivePollScheduler, async_get_poller
+from .state_writer import StateWriteScheduler
+from .zone_filter import ZoneFilters
+from .zone_history import ZoneHistory
+
+TO_REDACT = {CONF_INSTALLER_CODE}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return the diagnostics of a config entry.
+
+    Args:
+        hass (HomeAssistant): Homeassistant object
+        entry (ConfigEntry): The config entry of the control panel
+
+    Returns:
+        dict[str, Any]: The diagnostics data
+    """
+    data = hass.data[DOMAIN][entry.entry_id]
+    poll_scheduler: AdaptivePollScheduler = data[DATA_POLL_SCHEDULER]
+    writer: StateWriteScheduler = data[DATA_STATE_WRITER]
+    command_queue: CommandQueue = data[DATA_COMMAND_QUEUE]
+    connector: DeferredConnector = data[DATA_CONNECTOR]
+    metrics: PanelMetrics = data[DATA_METRICS]
+    zone_history: ZoneHistory = data[DATA_ZONE_HISTORY]
+    zone_filters: ZoneFilters = data[DATA_ZONE_FILTERS]
+    clock_drift: ClockDriftTracker = data[DATA_CLOCK_DRIFT]
+
+    return {
+        "entry": async_redact_data(entry.data, TO_REDACT),
+        "connection": {
+            "connected": data[DATA_BOSCH].connected,
+            "attempts": connector.attempts,
+            "time_to_connect": connector.time_to_connect,
+        },
+        "polling": {
+            "mode": poll_scheduler.mode.value,
+            "period": poll_scheduler.period,
+            "poll_rate": round(poll_scheduler.poll_rate, 3),
+            "shared_poller": {
+                "panels": async_get_poller(hass).panels,
+                "wakeups": async_get_poller(hass).wakeups,
+            },
+        },
+        "state_writes": {
+            "requested": writer.requested,
+            "written": writer.written,
+            "saved": writer.saved,
+        },
+        "commands": {
+            name: asdict(stats) for name, stats in command_queue.stats.items()
+        },
+        "metrics": metrics.as_dict(),
+        "zone_history": zone_history.as_dict(),
+        "zone_filters": zone_filters.as_dict(),
+        "clock": clock_drift.as_dict(),
+    }
@@ -0,0 +1,144 @@
+"""Discovery of the control panels in the local network."""
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from ipaddress import IPv4Network, ip_network
+import logging
+import time
+
+from homeassistant.components import network
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_DEFAULT_PORT,
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_LISTEN_TIMEOUT,
+    DISCOVERY_MIN_PREFIX,
+    DISCOVERY_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class DiscoveryResult:
+    """Result of a scan for control panels."""
+
+    hosts: list[str] = field(default_factory=list)
+    # Number of probed hosts
+    scanned: int = 0
+    # Time (in seconds) taken by the scan
+    duration: float = 0.0
+
+
+async def async_get_local_networks(hass: HomeAssistant) -> list[IPv4Network]:
+    """Get the IPv4 networks of the enabled network adapters.
+
+    Args:
+        hass (HomeAssistant): Homeassistant object
+
+    Returns:
+        list[IPv4Network]: The local networks, narrowed to DISCOVERY_MIN_PREFIX
+    """
+    networks: list[IPv4Network] = []
+    for adapter in await network.async_get_adapters(hass):
+        if not adapter["enabled"]:
+            continue
+        for ipv4 in adapter["ipv4"]:
+            prefix = max(ipv4["network_prefix"], DISCOVERY_MIN_PREFIX)
+            net = ip_network(f"{ipv4['address']}/{prefix}", strict=False)
+            if not net.is_loopback and net not in networks:
+                networks.append(net)
+    return networks
+
+
+async def async_probe(
+    host: str, port: int, timeout: float, listen_timeout: float
+) -> bool:
+    """Probe a host for a control panel, without sending anything to it.
+
+    The control panels only talk when requested to, so the hosts accepting
+    the connection and staying silent may be control panels, while the ones
+    sending a banner or closing the connection aren't.
+
+    Args:
+        host (str): Address of the host
+        port (int): Port of the control panel
+        timeout (float): Time (in seconds) allowed for the host to connect
+        listen_timeout (float): Time (in seconds) the host has to stay silent
+
+    Returns:
+        bool: True if the host may be a control panel. False otherwise
+    """
+
+    async def _listen() -> bool:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout
+        )
+        try:
+            await asyncio.wait_for(reader.read(1), listen_timeout)
+        except asyncio.TimeoutError:
+            # Silent, as a control panel
+            return True
+        finally:
+            writer.close()
+            await writer.wait_closed()
+        # A banner, or the connection closed
+        return False
+
+    try:
+        return await _listen()
+    except (OSError, asyncio.TimeoutError):
+        return False
+
+
+async def async_scan(
+    networks: Iterable[IPv4Network],
+    port: int = CONF_DEFAULT_PORT,
+    concurrency: int = DISCOVERY_CONCURRENCY,
+    timeout: float = DISCOVERY_TIMEOUT,
+    listen_timeout: float = DISCOVERY_LISTEN_TIMEOUT,
+) -> DiscoveryResult:
+    """Scan the networks for control panels.
+
+    Every host is probed, at most `concurrency` at a time, without being sent
+    anything. The installer code is only sent to the host picked among the
+    ones found, when validating its connection.
+
+    Args:
+        networks (Iterable[IPv4Network]): The networks to scan
+        port (int, optional): Port of the control panels. Defaults to
+            CONF_DEFAULT_PORT
+        concurrency (int, optional): Maximum number of hosts probed at the same
+            time. Defaults to DISCOVERY_CONCURRENCY
+        timeout (float, optional): Time (in seconds) allowed for each host to
+            connect. Defaults to DISCOVERY_TIMEOUT
+        listen_timeout (float, optional): Time (in seconds) each host has to
+            stay silent. Defaults to DISCOVERY_LISTEN_TIMEOUT
+
+    Returns:
+        DiscoveryResult: The hosts that may be control panels
+    """
+    hosts = list(dict.fromkeys(str(h) for net in networks for h in net.hosts()))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _probe(host: str) -> bool:
+        async with semaphore:
+            return await async_probe(host, port, timeout, listen_timeout)
+
+    start = time.monotonic()
+    found = await asyncio.gather(*(_probe(host) for host in hosts))
+    result = DiscoveryResult(
+        hosts=[host for host, ok in zip(hosts, found) if ok],
+        scanned=len(hosts),
+        duration=time.monotonic() - start,
+    )
+    _LOGGER.info(
+        "Scanned %d hosts in %.1fs, found %d possible control panels: %s",
+        result.scanned,
+        result.duration,
+        len(result.hosts),
+        result.hosts,
+    )
+    return result
@@ -0,0 +1,144 @@
+"""Event dispatching for the bosch_control_panel_cc880 integration."""
+
+import time
+
+from bosch.control_panel.cc880p.models.cp import (
+    Area,
+    ArmingMode,
+    Availability,
+    ControlPanel,
+    Id,
+    Output,
+    Siren,
+    Zone,
+)
+from bosch.control_panel.cc880p.models.listener import BaseControlPanelListener
+
+from .const import PRIMARY_AREA
+from .metrics import PanelMetrics
+
+
+class ZoneDispatcher(BaseControlPanelListener):
+    """Single control panel listener routing the zone events to their entity.
+
+    Instead of registering every zone entity as a listener of the control
+    panel (delivering every zone event to every zone), the zone entities are
+    indexed by their id and each event is delivered only to the affected one.
+    """
+
+    def __init__(self, metrics: PanelMetrics) -> None:
+        """Initialize the zone dispatcher.
+
+        Args:
+            metrics (PanelMetrics): Metrics where the dispatches are recorded
+        """
+        self._metrics = metrics
+        self._zones: dict[Id, BaseControlPanelListener] = {}
+
+    def add_zone(self, idd: Id, listener: BaseControlPanelListener) -> None:
+        """Register the listener of a zone.
+
+        Args:
+            idd (Id): The number/id of the zone
+            listener (BaseControlPanelListener): The listener of the zone
+        """
+        self._zones[idd] = listener
+
+    def remove_zone(self, idd: Id) -> None:
+        """Unregister the listener of a zone.
+
+        Args:
+            idd (Id): The number/id of the zone
+        """
+        self._zones.pop(idd, None)
+
+    async def on_availability_changed(self, entity: Availability):  # noqa: D102
+        for listener in self._zones.values():
+            await listener.on_availability_changed(entity)
+
+    async def on_zone_trigger_changed(
+        self, id: Id, entity: Zone
+    ):  # pylint: disable=redefined-builtin
+        if listener := self._zones.get(id):
+            started = time.monotonic()
+            await listener.on_zone_trigger_changed(id, entity)
+            self._metrics.dispatch.record(time.monotonic() - started)
+
+    async def on_zone_changed(
+        self, id: Id, entity: Zone
+    ):  # pylint: disable=redefined-builtin
+        if listener := self._zones.get(id):
+            await listener.on_zone_changed(id, entity)
+
+
+class AreaDispatcher(BaseControlPanelListener):
+    """Single control panel listener routing the area events to their entity.
+
+    The control panel reports area changes without telling which area
+    changed, so the modes are compared against the last known ones and the
+    event is delivered only to the areas that changed. The events concerning
+    the whole panel (availability, siren and responses) are delivered to all
+    the areas, while the zone and output events are only delivered to the
+    primary area entity, which holds the attributes of the whole panel.
+    """
+
+    def __init__(self, control_panel: ControlPanel) -> None:
+        """Initialize the area dispatcher.
+
+        Args:
+            control_panel (ControlPanel): The control panel model
+        """
+        self._control_panel = control_panel
+        self._areas: dict[Id, BaseControlPanelListener] = {}
+        self._modes: dict[Id, ArmingMode] = {
+            idd: area.mode for idd, area in control_panel.areas.items()
+        }
+
+    def add_area(self, idd: Id, listener: BaseControlPanelListener) -> None:
+        """Register the listener of an area.
+
+        Args:
+            idd (Id): The number/id of the area
+            listener (BaseControlPanelListener): The listener of the area
+        """
+        self._areas[idd] = listener
+
+    def remove_area(self, idd: Id) -> None:
+        """Unregister the listener of an area.
+
+        Args:
+            idd (Id): The number/id of the area
+        """
+        self._areas.pop(idd, None)
+
+    async def on_availability_changed(self, entity: Availability):  # noqa: D102
+        for listener in self._areas.values():
+            await listener.on_availability_changed(entity)
+
+    async def on_siren_changed(self, entity: Siren):  # noqa: D102
+        for listener in self._areas.values():
+            await listener.on_siren_changed(entity)
+
+    async def on_area_changed(self, entity: Area):  # noqa: D102
+        for idd, area in self._control_panel.areas.items():
+            if self._modes.get(idd) == area.mode:
+                continue
+            self._modes[idd] = area.mode
+            if listener := self._areas.get(idd):
+                await listener.on_area_changed(area)
+
+    async def on_zone_changed(
+        self, id: Id, entity: Zone
+    ):  # pylint: disable=redefined-builtin
+        if listener := self._areas.get(PRIMARY_AREA):
+            await listener.on_zone_changed(id, entity)
+
+    async def on_output_changed(
+        self, id: Id, entity: Output
+    ):  # pylint: disable=redefined-builtin
+        if listener := self._areas.get(PRIMARY_AREA):
+            await listener.on_output_changed(id, entity)
+
+    async def on_data(self, data: bytes):  # noqa: D102
+        for listener in self._areas.values():
+            await listener.on_data(data)
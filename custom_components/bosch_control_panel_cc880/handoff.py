@@ -0,0 +1,119 @@
+"""Handoff of the connections validated by the config flow."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+import logging
+from typing import Any
+
+from bosch.control_panel.cc880p.cp import CP
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    CONF_HOST,
+    CONF_INSTALLER_CODE,
+    CONF_MODEL,
+    CONF_PORT,
+    CONNECTION_HANDOFF_TTL,
+    DATA_HANDOFF,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingConnection:
+    """Connection validated by the config flow, waiting to be reused."""
+
+    alarm: CP
+    handshake: float
+    cancel_expiry: CALLBACK_TYPE
+
+
+class ConnectionHandoff:
+    """Keep the connections validated by the config flow for a bounded time.
+
+    The config flow connects to the control panel and synchronizes its status
+    to validate the user input. Instead of closing that connection, it is
+    offered to the entry setup, avoiding a second connection handshake. If
+    not taken within CONNECTION_HANDOFF_TTL seconds, the connection is closed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the connection handoff.
+
+        Args:
+            hass (HomeAssistant): Homeassistant object
+        """
+        self._hass = hass
+        self._pending: dict[tuple, PendingConnection] = {}
+
+    @staticmethod
+    def _key(data: dict[str, Any]) -> tuple:
+        return (
+            data[CONF_HOST],
+            data[CONF_PORT],
+            data[CONF_MODEL],
+            data.get(CONF_INSTALLER_CODE),
+        )
+
+    @callback
+    def async_offer(self, data: dict[str, Any], alarm: CP, handshake: float) -> None:
+        """Offer a connected control panel to be reused by the entry setup.
+
+        Args:
+            data (dict[str, Any]): The configuration used to connect
+            alarm (CP): The connected control panel
+            handshake (float): Time (in seconds) it took to connect and sync
+        """
+        key = self._key(data)
+        if previous := self._pending.pop(key, None):
+            previous.cancel_expiry()
+            self._hass.async_create_task(previous.alarm.stop())
+
+        self._pending[key] = PendingConnection(
+            alarm=alarm,
+            handshake=handshake,
+            cancel_expiry=async_call_later(
+                self._hass, CONNECTION_HANDOFF_TTL, partial(self._async_expire, key)
+            ),
+        )
+
+    @callback
+    def async_take(self, data: dict[str, Any]) -> PendingConnection | None:
+        """Take the connection validated for a configuration, if any.
+
+        Args:
+            data (dict[str, Any]): The configuration of the entry
+
+        Returns:
+            PendingConnection | None: The pending connection or None if there
+                is no connection available for that configuration
+        """
+        if pending := self._pending.pop(self._key(data), None):
+            pending.cancel_expiry()
+        return pending
+
+    async def _async_expire(self, key: tuple, _now: datetime) -> None:
+        if pending := self._pending.pop(key, None):
+            _LOGGER.debug("Closing the unused connection to %s:%s", *key[:2])
+            await pending.alarm.stop()
+
+
+@callback
+def async_get_handoff(hass: HomeAssistant) -> ConnectionHandoff:
+    """Get the connection handoff shared by the config flow and the setup.
+
+    Args:
+        hass (HomeAssistant): Homeassistant object
+
+    Returns:
+        ConnectionHandoff: The connection handoff
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_HANDOFF not in domain_data:
+        domain_data[DATA_HANDOFF] = ConnectionHandoff(hass)
+    return domain_data[DATA_HANDOFF]
@@ -0,0 +1,185 @@
+"""Hot-path latency metrics of the bosch_control_panel_cc880 integration."""
+
+from bisect import bisect_left
+from collections import deque
+import time
+from typing import Any
+
+from bosch.control_panel.cc880p.models.cp import (
+    Area,
+    Availability,
+    Id,
+    Output,
+    Siren,
+    Zone,
+)
+from bosch.control_panel.cc880p.models.listener import BaseControlPanelListener
+
+from .const import EVENT_RATE_WINDOW, LATENCY_BUCKETS
+
+
+class Histogram:
+    """Histogram with fixed buckets, cheap enough to record on every event."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Initialize the histogram.
+
+        Args:
+            buckets (tuple[float, ...], optional): Sorted upper bounds of the
+                buckets (in seconds). Defaults to LATENCY_BUCKETS.
+        """
+        self._buckets = buckets
+        # Last count is for the values above the last bucket
+        self._counts: list[int] = [0] * (len(buckets) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def record(self, value: float) -> None:
+        """Record a value.
+
+        Args:
+            value (float): The value (in seconds)
+        """
+        self._counts[bisect_left(self._buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, percent: float) -> float | None:
+        """Estimate a percentile as the upper bound of the bucket holding it.
+
+        Args:
+            percent (float): The percentile (0-100)
+
+        Returns:
+            float | None: The estimated value or None if nothing was recorded
+        """
+        if not self.count:
+            return None
+
+        rank = percent / 100 * self.count
+        accumulated = 0
+        for idx, count in enumerate(self._counts):
+            accumulated += count
+            if accumulated >= rank and count:
+                if idx < len(self._buckets):
+                    return min(self._buckets[idx], self.max)
+                break
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the histogram."""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "buckets": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(self._buckets, self._counts)
+                },
+                "inf": self._counts[-1],
+            },
+        }
+
+
+class PanelMetrics(BaseControlPanelListener):
+    """Latencies and counters of the control panel hot paths.
+
+    - poll: round trip of the status requests.
+    - dispatch: delivery of a zone event to its entity.
+    - event_to_write: from the panel response to the state write.
+    - state_write: duration of each coalesced state write.
+    - command: execution of the queued commands.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.poll = Histogram()
+        self.dispatch = Histogram()
+        self.event_to_write = Histogram()
+        self.state_write = Histogram()
+        self.command = Histogram()
+        self.events: int = 0
+        self.reconnects: int = 0
+        # Zone changes reported by the panel and written after the filters
+        self.zone_changes: int = 0
+        self.zone_writes: int = 0
+        self._connected_once: bool = False
+        self._event_times: deque[float] = deque()
+        # Arrival of the last response of the control panel
+        self._last_data: float = time.monotonic()
+        # Arrival of the oldest response not yet written to the states
+        self._pending_data: float | None = None
+
+    @property
+    def events_per_minute(self) -> float:
+        """Number of panel events within the last EVENT_RATE_WINDOW seconds."""
+        self._prune_events(time.monotonic())
+        return len(self._event_times) * 60 / EVENT_RATE_WINDOW
+
+    def record_write(self, duration: float) -> None:
+        """Record a state write, closing the pending event-to-write latency.
+
+        Args:
+            duration (float): Time (in seconds) spent writing the states
+        """
+        self.state_write.record(duration)
+        if self._pending_data is not None:
+            self.event_to_write.record(time.monotonic() - self._pending_data)
+            self._pending_data = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the metrics."""
+        return {
+            "events": self.events,
+            "events_per_minute": self.events_per_minute,
+            "reconnects": self.reconnects,
+            "zone_changes": self.zone_changes,
+            "zone_writes": self.zone_writes,
+            "poll": self.poll.as_dict(),
+            "dispatch": self.dispatch.as_dict(),
+            "event_to_write": self.event_to_write.as_dict(),
+            "state_write": self.state_write.as_dict(),
+            "command": self.command.as_dict(),
+        }
+
+    def _prune_events(self, now: float) -> None:
+        while self._event_times and now - self._event_times[0] > EVENT_RATE_WINDOW:
+            self._event_times.popleft()
+
+    def _record_event(self) -> None:
+        now = time.monotonic()
+        self.events += 1
+        self._event_times.append(now)
+        self._prune_events(now)
+        if self._pending_data is None:
+            self._pending_data = self._last_data
+
+    async def on_data(self, data: bytes):  # noqa: D102
+        self._last_data = time.monotonic()
+
+    async def on_availability_changed(self, entity: Availability):  # noqa: D102
+        if entity.available:
+            if self._connected_once:
+                self.reconnects += 1
+            self._connected_once = True
+
+    async def on_area_changed(self, entity: Area):  # noqa: D102
+        self._record_event()
+
+    async def on_siren_changed(self, entity: Siren):  # noqa: D102
+        self._record_event()
+
+    async def on_zone_trigger_changed(
+        self, id: Id, entity: Zone
+    ):  # pylint: disable=redefined-builtin
+        self._record_event()
+
+    async def on_output_changed(
+        self, id: Id, entity: Output
+    ):  # pylint: disable=redefined-builtin
+        self._record_event()
@@ -0,0 +1,101 @@
+"""Compact representation of the control panel state."""
+
+from bosch.control_panel.cc880p.models.cp import ControlPanel, Id, Output, Zone
+
+
+def _set_bit(mask: int, idd: Id, on: bool) -> int:
+    """Set or clear the bit of an id (ids start at 1) in a bitmask."""
+    bit = 1 << (idd - 1)
+    return mask | bit if on else mask & ~bit
+
+
+def _to_str(mask: int, size: int) -> str:
+    """Convert a bitmask into a space-joined string of 0s and 1s."""
+    return " ".join("1" if mask >> i & 1 else "0" for i in range(size))
+
+
+class PanelStateBits:
+    """Integer bitmasks with the zones and outputs states of the control panel.
+
+    The bit ``id - 1`` of each bitmask holds the state of the zone/output
+    with that id. The bitmasks are updated incrementally, and every update
+    reports whether any bit actually changed.
+    """
+
+    def __init__(self, control_panel: ControlPanel) -> None:
+        """Initialize the bitmasks from the current control panel state.
+
+        Args:
+            control_panel (ControlPanel): The control panel model
+        """
+        self._n_zones: int = len(control_panel.zones)
+        self._n_outputs: int = len(control_panel.outputs)
+        self.zones_triggered: int = 0
+        self.zones_enabled: int = 0
+        self.outputs: int = 0
+        self.sync(control_panel)
+
+    def sync(self, control_panel: ControlPanel) -> bool:
+        """Rebuild all the bitmasks from the control panel model.
+
+        Args:
+            control_panel (ControlPanel): The control panel model
+
+        Returns:
+            bool: True if any bit changed. False otherwise
+        """
+        changed = False
+        for idd, zone in control_panel.zones.items():
+            changed |= self.set_zone(idd, zone)
+        for idd, output in control_panel.outputs.items():
+            changed |= self.set_output(idd, output)
+        return changed
+
+    def set_zone(self, idd: Id, zone: Zone) -> bool:
+        """Update the triggered and enabled bits of a zone.
+
+        Args:
+            idd (Id): The number/id of the zone
+            zone (Zone): The zone object
+
+        Returns:
+            bool: True if any bit changed. False otherwise
+        """
+        triggered = _set_bit(self.zones_triggered, idd, zone.triggered)
+        enabled = _set_bit(self.zones_enabled, idd, zone.enabled)
+        changed = (
+            triggered != self.zones_triggered or enabled != self.zones_enabled
+        )
+        self.zones_triggered = triggered
+        self.zones_enabled = enabled
+        return changed
+
+    def set_output(self, idd: Id, output: Output) -> bool:
+        """Update the bit of an output.
+
+        Args:
+            idd (Id): The number/id of the output
+            output (Output): The output object
+
+        Returns:
+            bool: True if the bit changed. False otherwise
+        """
+        outputs = _set_bit(self.outputs, idd, output.on)
+        changed = outputs != self.outputs
+        self.outputs = outputs
+        return changed
+
+    @property
+    def outputs_str(self) -> str:
+        """Outputs as a space-joined string of 0s and 1s."""
+        return _to_str(self.outputs, self._n_outputs)
+
+    @property
+    def zones_triggered_str(self) -> str:
+        """Triggered zones as a space-joined string of 0s and 1s."""
+        return _to_str(self.zones_triggered, self._n_zones)
+
+    @property
+    def zones_enabled_str(self) -> str:
+        """Enabled zones as a space-joined string of 0s and 1s."""
+        return _to_str(self.zones_enabled, self._n_zones)
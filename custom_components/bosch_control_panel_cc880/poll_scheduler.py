@@ -0,0 +1,381 @@
+"""Adaptive polling of the bosch control panels."""
+
+import asyncio
+from collections import deque
+from datetime import datetime
+from enum import Enum
+import logging
+import math
+import time
+
+from bosch.control_panel.cc880p.cp import CP
+from bosch.control_panel.cc880p.models.cp import (
+    Area,
+    ArmingMode,
+    Availability,
+    Id,
+    Siren,
+    Zone,
+)
+from bosch.control_panel.cc880p.models.listener import BaseControlPanelListener
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    CP_WATCHDOG_PERIOD,
+    DATA_POLLER,
+    DOMAIN,
+    POLL_COALESCE_WINDOW,
+    POLL_RATE_WINDOW,
+    ZONE_ACTIVITY_WINDOW,
+)
+from .metrics import PanelMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+# Private attribute of the CP with the period of the polls of its connection
+# loop, as of bosch-control-panel-cc880p 4.0.0 (pinned in the manifest)
+_CP_POLL_PERIOD = "_init_poll_period"
+_cp_poll_period_missing_logged = False
+
+# Fractional part of the golden ratio. Multiples of it spread the phases of
+# any number of panels evenly over their period
+_GOLDEN_RATIO_FRACTION = (math.sqrt(5) - 1) / 2
+
+
+def _set_cp_poll_period(alarm: CP, period: float) -> None:
+    """Set the period of the polls of the connection loop of the CP.
+
+    The CP has no public way to set it. Without the attribute, the CP keeps
+    polling with the period it was created with, which is logged once.
+
+    Args:
+        alarm (CP): Object representation of the control panel
+        period (float): Polling period (in seconds)
+    """
+    global _cp_poll_period_missing_logged  # pylint: disable=global-statement
+    if hasattr(alarm, _CP_POLL_PERIOD):
+        setattr(alarm, _CP_POLL_PERIOD, period)
+    elif not _cp_poll_period_missing_logged:
+        _cp_poll_period_missing_logged = True
+        _LOGGER.warning(
+            "The CP has no %s attribute, its own polls can't be spaced out",
+            _CP_POLL_PERIOD,
+        )
+
+
+class PollMode(str, Enum):
+    """Polling modes, from the most to the least reactive."""
+
+    FAST = "fast"
+    NORMAL = "normal"
+    IDLE = "idle"
+
+
+class AdaptivePollScheduler(BaseControlPanelListener):
+    """Decide when to poll a control panel, according to its current activity.
+
+    - Fast: while arming/disarming or while the siren is on.
+    - Normal: while any area is armed or a zone was recently triggered.
+    - Idle: otherwise.
+
+    The polls themselves are driven by the SharedPoller, common to all the
+    control panels. The built-in poll loop of the CP is kept as a
+    keep-alive/reconnection watchdog, with a period of at least
+    CP_WATCHDOG_PERIOD, as it never polls within that period after the last
+    request.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        alarm: CP,
+        metrics: PanelMetrics,
+        fast_period: float,
+        normal_period: float,
+        idle_period: float,
+    ) -> None:
+        """Initialize the adaptive poll scheduler.
+
+        Args:
+            hass (HomeAssistant): Homeassistant object
+            alarm (CP): Object representation of the control panel
+            metrics (PanelMetrics): Metrics where the polls are recorded
+            fast_period (float): Fast polling period (in seconds)
+            normal_period (float): Normal polling period (in seconds)
+            idle_period (float): Idle polling period (in seconds)
+        """
+        self._hass = hass
+        self._alarm = alarm
+        self._metrics = metrics
+        self._poller = async_get_poller(hass)
+        self._periods: dict[PollMode, float] = {}
+        self._mode: PollMode = PollMode.NORMAL
+        # Number of areas transitioning between states
+        self._transitions: int = 0
+        self._last_zone_activity: float | None = None
+        self._requests: deque[float] = deque()
+        # No poll before this time (monotonic), used to stagger the panels
+        self._not_before: float = 0.0
+        self.set_periods(fast_period, normal_period, idle_period)
+
+    @property
+    def mode(self) -> PollMode:
+        """Polling mode currently in effect."""
+        return self._mode
+
+    @property
+    def period(self) -> float:
+        """Polling period (in seconds) currently in effect."""
+        return self._periods[self._mode]
+
+    @property
+    def poll_rate(self) -> float:
+        """Achieved rate of requests to the panel (per second)."""
+        self._prune_requests(time.monotonic())
+        return len(self._requests) / POLL_RATE_WINDOW
+
+    def set_periods(
+        self, fast_period: float, normal_period: float, idle_period: float
+    ) -> None:
+        """Set the polling period of each mode.
+
+        Args:
+            fast_period (float): Fast polling period (in seconds)
+            normal_period (float): Normal polling period (in seconds)
+            idle_period (float): Idle polling period (in seconds)
+        """
+        self._periods = {
+            PollMode.FAST: fast_period,
+            PollMode.NORMAL: normal_period,
+            PollMode.IDLE: idle_period,
+        }
+        # The CP loop only polls if nothing was requested within this period
+        _set_cp_poll_period(self._alarm, max(idle_period, CP_WATCHDOG_PERIOD))
+        self._update_mode()
+        self._poller.async_wakeup()
+
+    @callback
+    def async_start(self) -> None:
+        """Start polling the control panel through the shared poller."""
+        self._alarm.add_listener(self)
+        self._poller.async_add(self)
+
+    async def async_stop(self) -> None:
+        """Stop polling the control panel."""
+        self._alarm.remove_listener(self)
+        self._poller.async_remove(self)
+
+    @callback
+    def async_set_transition(self, transition: bool) -> None:
+        """Report an area starting/finishing a transition between states.
+
+        Args:
+            transition (bool): True when an area starts arming/disarming.
+                False when it finishes
+        """
+        self._transitions = max(self._transitions + (1 if transition else -1), 0)
+        self._update_mode()
+
+    @callback
+    def async_delay(self, delay: float) -> None:
+        """Delay the next poll.
+
+        Args:
+            delay (float): Minimum time (in seconds) until the next poll
+        """
+        self._not_before = time.monotonic() + delay
+
+    def next_poll(self, now: float) -> float:
+        """Get the time of the next poll.
+
+        Args:
+            now (float): Current time (monotonic)
+
+        Returns:
+            float: Time (monotonic) of the next poll, or infinite while the
+                control panel is not connected
+        """
+        if not self._alarm.connected:
+            # Reconnection is handled by the CP. Woken up once available
+            return math.inf
+        since_last_request = (
+            datetime.now() - self._alarm.last_request_time
+        ).total_seconds()
+        return max(self._not_before, now + self.period - since_last_request)
+
+    async def async_poll(self) -> None:
+        """Poll the status of the control panel."""
+        started = time.monotonic()
+        try:
+            await self._alarm.get_status()
+            self._metrics.poll.record(time.monotonic() - started)
+        except Exception as ex:  # pylint: disable=broad-except
+            _LOGGER.debug("Polling failed: %s", ex)
+        # Back to idle once the zone activity window runs out
+        self._update_mode()
+
+    def _select_mode(self) -> PollMode:
+        c_p = self._alarm.control_panel
+        if self._transitions or c_p.siren.on:
+            return PollMode.FAST
+
+        if any(area.mode != ArmingMode.DISARMED for area in c_p.areas.values()):
+            return PollMode.NORMAL
+
+        if (
+            self._last_zone_activity is not None
+            and time.monotonic() - self._last_zone_activity < ZONE_ACTIVITY_WINDOW
+        ):
+            return PollMode.NORMAL
+
+        return PollMode.IDLE
+
+    def _update_mode(self) -> None:
+        mode = self._select_mode()
+        if mode != self._mode:
+            _LOGGER.debug(
+                "Polling mode changed from %s to %s (%.2fs)",
+                self._mode.value,
+                mode.value,
+                self._periods[mode],
+            )
+            faster = self._periods[mode] < self.period
+            self._mode = mode
+            if faster:
+                # Don't wait for the end of the slower period
+                self._poller.async_wakeup()
+
+    def _prune_requests(self, now: float) -> None:
+        while self._requests and now - self._requests[0] > POLL_RATE_WINDOW:
+            self._requests.popleft()
+
+    async def on_availability_changed(self, entity: Availability):  # noqa: D102
+        self._poller.async_wakeup()
+
+    async def on_area_changed(self, entity: Area):  # noqa: D102
+        self._update_mode()
+
+    async def on_siren_changed(self, entity: Siren):  # noqa: D102
+        self._update_mode()
+
+    async def on_zone_trigger_changed(
+        self, id: Id, entity: Zone
+    ):  # pylint: disable=redefined-builtin
+        self._last_zone_activity = time.monotonic()
+        self._update_mode()
+
+    async def on_data(self, data: bytes):  # noqa: D102
+        now = time.monotonic()
+        self._requests.append(now)
+        self._prune_requests(now)
+
+
+class SharedPoller:
+    """Single loop polling all the control panels.
+
+    Instead of one loop (and one timer) per control panel, a single loop
+    sleeps until the next panel is due. The panels registered are staggered
+    over their period so that they are not polled all at once, and the polls
+    due within POLL_COALESCE_WINDOW are started in the same wake-up.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the shared poller.
+
+        Args:
+            hass (HomeAssistant): Homeassistant object
+        """
+        self._hass = hass
+        self._schedulers: list[AdaptivePollScheduler] = []
+        self._polls: dict[AdaptivePollScheduler, asyncio.Task] = {}
+        self._registered: int = 0
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.wakeups: int = 0
+
+    @property
+    def panels(self) -> int:
+        """Number of control panels being polled."""
+        return len(self._schedulers)
+
+    @callback
+    def async_add(self, scheduler: AdaptivePollScheduler) -> None:
+        """Start polling a control panel.
+
+        Args:
+            scheduler (AdaptivePollScheduler): The scheduler of the panel
+        """
+        phase = (self._registered * _GOLDEN_RATIO_FRACTION) % 1
+        self._registered += 1
+        scheduler.async_delay(phase * scheduler.period)
+        self._schedulers.append(scheduler)
+        if not self._task:
+            self._task = self._hass.async_create_background_task(
+                self._poll_loop(), f"{DOMAIN} shared poller"
+            )
+        self.async_wakeup()
+
+    @callback
+    def async_remove(self, scheduler: AdaptivePollScheduler) -> None:
+        """Stop polling a control panel.
+
+        Args:
+            scheduler (AdaptivePollScheduler): The scheduler of the panel
+        """
+        if scheduler in self._schedulers:
+            self._schedulers.remove(scheduler)
+        if not self._schedulers and self._task:
+            self._task.cancel()
+            self._task = None
+
+    @callback
+    def async_wakeup(self) -> None:
+        """Wake up the loop to reschedule the polls."""
+        self._wakeup.set()
+
+    async def _poll(self, scheduler: AdaptivePollScheduler):
+        try:
+            await scheduler.async_poll()
+        finally:
+            self._polls.pop(scheduler, None)
+            self._wakeup.set()
+
+    async def _poll_loop(self):
+        while True:
+            self._wakeup.clear()
+            now = time.monotonic()
+            next_due = math.inf
+            for scheduler in self._schedulers:
+                if scheduler in self._polls:
+                    continue
+                due = scheduler.next_poll(now)
+                if due <= now + POLL_COALESCE_WINDOW:
+                    self._polls[scheduler] = self._hass.async_create_background_task(
+                        self._poll(scheduler), f"{DOMAIN} poll"
+                    )
+                else:
+                    next_due = min(next_due, due)
+
+            timeout = None if next_due == math.inf else next_due - now
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            self.wakeups += 1
+
+
+@callback
+def async_get_poller(hass: HomeAssistant) -> SharedPoller:
+    """Get the poller shared by all the control panels.
+
+    Args:
+        hass (HomeAssistant): Homeassistant object
+
+    Returns:
+        SharedPoller: The shared poller
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_POLLER not in domain_data:
+        domain_data[DATA_POLLER] = SharedPoller(hass)
+    return domain_data[DATA_POLLER]
@@ -0,0 +1,278 @@
+"""Sensors of the Bosch Control Panel CC880P in Homeassistant."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+
+from bosch.control_panel.cc880p.cp import CP
+from bosch.control_panel.cc880p.models.cp import Availability, Id, Time
+from bosch.control_panel.cc880p.models.listener import BaseControlPanelListener
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from . import BoschControlPanelDevice
+from .clock_drift import ClockDriftTracker
+from .const import (
+    DATA_BOSCH,
+    DATA_CLOCK_DRIFT,
+    DATA_METRICS,
+    DATA_STATE_WRITER,
+    DATA_ZONE_HISTORY,
+    DOMAIN,
+    ZONE_TRIGGERS_WINDOW,
+)
+from .metrics import PanelMetrics
+from .state_writer import StateWriteScheduler
+from .zone_history import ZoneHistory
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _milliseconds(value: float | None) -> float | None:
+    return None if value is None else round(value * 1000, 1)
+
+
+@dataclass(frozen=True, kw_only=True)
+class BoschMetricDescription(SensorEntityDescription):
+    """Description of a sensor exposing a metric of the control panel."""
+
+    value_fn: Callable[[PanelMetrics], float | int | None]
+
+
+METRIC_SENSORS: tuple[BoschMetricDescription, ...] = (
+    BoschMetricDescription(
+        key="event_latency_p50",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda m: _milliseconds(m.event_to_write.percentile(50)),
+    ),
+    BoschMetricDescription(
+        key="event_latency_p99",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda m: _milliseconds(m.event_to_write.percentile(99)),
+    ),
+    BoschMetricDescription(
+        key="events_per_minute",
+        native_unit_of_measurement="events/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda m: m.events_per_minute,
+    ),
+    BoschMetricDescription(
+        key="reconnects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda m: m.reconnects,
+    ),
+    BoschMetricDescription(
+        key="zone_changes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda m: m.zone_changes,
+    ),
+    BoschMetricDescription(
+        key="zone_writes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda m: m.zone_writes,
+    ),
+)
+
+
+async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entities):
+    """Set up entry."""
+    _LOGGER.debug("Async Setup Entry Bosch Diagnostic Sensors")
+
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    _alarm: CP = data[DATA_BOSCH]
+    _writer: StateWriteScheduler = data[DATA_STATE_WRITER]
+    _metrics: PanelMetrics = data[DATA_METRICS]
+    _zone_history: ZoneHistory = data[DATA_ZONE_HISTORY]
+    async_add_entities(
+        [
+            *(
+                BoschMetricSensor(config_entry, _metrics, description)
+                for description in METRIC_SENSORS
+            ),
+            BoschClockSensor(config_entry, _alarm, _writer, data[DATA_CLOCK_DRIFT]),
+            BoschLastMotionSensor(config_entry, _zone_history),
+            *(
+                BoschZoneTriggersSensor(config_entry, _zone_history, idd)
+                for idd in range(1, _zone_history.n_zones + 1)
+            ),
+        ]
+    )
+
+
+class BoschMetricSensor(BoschControlPanelDevice, SensorEntity):
+    """Diagnostic sensor exposing a metric of the control panel.
+
+    Disabled by default. When enabled, it is polled by Homeassistant instead
+    of being written on every panel event, keeping it out of the hot path.
+    """
+
+    entity_description: BoschMetricDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        metrics: PanelMetrics,
+        description: BoschMetricDescription,
+    ) -> None:
+        """Initialize the metric sensor.
+
+        Args:
+            entry (ConfigEntry): The config entry of the control panel
+            metrics (PanelMetrics): Metrics of the control panel
+            description (BoschMetricDescription): Description of the sensor
+        """
+        super().__init__(entry)
+        self._metrics = metrics
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_name = f"bosch_{description.key}"
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the value of the metric."""
+        return self.entity_description.value_fn(self._metrics)
+
+
+class BoschLastMotionSensor(BoschControlPanelDevice, SensorEntity):
+    """Time of the last trigger of any zone of the control panel.
+
+    Polled by Homeassistant, the zone history being only read on demand.
+    """
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(self, entry: ConfigEntry, zone_history: ZoneHistory) -> None:
+        """Initialize the last motion sensor.
+
+        Args:
+            entry (ConfigEntry): The config entry of the control panel
+            zone_history (ZoneHistory): History of the zone triggers
+        """
+        super().__init__(entry)
+        self._zone_history = zone_history
+        self._attr_unique_id = f"{entry.entry_id}_last_motion"
+        self._attr_name = "bosch_last_motion"
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return the time of the last trigger."""
+        last = self._zone_history.last_trigger
+        return None if last is None else dt_util.utc_from_timestamp(last)
+
+
+class BoschZoneTriggersSensor(BoschControlPanelDevice, SensorEntity):
+    """Number of triggers of a zone within the last ZONE_TRIGGERS_WINDOW.
+
+    Polled by Homeassistant, the zone history being only read on demand.
+    """
+
+    _attr_native_unit_of_measurement = "triggers"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, entry: ConfigEntry, zone_history: ZoneHistory, idd: Id) -> None:
+        """Initialize the zone triggers sensor.
+
+        Args:
+            entry (ConfigEntry): The config entry of the control panel
+            zone_history (ZoneHistory): History of the zone triggers
+            idd (Id): The number/id of the zone
+        """
+        super().__init__(entry)
+        self._zone_history = zone_history
+        self._id: Id = idd
+        self._attr_unique_id = f"{entry.entry_id}_zone_{idd}_triggers"
+        self._attr_name = f"bosch_zone_{idd}_triggers"
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of triggers of the zone."""
+        counts = self._zone_history.counts_since(ZONE_TRIGGERS_WINDOW)
+        return int(counts[self._id - 1])
+
+
+class BoschClockSensor(BoschControlPanelDevice, SensorEntity, BaseControlPanelListener):
+    """Clock of the control panel (hours and minutes), with its drift.
+
+    Changes every minute, so it is disabled by default. Once enabled, it
+    listens to the clock of the panel by itself, and its state is recorded
+    every minute (see the README), without the offset and the drift, which
+    change along with it. It has no state class, keeping it out of the
+    long-term statistics.
+    """
+
+    _unrecorded_attributes = frozenset({"offset", "drift_rate"})
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_should_poll = False
+    _attr_icon = "mdi:clock-outline"
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        alarm: CP,
+        writer: StateWriteScheduler,
+        clock_drift: ClockDriftTracker,
+    ) -> None:
+        """Initialize the clock sensor.
+
+        Args:
+            entry (ConfigEntry): The config entry of the control panel
+            alarm (CP): Object representation of the control panel
+            writer (StateWriteScheduler): Scheduler of the state writes
+            clock_drift (ClockDriftTracker): Tracker of the clock drift
+        """
+        super().__init__(entry)
+        self._alarm: CP = alarm
+        self._writer: StateWriteScheduler = writer
+        self._clock_drift: ClockDriftTracker = clock_drift
+        self._attr_unique_id = f"{entry.entry_id}_clock"
+        self._attr_name = "bosch_clock"
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return self._alarm.control_panel.availability.available
+
+    @property
+    def native_value(self) -> str:
+        """Return the time of the panel clock."""
+        cp_time = self._alarm.control_panel.time.time
+        return f"{cp_time.hour:02d}:{cp_time.minute:02d}"
+
+    @property
+    def extra_state_attributes(self) -> dict[str, float | None]:
+        """Return the offset (in seconds) and drift (in seconds per day)."""
+        drift_rate = self._clock_drift.drift_rate
+        return {
+            "offset": self._clock_drift.offset,
+            "drift_rate": None if drift_rate is None else round(drift_rate, 2),
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Start listening to the panel clock."""
+        self._alarm.add_listener(self)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop listening to the panel clock."""
+        self._alarm.remove_listener(self)
+        self._writer.async_cancel(self)
+
+    async def on_availability_changed(self, entity: Availability):  # noqa: D102
+        self._writer.async_schedule(self)
+
+    async def on_time_changed(self, entity: Time):  # noqa: D102
+        self._writer.async_schedule(self)
@@ -0,0 +1,131 @@
+"""Persistence of the control panel state across restarts."""
+
+import logging
+from typing import Any
+
+from bosch.control_panel.cc880p.models.cp import (
+    ArmingMode,
+    Availability,
+    ControlPanel,
+    ControlPanelEntity,
+    Id,
+    Time,
+)
+from bosch.control_panel.cc880p.models.listener import BaseControlPanelListener
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY, SNAPSHOT_STORAGE_VERSION
+from .panel_state import PanelStateBits
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _bit(mask: int, idd: Id) -> bool:
+    return bool(mask >> (idd - 1) & 1)
+
+
+def _store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+async def async_remove_snapshot(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the stored snapshot of a control panel.
+
+    Args:
+        hass (HomeAssistant): Homeassistant object
+        entry_id (str): Id of the config entry of the control panel
+    """
+    await _store(hass, entry_id).async_remove()
+
+
+class PanelSnapshot(BaseControlPanelListener):
+    """Last known state of the control panel, persisted across restarts.
+
+    The zones, outputs, siren and area modes are stored as bitmasks and mode
+    names. On startup, the snapshot seeds the control panel model before the
+    entities are created, so they come up with the restored values, and the
+    first status of the panel only notifies the differences. The entities
+    are presented as available with the restored values until the panel
+    connects or the first connection attempt fails.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, control_panel: ControlPanel
+    ) -> None:
+        """Initialize the snapshot.
+
+        Args:
+            hass (HomeAssistant): Homeassistant object
+            entry_id (str): Id of the config entry of the control panel
+            control_panel (ControlPanel): The control panel model
+        """
+        self._hass = hass
+        self._control_panel = control_panel
+        self._store = _store(hass, entry_id)
+        # Signal sent when the restored values are no longer presented
+        self.signal_expired = f"{DOMAIN}_{entry_id}_snapshot_expired"
+        self.restored: bool = False
+        self.pending: bool = False
+
+    @property
+    def available(self) -> bool:
+        """Whether the entities of the control panel are available."""
+        return self._control_panel.availability.available or self.pending
+
+    async def async_restore(self) -> bool:
+        """Restore the last snapshot into the control panel model.
+
+        Returns:
+            bool: True if a snapshot was restored. False otherwise
+        """
+        if not (data := await self._store.async_load()):
+            return False
+
+        c_p = self._control_panel
+        try:
+            for idd, zone in c_p.zones.items():
+                zone.triggered = _bit(data["zones_triggered"], idd)
+                zone.enabled = _bit(data["zones_enabled"], idd)
+            for idd, output in c_p.outputs.items():
+                output.on = _bit(data["outputs"], idd)
+            c_p.siren.on = data["siren"]
+            for area, mode in zip(c_p.areas.values(), data["areas"]):
+                area.mode = ArmingMode[mode]
+        except (KeyError, TypeError) as ex:
+            _LOGGER.warning("Ignoring the invalid panel snapshot: %s", ex)
+            return False
+
+        self.restored = self.pending = True
+        return True
+
+    @callback
+    def async_expire(self) -> None:
+        """Stop presenting the restored values, if not connected yet."""
+        if self.pending:
+            self.pending = False
+            async_dispatcher_send(self._hass, self.signal_expired)
+
+    def _data(self) -> dict[str, Any]:
+        c_p = self._control_panel
+        bits = PanelStateBits(c_p)
+        return {
+            "zones_triggered": bits.zones_triggered,
+            "zones_enabled": bits.zones_enabled,
+            "outputs": bits.outputs,
+            "siren": c_p.siren.on,
+            "areas": [area.mode.name for area in c_p.areas.values()],
+        }
+
+    async def on_availability_changed(self, entity: Availability):  # noqa: D102
+        if entity.available:
+            # Live values from now on
+            self.pending = False
+
+    async def on_changed(
+        self, entity: ControlPanelEntity, id: Id | None = None
+    ):  # pylint: disable=redefined-builtin
+        if not isinstance(entity, (Availability, Time)):
+            self._store.async_delay_save(self._data, SNAPSHOT_SAVE_DELAY)
@@ -0,0 +1,123 @@
+"""Coalesced state writes for the bosch_control_panel_cc880 integration."""
+
+import asyncio
+import logging
+import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import Entity
+
+from .const import CONF_DEFAULT_STATE_WRITE_DELAY
+from .metrics import PanelMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StateWriteScheduler:
+    """Collect the entities with pending changes and write each one only once.
+
+    A single poll of the control panel may notify several changes in a row
+    (siren, outputs, areas, zones...). Instead of writing the state of an
+    entity on every notification, the entity is marked as dirty and all the
+    dirty entities are written together once the notifications settle.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        metrics: PanelMetrics,
+        delay: float = CONF_DEFAULT_STATE_WRITE_DELAY / 1000,
+    ) -> None:
+        """Initialize the state write scheduler.
+
+        Args:
+            hass (HomeAssistant): Homeassistant object
+            metrics (PanelMetrics): Metrics where the state writes are recorded
+            delay (float, optional): Time window (in seconds) in which the
+                writes are coalesced. Defaults to CONF_DEFAULT_STATE_WRITE_DELAY.
+        """
+        self._hass = hass
+        self._metrics = metrics
+        self._delay = delay
+        # Dict used as an ordered set, keeping the order of the first request
+        self._dirty: dict[Entity, None] = {}
+        self._handle: asyncio.TimerHandle | None = None
+        self._requested: int = 0
+        self._written: int = 0
+
+    @property
+    def delay(self) -> float:
+        """Time window (in seconds) in which the writes are coalesced."""
+        return self._delay
+
+    @delay.setter
+    def delay(self, delay: float) -> None:
+        self._delay = delay
+
+    @property
+    def requested(self) -> int:
+        """Number of state writes requested by the entities."""
+        return self._requested
+
+    @property
+    def written(self) -> int:
+        """Number of state writes effectively done."""
+        return self._written
+
+    @property
+    def saved(self) -> int:
+        """Number of state writes saved by the coalescing."""
+        return self._requested - self._written - len(self._dirty)
+
+    @callback
+    def async_schedule(self, entity: Entity) -> None:
+        """Mark an entity as dirty, scheduling the write of its state.
+
+        Args:
+            entity (Entity): The entity whose state changed
+        """
+        self._requested += 1
+        self._dirty[entity] = None
+        if self._handle is None:
+            self._handle = self._hass.loop.call_later(self._delay, self.async_flush)
+
+    @callback
+    def async_cancel(self, entity: Entity) -> None:
+        """Discard any pending write of an entity.
+
+        Args:
+            entity (Entity): The entity to discard
+        """
+        if self._dirty.pop(entity, False) is None:
+            # The pending write is not going to happen anymore
+            self._requested -= 1
+
+    @callback
+    def async_flush(self) -> None:
+        """Write the state of all the dirty entities."""
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+
+        started = time.monotonic()
+        dirty, self._dirty = self._dirty, {}
+        for entity in dirty:
+            entity.async_write_ha_state()
+            self._written += 1
+        self._metrics.record_write(time.monotonic() - started)
+
+        _LOGGER.debug(
+            "Wrote %d state(s). Saved %d of %d state writes",
+            len(dirty),
+            self.saved,
+            self._requested,
+        )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop all the pending writes."""
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+        self._requested -= len(self._dirty)
+        self._dirty.clear()
@@ -0,0 +1,210 @@
+"""Debounce/hysteresis of the zones of the bosch_control_panel_cc880 integration."""
+
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+import logging
+import time
+from typing import Any
+
+from bosch.control_panel.cc880p.models.cp import Id
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import ZONE_FLAP_WINDOW
+from .metrics import PanelMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ZoneFilters:
+    """Filters of the zones of a control panel, sharing the same settings.
+
+    - Minimum on-time: a trigger is only reported once the zone stays
+      triggered for this time, rejecting the shorter glitches.
+    - Off-delay: the end of a trigger is only reported once the zone stays
+      untriggered for this time, merging the triggers in a row.
+    - Flap suppression: a zone triggered at least flap_threshold times within
+      ZONE_FLAP_WINDOW is kept on until it settles for that window.
+
+    All disabled (0) by default, reporting every change of the zones.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        metrics: PanelMetrics,
+        min_on_time: float,
+        off_delay: float,
+        flap_threshold: int,
+    ) -> None:
+        """Initialize the zone filters.
+
+        Args:
+            hass (HomeAssistant): Homeassistant object
+            metrics (PanelMetrics): Metrics where the raw/filtered changes are
+                recorded
+            min_on_time (float): Minimum on-time (in seconds)
+            off_delay (float): Off-delay (in seconds)
+            flap_threshold (int): Triggers within ZONE_FLAP_WINDOW considered
+                flapping. 0 to disable the flap suppression
+        """
+        self._hass = hass
+        self._metrics = metrics
+        self._filters: dict[Id, ZoneFilter] = {}
+        self.min_on_time = min_on_time
+        self.off_delay = off_delay
+        self.flap_threshold = flap_threshold
+
+    def set_settings(
+        self, min_on_time: float, off_delay: float, flap_threshold: int
+    ) -> None:
+        """Change the settings of the filters, applied to the next changes.
+
+        Args:
+            min_on_time (float): Minimum on-time (in seconds)
+            off_delay (float): Off-delay (in seconds)
+            flap_threshold (int): Triggers within ZONE_FLAP_WINDOW considered
+                flapping. 0 to disable the flap suppression
+        """
+        self.min_on_time = min_on_time
+        self.off_delay = off_delay
+        self.flap_threshold = flap_threshold
+
+    @callback
+    def async_add(
+        self, idd: Id, state: bool, on_change: Callable[[], None]
+    ) -> "ZoneFilter":
+        """Create the filter of a zone.
+
+        Args:
+            idd (Id): The number/id of the zone
+            state (bool): Current state of the zone
+            on_change (Callable[[], None]): Called when the filtered state
+                changes
+
+        Returns:
+            ZoneFilter: The filter of the zone
+        """
+        self._filters[idd] = ZoneFilter(
+            self._hass, self._metrics, self, state, on_change
+        )
+        return self._filters[idd]
+
+    @callback
+    def async_remove(self, idd: Id) -> None:
+        """Remove the filter of a zone, cancelling its pending changes.
+
+        Args:
+            idd (Id): The number/id of the zone
+        """
+        if zone_filter := self._filters.pop(idd, None):
+            zone_filter.async_cancel()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the zone filters."""
+        return {
+            "min_on_time": self.min_on_time,
+            "off_delay": self.off_delay,
+            "flap_threshold": self.flap_threshold,
+            "raw_changes": sum(f.raw_changes for f in self._filters.values()),
+            "filtered_changes": sum(
+                f.filtered_changes for f in self._filters.values()
+            ),
+            "zones": {
+                idd: {
+                    "raw_changes": f.raw_changes,
+                    "filtered_changes": f.filtered_changes,
+                    "flapping": f.flapping,
+                }
+                for idd, f in self._filters.items()
+            },
+        }
+
+
+class ZoneFilter:
+    """Filter of the state of a zone."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        metrics: PanelMetrics,
+        filters: ZoneFilters,
+        state: bool,
+        on_change: Callable[[], None],
+    ) -> None:
+        """Initialize the zone filter.
+
+        Args:
+            hass (HomeAssistant): Homeassistant object
+            metrics (PanelMetrics): Metrics where the raw/filtered changes are
+                recorded
+            filters (ZoneFilters): The filters of the control panel, holding
+                the settings
+            state (bool): Current state of the zone
+            on_change (Callable[[], None]): Called when the filtered state
+                changes
+        """
+        self._hass = hass
+        self._metrics = metrics
+        self._filters = filters
+        self._on_change = on_change
+        self._cancel_pending: CALLBACK_TYPE | None = None
+        self._triggers: deque[float] = deque()
+        self.state: bool = state
+        self.raw_changes: int = 0
+        self.filtered_changes: int = 0
+
+    @property
+    def flapping(self) -> bool:
+        """Whether the zone is triggered too often."""
+        threshold = self._filters.flap_threshold
+        self._prune_triggers(time.monotonic())
+        return bool(threshold) and len(self._triggers) >= threshold
+
+    @callback
+    def async_update(self, raw: bool) -> None:
+        """Handle a change of the zone reported by the control panel.
+
+        Args:
+            raw (bool): Whether the zone is triggered
+        """
+        self.raw_changes += 1
+        self._metrics.zone_changes += 1
+        self.async_cancel()
+        if raw:
+            self._triggers.append(time.monotonic())
+            delay = self._filters.min_on_time
+        elif self.flapping:
+            delay = max(self._filters.off_delay, ZONE_FLAP_WINDOW)
+        else:
+            delay = self._filters.off_delay
+
+        if raw == self.state:
+            return
+        if delay:
+            self._cancel_pending = async_call_later(
+                self._hass, delay, self._async_toggle_state
+            )
+        else:
+            self._async_toggle_state()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the pending change, if any."""
+        if self._cancel_pending:
+            self._cancel_pending()
+            self._cancel_pending = None
+
+    @callback
+    def _async_toggle_state(self, _now: datetime | None = None) -> None:
+        self._cancel_pending = None
+        self.state = not self.state
+        self.filtered_changes += 1
+        self._metrics.zone_writes += 1
+        self._on_change()
+
+    def _prune_triggers(self, now: float) -> None:
+        while self._triggers and now - self._triggers[0] > ZONE_FLAP_WINDOW:
+            self._triggers.popleft()
@@ -0,0 +1,167 @@
+"""Zone trigger history of the bosch_control_panel_cc880 integration."""
+
+import time
+
+from bosch.control_panel.cc880p.models.cp import Id, Zone
+from bosch.control_panel.cc880p.models.listener import BaseControlPanelListener
+import numpy as np
+
+
+class ZoneTriggerBuffer:
+    """Preallocated ring buffer of zone triggers.
+
+    The triggers are kept in two fixed size arrays (timestamps and zone ids),
+    the oldest ones being overwritten once full. The order of the triggers in
+    the arrays doesn't matter to the queries, which are vectorised over the
+    whole buffer.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the buffer.
+
+        Args:
+            capacity (int): Maximum number of triggers kept
+        """
+        self._times = np.zeros(capacity, dtype=np.float64)
+        self._zones = np.zeros(capacity, dtype=np.uint16)
+        self._next: int = 0
+        self._size: int = 0
+        # Number of triggers ever added
+        self.total: int = 0
+
+    def __len__(self) -> int:
+        """Return the number of triggers in the buffer."""
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of triggers kept."""
+        return len(self._times)
+
+    def append(self, zone: int, timestamp: float) -> None:
+        """Add a trigger, overwriting the oldest one if full.
+
+        Args:
+            zone (int): The number/id of the zone
+            timestamp (float): Time (POSIX timestamp) of the trigger
+        """
+        self._times[self._next] = timestamp
+        self._zones[self._next] = zone
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        self.total += 1
+
+    def counts(
+        self, n_zones: int, start: float, end: float | None = None
+    ) -> np.ndarray:
+        """Count the triggers of each zone within a time range.
+
+        Args:
+            n_zones (int): Number of zones of the control panel
+            start (float): Start (POSIX timestamp, inclusive) of the range
+            end (float | None, optional): End (POSIX timestamp, exclusive) of
+                the range. Defaults to None (no end).
+
+        Returns:
+            np.ndarray: Number of triggers of each zone (index 0 is zone 1)
+        """
+        mask = self._select(start, end)
+        return np.bincount(
+            self._zones[: self._size][mask], minlength=n_zones + 1
+        )[1 : n_zones + 1]
+
+    def last(self, n_zones: int) -> np.ndarray:
+        """Get the time of the last trigger of each zone.
+
+        Args:
+            n_zones (int): Number of zones of the control panel
+
+        Returns:
+            np.ndarray: Time (POSIX timestamp) of the last trigger of each
+                zone (index 0 is zone 1), NaN for the zones never triggered
+        """
+        last = np.full(n_zones + 1, -np.inf)
+        np.maximum.at(last, self._zones[: self._size], self._times[: self._size])
+        last[np.isneginf(last)] = np.nan
+        return last[1 : n_zones + 1]
+
+    def events(
+        self, start: float, end: float | None = None, zones: list[int] | None = None
+    ) -> list[tuple[int, float]]:
+        """Get the triggers within a time range, sorted by time.
+
+        Args:
+            start (float): Start (POSIX timestamp, inclusive) of the range
+            end (float | None, optional): End (POSIX timestamp, exclusive) of
+                the range. Defaults to None (no end).
+            zones (list[int] | None, optional): Only the triggers of these
+                zones. Defaults to None (all).
+
+        Returns:
+            list[tuple[int, float]]: Zone and time of each trigger
+        """
+        mask = self._select(start, end, zones)
+        times = self._times[: self._size][mask]
+        zone_ids = self._zones[: self._size][mask]
+        order = np.argsort(times, kind="stable")
+        return list(zip(zone_ids[order].tolist(), times[order].tolist()))
+
+    def _select(
+        self, start: float, end: float | None, zones: list[int] | None = None
+    ) -> np.ndarray:
+        times = self._times[: self._size]
+        mask = times >= start
+        if end is not None:
+            mask &= times < end
+        if zones:
+            mask &= np.isin(self._zones[: self._size], zones)
+        return mask
+
+
+class ZoneHistory(BaseControlPanelListener):
+    """Listener recording the zone triggers of a control panel."""
+
+    def __init__(self, n_zones: int, capacity: int) -> None:
+        """Initialize the zone history.
+
+        Args:
+            n_zones (int): Number of zones of the control panel
+            capacity (int): Maximum number of triggers kept
+        """
+        self.n_zones = n_zones
+        self.buffer = ZoneTriggerBuffer(capacity)
+        # Last counts computed, shared by the sensors polled at the same time
+        self._counts_key: tuple[float, int, int] | None = None
+        self._counts: np.ndarray | None = None
+
+    def counts_since(self, seconds: float) -> np.ndarray:
+        """Count the triggers of each zone within the last seconds.
+
+        Args:
+            seconds (float): The time window (in seconds)
+
+        Returns:
+            np.ndarray: Number of triggers of each zone (index 0 is zone 1)
+        """
+        now = time.time()
+        key = (seconds, int(now), self.buffer.total)
+        if key != self._counts_key:
+            self._counts = self.buffer.counts(self.n_zones, now - seconds)
+            self._counts_key = key
+        return self._counts
+
+    @property
+    def last_trigger(self) -> float | None:
+        """Time (POSIX timestamp) of the last trigger of any zone."""
+        last = self.buffer.last(self.n_zones)
+        return None if np.isnan(last).all() else float(np.nanmax(last))
+
+    def as_dict(self) -> dict[str, int]:
+        """Return a dict representation of the zone history."""
+        return {"triggers": len(self.buffer), "capacity": self.buffer.capacity}
+
+    async def on_zone_trigger_changed(
+        self, id: Id, entity: Zone
+    ):  # pylint: disable=redefined-builtin
+        if entity.triggered:
+            self.buffer.append(id, time.time())
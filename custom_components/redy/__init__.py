@@ -7,7 +7,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
+from .const import DATA_APP, DATA_ENERGY_COORDINATOR, DATA_RESOURCES, DOMAIN
+from .coordinator import RedyEnergyCoordinator
+from .resources import RedyResources
 
 from edp.redy.app import App
 
@@ -42,20 +44,49 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     _LOGGER.debug("Starting the app")
 
+    resources = RedyResources()
     await app.start()
+    # The app streams the power until stopped
+    resources.async_on_stop(app.stream_api.stop)
 
     _LOGGER.debug("Redy App is running")
 
-    hass.data[DOMAIN][entry.entry_id] = app
+    try:
+        coordinator = RedyEnergyCoordinator(hass)
+        resources.async_on_stop(coordinator.async_shutdown)
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        hass.data[DOMAIN][entry.entry_id] = {
+            DATA_APP: app,
+            DATA_ENERGY_COORDINATOR: coordinator,
+            DATA_RESOURCES: resources,
+        }
+
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+        resources.async_on_release(
+            entry.add_update_listener(options_update_listener)
+        )
+
+        # First refresh, with all the energy sensors listening to the coordinator
+        await coordinator.async_refresh()
+    except BaseException:
+        # Nothing started so far keeps running (e.g. the stream of the app)
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        await resources.async_release()
+        raise
 
     return True
 
 
+async def options_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry with the new options."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        await data[DATA_RESOURCES].async_release()
 
     return unload_ok
@@ -0,0 +1,86 @@
+"""Redy Request Cache."""
+from __future__ import annotations
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+import time
+from typing import Any, Generic, TypeVar
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+
+class AsyncTTLCache(Generic[_K, _V]):
+    """Cache of the results of async requests.
+
+    Each result is kept for the TTL given with its request, up to maxsize
+    results, discarding the least recently used ones. The concurrent requests
+    of the same key share the request in flight. Failed requests are not
+    cached.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        # Results, with their expiration (monotonic) time, in LRU order
+        self._results: OrderedDict[_K, tuple[float, _V]] = OrderedDict()
+        self._in_flight: dict[_K, asyncio.Task[_V]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get(
+        self, key: _K, request: Callable[[], Awaitable[_V]], ttl: float
+    ) -> _V:
+        """Get the result of a request, from the cache if not expired.
+
+        Args:
+            key: Key of the request
+            request: Sends the request, if not cached nor in flight
+            ttl: Time (in seconds) to keep the result
+
+        Returns:
+            The result of the request
+        """
+        if (cached := self._results.get(key)) is not None:
+            expires_at, result = cached
+            if expires_at > time.monotonic():
+                self._results.move_to_end(key)
+                self.hits += 1
+                return result
+            del self._results[key]
+
+        if (task := self._in_flight.get(key)) is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(request())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._on_done(key, t, ttl))
+
+        # A cancelled caller doesn't cancel the request of the others
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        """Discard the cached results. The requests in flight aren't cached."""
+        self._results.clear()
+        self._in_flight.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the cache."""
+        return {
+            "size": len(self._results),
+            "in_flight": len(self._in_flight),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _on_done(self, key: _K, task: asyncio.Task[_V], ttl: float) -> None:
+        if self._in_flight.get(key) is not task:
+            # Cleared while in flight
+            return
+        del self._in_flight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._results[key] = (time.monotonic() + ttl, task.result())
+        self._results.move_to_end(key)
+        while len(self._results) > self._maxsize:
+            self._results.popitem(last=False)
@@ -7,11 +7,25 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 
 from .const import (
+    CONF_POWER_AGGREGATION,
+    CONF_POWER_DEADBAND,
+    CONF_POWER_WINDOW,
+    DEFAULT_POWER_AGGREGATION,
+    DEFAULT_POWER_DEADBAND,
+    DEFAULT_POWER_WINDOW,
     DOMAIN,
     DEFAULT_REGION,
     DEFAULT_USER_POOL_ID,
@@ -19,6 +33,7 @@ from .const import (
     DEFAULT_IDENTITY_POOL_ID,
     DEFAULT_IDENTITY_LOGIN,
 )
+from .power_aggregator import PowerAggregation
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -100,11 +115,59 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     return data
 
 
+def options_schema(options: dict[str, Any]) -> vol.Schema:
+    """Return the schema of the options, with the current ones as defaults."""
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_POWER_AGGREGATION,
+                default=options.get(CONF_POWER_AGGREGATION, DEFAULT_POWER_AGGREGATION),
+            ): SelectSelector(
+                SelectSelectorConfig(
+                    options=[aggregation.value for aggregation in PowerAggregation],
+                    mode=SelectSelectorMode.DROPDOWN,
+                    translation_key=CONF_POWER_AGGREGATION,
+                )
+            ),
+            vol.Required(
+                CONF_POWER_WINDOW,
+                default=options.get(CONF_POWER_WINDOW, DEFAULT_POWER_WINDOW),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=1,
+                    max=3600,
+                    unit_of_measurement="s",
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Required(
+                CONF_POWER_DEADBAND,
+                default=options.get(CONF_POWER_DEADBAND, DEFAULT_POWER_DEADBAND),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0,
+                    max=10000,
+                    unit_of_measurement="W",
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
+        }
+    )
+
+
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for redy."""
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Get the options flow for this handler."""
+        return OptionsFlow(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -133,6 +196,25 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+class OptionsFlow(config_entries.OptionsFlow):
+    """Handle the options of redy."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the options step."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init", data_schema=options_schema(dict(self.config_entry.options))
+        )
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
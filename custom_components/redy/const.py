@@ -5,6 +5,34 @@ import logging
 
 DOMAIN = "redy"
 
+DATA_APP = "app"
+DATA_ENERGY_COORDINATOR = "energy_coordinator"
+DATA_RESOURCES = "resources"
+
+CONF_POWER_AGGREGATION = "power_aggregation"
+CONF_POWER_WINDOW = "power_window"
+CONF_POWER_DEADBAND = "power_deadband"
+
+# Write the mean of the streamed power values of each window
+DEFAULT_POWER_AGGREGATION = "window"
+# Time window (in seconds) of the power aggregation
+DEFAULT_POWER_WINDOW = 10
+# Change (in watts) of the power to be written, with the deadband aggregation
+DEFAULT_POWER_DEADBAND = 10
+
+# Period (in seconds) to refresh the energy values
+ENERGY_REFRESH_INTERVAL_S = 30*5
+# Period (in seconds) to request the energy values of the month/year, which
+# are derived from the values of the day in between
+ENERGY_MONTH_RESYNC_INTERVAL_S = 60*60
+ENERGY_YEAR_RESYNC_INTERVAL_S = 6*60*60
+# Time (in seconds) to reuse the energy values of the day, and of the
+# month/year, requested to the cloud
+ENERGY_DAY_CACHE_TTL_S = 60
+ENERGY_CACHE_TTL_S = 5*60
+# Maximum number of energy values cached
+ENERGY_CACHE_SIZE = 32
+
 DEFAULT_REGION = "eu-west-1"
 DEFAULT_USER_POOL_ID = f"{DEFAULT_REGION}_7qre3K7aN"
 DEFAULT_CLIENT_ID = "78fe04ngpmrualq67a5p59sbeb"
@@ -55,4 +83,7 @@ POWER_GRID_INJECTION_NAME = "Power Grid Injection"
 POWER_GRID_PRODUCTION_KEY = "power_grid_production"
 POWER_GRID_PRODUCTION_NAME = "Power Grid Production"
 
+CLOUD_REQUESTS_DAY_KEY = "cloud_requests_day"
+CLOUD_REQUESTS_DAY_NAME = "Cloud Requests Today"
+
 LOGGER = logging.getLogger(__package__)
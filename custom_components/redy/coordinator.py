@@ -0,0 +1,258 @@
+"""Redy Energy Coordinator."""
+from __future__ import annotations
+import asyncio
+from collections.abc import Callable, Awaitable
+from datetime import datetime, timedelta
+from enum import StrEnum
+import time
+from typing import Any, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+from homeassistant.util import dt as dt_util
+
+from .cache import AsyncTTLCache
+from .const import (
+    ENERGY_CACHE_SIZE,
+    ENERGY_CACHE_TTL_S,
+    ENERGY_DAY_CACHE_TTL_S,
+    ENERGY_MONTH_RESYNC_INTERVAL_S,
+    ENERGY_REFRESH_INTERVAL_S,
+    ENERGY_YEAR_RESYNC_INTERVAL_S,
+    LOGGER,
+)
+
+from edp.redy.app import EnergyType, EnergyValues, ValueCost
+from edp.redy.services.api import ResponseError
+
+
+class EnergyPeriod(StrEnum):
+    """Period of the energy values."""
+
+    DAY = "day"
+    MONTH = "month"
+    YEAR = "year"
+
+
+EnergyMethod = Callable[[EnergyType], Awaitable[EnergyValues]]
+# Energy values of an energy type in a period
+EnergyKey = Tuple[EnergyType, EnergyPeriod]
+
+_ZERO = ValueCost(value=0, cost=0)
+
+
+async def energy_day(energy: EnergyType) -> EnergyValues:
+    """Get the today's energy."""
+    return await energy.today
+
+
+async def energy_month(energy: EnergyType) -> EnergyValues:
+    """Get the energy of this month."""
+    return await energy.this_month
+
+
+async def energy_year(energy: EnergyType) -> EnergyValues:
+    """Get the energy of this year."""
+    return await energy.this_year
+
+
+ENERGY_METHODS: dict[EnergyPeriod, EnergyMethod] = {
+    EnergyPeriod.DAY: energy_day,
+    EnergyPeriod.MONTH: energy_month,
+    EnergyPeriod.YEAR: energy_year,
+}
+
+# Time (in seconds) between the requests of the values derived from the day
+RESYNC_INTERVALS_S: dict[EnergyPeriod, float] = {
+    EnergyPeriod.MONTH: ENERGY_MONTH_RESYNC_INTERVAL_S,
+    EnergyPeriod.YEAR: ENERGY_YEAR_RESYNC_INTERVAL_S,
+}
+
+# Time (in seconds) to reuse the values requested to the cloud
+CACHE_TTLS_S: dict[EnergyPeriod, float] = {
+    EnergyPeriod.DAY: ENERGY_DAY_CACHE_TTL_S,
+    EnergyPeriod.MONTH: ENERGY_CACHE_TTL_S,
+    EnergyPeriod.YEAR: ENERGY_CACHE_TTL_S,
+}
+
+
+def _add(base: ValueCost, start: ValueCost, end: ValueCost) -> ValueCost:
+    """Add the change between start and end to the base."""
+    return ValueCost(
+        value=base.value + end.value - start.value,
+        cost=base.cost + end.cost - start.cost,
+    )
+
+
+class RedyEnergyCoordinator(DataUpdateCoordinator[dict[EnergyKey, EnergyValues]]):
+    """Redy Energy Coordinator.
+
+    The energy sensors listen with the energy key of their values as context.
+    Each refresh gets the values of each distinct key once, shared by all the
+    sensors using them (e.g. the energy and the cost of the consumption).
+    The requests go through a cache, so that the overlapping refreshes (e.g.
+    the ones requested by the entity update service) reuse the values.
+
+    Only the values of the day are requested on every refresh. The values of
+    the month and of the year are derived from them: the change of the day
+    since the last request of the month/year is added to its values. They are
+    requested again every RESYNC_INTERVALS_S, and after midnight, to correct
+    the drift. At midnight, the day starts from zero and the month/year carry
+    on from their last derived values, or from zero at the start of a new
+    month/year.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        super().__init__(
+            hass,
+            LOGGER,
+            name="Redy Energy",
+            update_interval=timedelta(seconds=ENERGY_REFRESH_INTERVAL_S),
+        )
+        self.data = {}
+        # Requests sent to the cloud
+        self.requests = 0
+        # Requests sent to the cloud today
+        self.requests_today = 0
+        # Requests avoided by sharing and deriving the values of the sensors
+        self.saved_requests = 0
+        self._date: Optional[datetime] = None
+        # Last values of the day of each energy type
+        self._day_totals: dict[EnergyType, ValueCost] = {}
+        # Values of the derived keys, with the day values they were taken at
+        self._bases: dict[EnergyKey, tuple[EnergyValues, ValueCost]] = {}
+        # Monotonic time at which each derived key is requested again
+        self._resync_at: dict[EnergyKey, float] = {}
+        self._cache: AsyncTTLCache[EnergyKey, EnergyValues] = AsyncTTLCache(
+            ENERGY_CACHE_SIZE
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the coordinator."""
+        now = time.monotonic()
+        return {
+            "keys": len(set(self._keys())),
+            "requests": self.requests,
+            "requests_today": self.requests_today,
+            "saved_requests": self.saved_requests,
+            "next_resync": max(0, round(min(self._resync_at.values()) - now))
+            if self._resync_at
+            else None,
+            "last_update_success": self.last_update_success,
+            "cache": self._cache.as_dict(),
+        }
+
+    def _keys(self) -> list[EnergyKey]:
+        return [key for key in self.async_contexts() if key is not None]
+
+    def _rollover(self, now: datetime) -> None:
+        """Start a new day, and possibly a new month/year."""
+        previous = self._date
+        self._date = now
+        self.requests_today = 0
+        # The cached values are from another day
+        self._cache.clear()
+        if previous is None:
+            return
+
+        for key, (values, day_total) in list(self._bases.items()):
+            energy_type, period = key
+            if (period == EnergyPeriod.YEAR and now.year != previous.year) or (
+                period == EnergyPeriod.MONTH and now.month != previous.month
+            ):
+                total = _ZERO
+            else:
+                total = _add(
+                    values.total,
+                    day_total,
+                    self._day_totals.get(energy_type, day_total),
+                )
+            self._bases[key] = (EnergyValues(history=[], total=total), _ZERO)
+            # Correct the values as soon as possible
+            self._resync_at[key] = 0
+        self._day_totals.clear()
+        self.data = {
+            key: EnergyValues(history=[], total=_ZERO)
+            if key[1] == EnergyPeriod.DAY
+            else values
+            for key, values in self.data.items()
+        }
+
+    async def _async_update_data(self) -> dict[EnergyKey, EnergyValues]:
+        now = dt_util.now()
+        if self._date is None or now.date() != self._date.date():
+            self._rollover(now)
+
+        keys = self._keys()
+        unique_keys = list(dict.fromkeys(keys))
+        derived_keys = [key for key in unique_keys if key[1] != EnergyPeriod.DAY]
+        monotonic = time.monotonic()
+        resync_keys = [
+            key
+            for key in derived_keys
+            if key not in self._bases or self._resync_at.get(key, 0) <= monotonic
+        ]
+        # The day values are needed to derive the other periods
+        day_keys = list(
+            dict.fromkeys(
+                [key for key in unique_keys if key[1] == EnergyPeriod.DAY]
+                + [(key[0], EnergyPeriod.DAY) for key in derived_keys]
+            )
+        )
+        self.saved_requests += len(keys) - len(day_keys) - len(resync_keys)
+
+        results = await asyncio.gather(
+            *(self._fetch(key) for key in day_keys + resync_keys)
+        )
+        if results and all(values is None for values in results):
+            raise UpdateFailed("Error getting the energy values")
+        day_results = results[: len(day_keys)]
+        resync_results = results[len(day_keys) :]
+
+        # The failed keys keep their last values
+        data = dict(self.data)
+        for key, values in zip(day_keys, day_results):
+            if values is not None:
+                data[key] = values
+                self._day_totals[key[0]] = values.total
+
+        for key, values in zip(resync_keys, resync_results):
+            if values is not None:
+                day_total = self._day_totals.get(key[0], _ZERO)
+                self._bases[key] = (values, day_total)
+                self._resync_at[key] = monotonic + RESYNC_INTERVALS_S[key[1]]
+
+        for key in derived_keys:
+            if key not in self._bases:
+                continue
+            values, day_total = self._bases[key]
+            total = _add(
+                values.total, day_total, self._day_totals.get(key[0], day_total)
+            )
+            data[key] = EnergyValues(history=values.history, total=total)
+        return data
+
+    async def _request(self, key: EnergyKey) -> EnergyValues:
+        energy_type, period = key
+        self.requests += 1
+        self.requests_today += 1
+        return await ENERGY_METHODS[period](energy_type)
+
+    async def _fetch(self, key: EnergyKey) -> Optional[EnergyValues]:
+        try:
+            return await self._cache.get(
+                key, lambda: self._request(key), CACHE_TTLS_S[key[1]]
+            )
+        except ResponseError:
+            # The values of the day are not available right after midnight
+            now = datetime.now()
+            midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            diff_sec = (now-midnight).seconds
+            if diff_sec > 60*60:
+                LOGGER.error("Error getting the energy values")
+        except Exception: # pylint: disable=broad-except
+            LOGGER.exception("Error getting the energy values")
+        return None
@@ -0,0 +1,19 @@
+"""Diagnostics support for redy."""
+from __future__ import annotations
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_ENERGY_COORDINATOR, DATA_RESOURCES, DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return the diagnostics of a config entry."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "energy_coordinator": data[DATA_ENERGY_COORDINATOR].as_dict(),
+        "resources": data[DATA_RESOURCES].as_dict(),
+    }
@@ -0,0 +1,146 @@
+"""Redy Power Aggregator."""
+from __future__ import annotations
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+from typing import Any, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    CONF_POWER_AGGREGATION,
+    CONF_POWER_DEADBAND,
+    CONF_POWER_WINDOW,
+    DEFAULT_POWER_AGGREGATION,
+    DEFAULT_POWER_DEADBAND,
+    DEFAULT_POWER_WINDOW,
+)
+from .resources import RedyResources
+
+
+class PowerAggregation(StrEnum):
+    """How the streamed power values are written."""
+
+    # Every value
+    NONE = "none"
+    # The mean of the values of each time window
+    WINDOW = "window"
+    # The values changing more than a deadband from the last one written
+    DEADBAND = "deadband"
+
+
+@dataclass
+class PowerAggregationSettings:
+    """Settings of the power aggregation."""
+
+    aggregation: PowerAggregation
+    # Time window (in seconds)
+    window_s: float
+    # Change (in watts) from the last value written to write a new one
+    deadband: float
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> PowerAggregationSettings:
+        """Get the settings from the options of a config entry."""
+        return cls(
+            aggregation=PowerAggregation(
+                options.get(CONF_POWER_AGGREGATION, DEFAULT_POWER_AGGREGATION)
+            ),
+            window_s=options.get(CONF_POWER_WINDOW, DEFAULT_POWER_WINDOW),
+            deadband=options.get(CONF_POWER_DEADBAND, DEFAULT_POWER_DEADBAND),
+        )
+
+
+class PowerAggregator:
+    """Aggregate the streamed power values before writing them.
+
+    The power is streamed faster than it is useful to record it, so the
+    values are either aggregated in time windows, written as their mean, or
+    only written when changing more than a deadband. The statistics of the
+    values since the last write are given with each written value.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        resources: RedyResources,
+        settings: PowerAggregationSettings,
+        on_write: Callable[[float, dict[str, Any]], None],
+    ) -> None:
+        self._hass = hass
+        self._resources = resources
+        self._aggregation = settings.aggregation
+        self._window_s = settings.window_s
+        self._deadband = settings.deadband
+        self._on_write = on_write
+        self._cancel_window: Optional[CALLBACK_TYPE] = None
+        self._last_written: Optional[float] = None
+        self._reset()
+        # Values streamed and written
+        self.raw = 0
+        self.written = 0
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """Values streamed per value written."""
+        return round(self.raw / self.written, 2) if self.written else None
+
+    @callback
+    def async_add(self, value: float) -> None:
+        """Add a streamed power value.
+
+        Args:
+            value: The power value
+        """
+        self.raw += 1
+        self._samples += 1
+        self._sum += value
+        self._min = value if self._min is None else min(self._min, value)
+        self._max = value if self._max is None else max(self._max, value)
+
+        if self._aggregation == PowerAggregation.WINDOW:
+            if self._cancel_window is None:
+                self._cancel_window = self._resources.async_on_release(
+                    async_call_later(self._hass, self._window_s, self._async_close)
+                )
+        elif (
+            self._aggregation == PowerAggregation.NONE
+            or self._last_written is None
+            or abs(value - self._last_written) >= self._deadband
+        ):
+            self._write(value)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the window in progress, discarding its values."""
+        if self._cancel_window:
+            self._cancel_window()
+            self._cancel_window = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._samples = 0
+        self._sum = 0.0
+        self._min: Optional[float] = None
+        self._max: Optional[float] = None
+
+    @callback
+    def _async_close(self, _now: datetime) -> None:
+        self._cancel_window()
+        self._cancel_window = None
+        self._write(round(self._sum / self._samples, 2))
+
+    def _write(self, value: float) -> None:
+        attributes = {
+            "mean": round(self._sum / self._samples, 2),
+            "min": self._min,
+            "max": self._max,
+            "samples": self._samples,
+        }
+        self._reset()
+        self._last_written = value
+        self.written += 1
+        attributes["raw_written_ratio"] = self.ratio
+        self._on_write(value, attributes)
@@ -2,7 +2,13 @@
 from __future__ import annotations
 from dataclasses import dataclass
 
+from typing import Any, Optional
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .power_aggregator import PowerAggregationSettings, PowerAggregator
 from .redy_sensor import RedySensor, RedySensorEntityDescription
+from .resources import RedyResources
 
 from edp.redy.app import PowerType
 
@@ -24,16 +30,47 @@ class RedyPowerSensorEntityDescription(
 class RedyPowerSensor(RedySensor):
     """Redy Power Sensor"""
 
-    def __init__(self, entity_description: RedyPowerSensorEntityDescription) -> None:
+    # Change with every value written
+    _unrecorded_attributes = frozenset({"samples", "raw_written_ratio"})
+
+    def __init__(
+        self,
+        entity_description: RedyPowerSensorEntityDescription,
+        resources: RedyResources,
+        aggregation: PowerAggregationSettings,
+    ) -> None:
         super().__init__(entity_description=entity_description)
         self._power_type = entity_description.power_type
+        self._resources = resources
+        self._aggregation = aggregation
+        self._aggregator: Optional[PowerAggregator] = None
+        self._unsubscribe: Optional[CALLBACK_TYPE] = None
 
     async def _start(self):
         """To be implemented by each child sensor"""
+        self._aggregator = PowerAggregator(
+            self.hass, self._resources, self._aggregation, self._async_write
+        )
         self._power_type.stream(self._stream)
+        # The power type only streams to one callback
+        self._unsubscribe = self._resources.async_on_release(
+            lambda: self._power_type.stream(None)
+        )
 
     async def _stop(self):
         """Stop"""
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if self._aggregator:
+            self._aggregator.async_cancel()
 
     async def _stream(self, value):
-        await self._update(value)
+        # Called from the thread of the MQTT stream, not from the event loop
+        self.hass.loop.call_soon_threadsafe(self._aggregator.async_add, value)
+
+    @callback
+    def _async_write(self, value: float, attributes: dict[str, Any]) -> None:
+        self._attr_native_value = value
+        self._attr_extra_state_attributes = attributes
+        self.async_write_ha_state()
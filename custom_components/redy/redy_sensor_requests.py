@@ -0,0 +1,31 @@
+"""Redy Sensor Cloud Requests."""
+from __future__ import annotations
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import RedyEnergyCoordinator
+from .redy_sensor import RedySensor, RedySensorEntityDescription
+
+
+class RedyRequestsSensor(CoordinatorEntity[RedyEnergyCoordinator], RedySensor):
+    """Redy Cloud Requests Sensor, counting the requests of the day"""
+
+    def __init__(
+        self,
+        entity_description: RedySensorEntityDescription,
+        coordinator: RedyEnergyCoordinator,
+    ) -> None:
+        CoordinatorEntity.__init__(self, coordinator)
+        RedySensor.__init__(self, entity_description=entity_description)
+
+    async def _start(self):
+        """The requests are counted by the coordinator"""
+
+    async def _stop(self):
+        """Stop"""
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._attr_native_value = self.coordinator.requests_today
+        self.async_write_ha_state()
@@ -0,0 +1,69 @@
+"""Redy Resources."""
+from __future__ import annotations
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .const import LOGGER
+
+
+class RedyResources:
+    """Resources of a config entry, released when it is unloaded.
+
+    Keeps the unsubscribers of the timers and of the stream subscriptions,
+    and the services to stop (e.g. the stream of the app), so that nothing
+    keeps running after the entry is unloaded.
+    """
+
+    def __init__(self) -> None:
+        self._unsubscribers: list[CALLBACK_TYPE] = []
+        self._stoppers: list[Callable[[], Awaitable[Any]]] = []
+
+    @callback
+    def async_on_release(self, unsubscriber: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call the unsubscriber when the resources are released.
+
+        Args:
+            unsubscriber: Unsubscribes a timer or a subscription
+
+        Returns:
+            Calls the unsubscriber before the release, only once
+        """
+        self._unsubscribers.append(unsubscriber)
+
+        @callback
+        def _release() -> None:
+            if unsubscriber in self._unsubscribers:
+                self._unsubscribers.remove(unsubscriber)
+                unsubscriber()
+
+        return _release
+
+    @callback
+    def async_on_stop(self, stopper: Callable[[], Awaitable[Any]]) -> None:
+        """Await the stopper when the resources are released.
+
+        Args:
+            stopper: Stops a service (e.g. the stream of the app)
+        """
+        self._stoppers.append(stopper)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the resources."""
+        return {
+            "unsubscribers": len(self._unsubscribers),
+            "stoppers": len(self._stoppers),
+        }
+
+    async def async_release(self) -> None:
+        """Release all the resources."""
+        while self._unsubscribers:
+            self._unsubscribers.pop()()
+
+        while self._stoppers:
+            stopper = self._stoppers.pop()
+            try:
+                await stopper()
+            except Exception: # pylint: disable=broad-except
+                LOGGER.exception("Error stopping %s", stopper)
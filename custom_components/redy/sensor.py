@@ -6,11 +6,21 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ENERGY_KILO_WATT_HOUR, POWER_WATT, CURRENCY_EURO
+from homeassistant.const import (
+    ENERGY_KILO_WATT_HOUR,
+    POWER_WATT,
+    CURRENCY_EURO,
+    EntityCategory,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_platform
 
 from .const import (
+    CLOUD_REQUESTS_DAY_KEY,
+    CLOUD_REQUESTS_DAY_NAME,
+    DATA_APP,
+    DATA_ENERGY_COORDINATOR,
+    DATA_RESOURCES,
     DOMAIN,
     ENERGY_GRID_CONSUMPTION_COST_DAY_NAME,
     ENERGY_GRID_CONSUMPTION_DAY_KEY,
@@ -44,15 +54,24 @@ from .const import (
     POWER_GRID_PRODUCTION_NAME,
 )
 
-from .redy_sensor import RedySensor
+from .coordinator import EnergyPeriod, RedyEnergyCoordinator
+from .power_aggregator import PowerAggregationSettings
+from .redy_sensor import RedySensor, RedySensorEntityDescription
 from .redy_sensor_energy import RedyEnergySensor, RedyEnergySensorEntityDescription
 from .redy_sensor_power import RedyPowerSensor, RedyPowerSensorEntityDescription
 from .redy_sensor_energy_cost import RedyEnergyCostSensor, RedyEnergyCostSensorEntityDescription
+from .redy_sensor_requests import RedyRequestsSensor
+from .resources import RedyResources
 
-from edp.redy.app import App, EnergyType, EnergyValues
+from edp.redy.app import App
 
 
-def get_entities(app: App) -> list[RedySensor]:
+def get_entities(
+    app: App,
+    coordinator: RedyEnergyCoordinator,
+    resources: RedyResources,
+    aggregation: PowerAggregationSettings,
+) -> list[RedySensor]:
     """Return the tuple of all the sensors."""
     return [
         RedyEnergySensor(
@@ -62,9 +81,10 @@ def get_entities(app: App) -> list[RedySensor]:
                 device_class=SensorDeviceClass.ENERGY,
                 native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
                 state_class=SensorStateClass.TOTAL_INCREASING,
-                energy_method=energy_day,
+                energy_period=EnergyPeriod.DAY,
                 energy_type=app.energy.consumed,
-            )
+            ),
+            coordinator,
         ),
         RedyEnergySensor(
             RedyEnergySensorEntityDescription(
@@ -73,9 +93,10 @@ def get_entities(app: App) -> list[RedySensor]:
                 device_class=SensorDeviceClass.ENERGY,
                 native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
                 state_class=SensorStateClass.TOTAL_INCREASING,
-                energy_method=energy_day,
+                energy_period=EnergyPeriod.DAY,
                 energy_type=app.energy.injected,
-            )
+            ),
+            coordinator,
         ),
         RedyEnergySensor(
             RedyEnergySensorEntityDescription(
@@ -84,9 +105,10 @@ def get_entities(app: App) -> list[RedySensor]:
                 device_class=SensorDeviceClass.ENERGY,
                 native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
                 state_class=SensorStateClass.TOTAL_INCREASING,
-                energy_method=energy_day,
+                energy_period=EnergyPeriod.DAY,
                 energy_type=app.energy.produced,
-            )
+            ),
+            coordinator,
         ),
         RedyEnergySensor(
             RedyEnergySensorEntityDescription(
@@ -95,9 +117,10 @@ def get_entities(app: App) -> list[RedySensor]:
                 device_class=SensorDeviceClass.ENERGY,
                 native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
                 state_class=SensorStateClass.TOTAL_INCREASING,
-                energy_method=energy_month,
+                energy_period=EnergyPeriod.MONTH,
                 energy_type=app.energy.consumed,
-            )
+            ),
+            coordinator,
         ),
         RedyEnergySensor(
             RedyEnergySensorEntityDescription(
@@ -106,9 +129,10 @@ def get_entities(app: App) -> list[RedySensor]:
                 device_class=SensorDeviceClass.ENERGY,
                 native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
                 state_class=SensorStateClass.TOTAL_INCREASING,
-                energy_method=energy_month,
+                energy_period=EnergyPeriod.MONTH,
                 energy_type=app.energy.injected,
-            )
+            ),
+            coordinator,
         ),
         RedyEnergySensor(
             RedyEnergySensorEntityDescription(
@@ -117,9 +141,10 @@ def get_entities(app: App) -> list[RedySensor]:
                 device_class=SensorDeviceClass.ENERGY,
                 native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
                 state_class=SensorStateClass.TOTAL_INCREASING,
-                energy_method=energy_month,
+                energy_period=EnergyPeriod.MONTH,
                 energy_type=app.energy.produced,
-            )
+            ),
+            coordinator,
         ),
         RedyEnergySensor(
             RedyEnergySensorEntityDescription(
@@ -128,9 +153,10 @@ def get_entities(app: App) -> list[RedySensor]:
                 device_class=SensorDeviceClass.ENERGY,
                 native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
                 state_class=SensorStateClass.TOTAL_INCREASING,
-                energy_method=energy_year,
+                energy_period=EnergyPeriod.YEAR,
                 energy_type=app.energy.consumed,
-            )
+            ),
+            coordinator,
         ),
         RedyEnergySensor(
             RedyEnergySensorEntityDescription(
@@ -139,9 +165,10 @@ def get_entities(app: App) -> list[RedySensor]:
                 device_class=SensorDeviceClass.ENERGY,
                 native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
                 state_class=SensorStateClass.TOTAL_INCREASING,
-                energy_method=energy_year,
+                energy_period=EnergyPeriod.YEAR,
                 energy_type=app.energy.injected,
-            )
+            ),
+            coordinator,
         ),
         RedyEnergySensor(
             RedyEnergySensorEntityDescription(
@@ -150,9 +177,10 @@ def get_entities(app: App) -> list[RedySensor]:
                 device_class=SensorDeviceClass.ENERGY,
                 native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
                 state_class=SensorStateClass.TOTAL_INCREASING,
-                energy_method=energy_year,
+                energy_period=EnergyPeriod.YEAR,
                 energy_type=app.energy.produced,
-            )
+            ),
+            coordinator,
         ),
         RedyEnergyCostSensor(
             RedyEnergyCostSensorEntityDescription(
@@ -161,9 +189,10 @@ def get_entities(app: App) -> list[RedySensor]:
                 device_class=SensorDeviceClass.MONETARY,
                 native_unit_of_measurement=CURRENCY_EURO,
                 state_class=SensorStateClass.TOTAL_INCREASING,
-                energy_method=energy_day,
+                energy_period=EnergyPeriod.DAY,
                 energy_type=app.energy.consumed,
-            )
+            ),
+            coordinator,
         ),
         RedyEnergyCostSensor(
             RedyEnergyCostSensorEntityDescription(
@@ -172,9 +201,10 @@ def get_entities(app: App) -> list[RedySensor]:
                 device_class=SensorDeviceClass.MONETARY,
                 native_unit_of_measurement=CURRENCY_EURO,
                 state_class=SensorStateClass.TOTAL_INCREASING,
-                energy_method=energy_month,
+                energy_period=EnergyPeriod.MONTH,
                 energy_type=app.energy.consumed,
-            )
+            ),
+            coordinator,
         ),
         RedyEnergyCostSensor(
             RedyEnergyCostSensorEntityDescription(
@@ -183,9 +213,10 @@ def get_entities(app: App) -> list[RedySensor]:
                 device_class=SensorDeviceClass.MONETARY,
                 native_unit_of_measurement=CURRENCY_EURO,
                 state_class=SensorStateClass.TOTAL_INCREASING,
-                energy_method=energy_year,
+                energy_period=EnergyPeriod.YEAR,
                 energy_type=app.energy.consumed,
-            )
+            ),
+            coordinator,
         ),
         RedyPowerSensor(
             RedyPowerSensorEntityDescription(
@@ -195,7 +226,9 @@ def get_entities(app: App) -> list[RedySensor]:
                 native_unit_of_measurement=POWER_WATT,
                 state_class=SensorStateClass.MEASUREMENT,
                 power_type=app.power.consumed,
-            )
+            ),
+            resources,
+            aggregation,
         ),
         RedyPowerSensor(
             RedyPowerSensorEntityDescription(
@@ -205,7 +238,9 @@ def get_entities(app: App) -> list[RedySensor]:
                 native_unit_of_measurement=POWER_WATT,
                 state_class=SensorStateClass.MEASUREMENT,
                 power_type=app.power.injected,
-            )
+            ),
+            resources,
+            aggregation,
         ),
         RedyPowerSensor(
             RedyPowerSensorEntityDescription(
@@ -215,32 +250,34 @@ def get_entities(app: App) -> list[RedySensor]:
                 native_unit_of_measurement=POWER_WATT,
                 state_class=SensorStateClass.MEASUREMENT,
                 power_type=app.power.produced,
-            )
+            ),
+            resources,
+            aggregation,
+        ),
+        RedyRequestsSensor(
+            RedySensorEntityDescription(
+                key=CLOUD_REQUESTS_DAY_KEY,
+                name=CLOUD_REQUESTS_DAY_NAME,
+                entity_category=EntityCategory.DIAGNOSTIC,
+                state_class=SensorStateClass.TOTAL_INCREASING,
+            ),
+            coordinator,
         ),
     ]
 
 
-async def energy_day(energy: EnergyType) -> EnergyValues:
-    """Get the today's energy."""
-    return await energy.today
-
-
-async def energy_month(energy: EnergyType) -> EnergyValues:
-    """Get the energy of this month."""
-    return await energy.this_month
-
-
-async def energy_year(energy: EnergyType) -> EnergyValues:
-    """Get the energy of this year."""
-    return await energy.this_year
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: entity_platform.AddEntitiesCallback,
 ) -> None:
     """Set up Efergy sensors."""
-    app: App = hass.data[DOMAIN][entry.entry_id]
-    entities = get_entities(app)
-    async_add_entities(entities, True)
+    data = hass.data[DOMAIN][entry.entry_id]
+    entities = get_entities(
+        data[DATA_APP],
+        data[DATA_ENERGY_COORDINATOR],
+        data[DATA_RESOURCES],
+        PowerAggregationSettings.from_options(entry.options),
+    )
+    # The energy values are refreshed once all the sensors are listening
+    async_add_entities(entities)
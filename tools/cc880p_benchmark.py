@@ -0,0 +1,215 @@
+"""Benchmark of the zone state writes of the Bosch CC880P integration.
+
+Starts the simulator, sets up a config entry of the
+bosch_control_panel_cc880 integration in a local Home Assistant instance
+(the real setup and entity classes) and replays storms of zone changes on
+the simulated panel. For each storm, reports the latency percentiles from
+each zone change in the panel to the write of the zone state, and the
+number of state writes of the entry per zone change.
+
+Usage:
+    python tools/cc880p_benchmark.py [--zones 4 8 16] [--rate 5] [--duration 20]
+
+The number of zones is capped at the zones supported by the model (16).
+"""
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+import json
+import logging
+import random
+import re
+import statistics
+import time
+
+from bosch.control_panel.cc880p.models.cp import CpVersion
+from cc880p_simulator import PanelState, Simulator
+from ha_harness import async_add_entry, async_test_hass
+
+from homeassistant.const import EVENT_STATE_CHANGED, STATE_ON
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "bosch_control_panel_cc880"
+HOST = "127.0.0.1"
+INSTALLER_CODE = "1111"
+
+
+@dataclass
+class StormResult:
+    """Result of a storm of zone changes."""
+
+    zones: int
+    events: int
+    # Latencies (in seconds) of the zone changes written
+    latencies: list[float]
+    writes: int
+
+    def percentile(self, percent: int) -> float:
+        """Latency percentile (in milliseconds)."""
+        if len(self.latencies) < 2:
+            return self.latencies[0] * 1000 if self.latencies else float("nan")
+        return statistics.quantiles(self.latencies, n=100)[percent - 1] * 1000
+
+    def __str__(self) -> str:
+        """Format the result as a line of the report."""
+        return (
+            f"{self.zones:>5} {self.events:>6} {len(self.latencies):>7} "
+            f"{self.percentile(50):>8.1f} {self.percentile(95):>8.1f} "
+            f"{self.percentile(99):>8.1f} {self.writes / max(self.events, 1):>12.2f}"
+        )
+
+
+async def async_run_storm(
+    hass: HomeAssistant,
+    simulator: Simulator,
+    zone_entities: dict[str, int],
+    entry_entities: set[str],
+    zones: int,
+    rate: float,
+    duration: float,
+) -> StormResult:
+    """Replay a storm of zone changes, measuring their writes.
+
+    Args:
+        hass (HomeAssistant): Homeassistant object
+        simulator (Simulator): The simulated panel
+        zone_entities (dict[str, int]): Zone (1 based) of each zone entity
+        entry_entities (set[str]): All the entities of the entry
+        zones (int): Number of zones toggled
+        rate (float): Number of zone changes per second
+        duration (float): Duration of the storm (in seconds)
+
+    Returns:
+        StormResult: The result of the storm
+    """
+    state = simulator.state
+    # Zone changes not written yet, by zone: (time, triggered)
+    pending: dict[int, list[tuple[float, bool]]] = {}
+    latencies: list[float] = []
+    writes = 0
+
+    @callback
+    def _async_state_changed(event: Event) -> None:
+        nonlocal writes
+        entity_id = event.data["entity_id"]
+        if entity_id not in entry_entities:
+            return
+        writes += 1
+        zone = zone_entities.get(entity_id)
+        new_state = event.data["new_state"]
+        if zone is None or new_state is None:
+            return
+        triggered = new_state.state == STATE_ON
+        changes = pending.get(zone, [])
+        # The written change is the last one to the new state. The changes
+        # overridden before being polled are never written
+        for i in range(len(changes) - 1, -1, -1):
+            changed, value = changes[i]
+            if value == triggered:
+                latencies.append(time.monotonic() - changed)
+                del changes[: i + 1]
+                break
+
+    unsubscribe = hass.bus.async_listen(EVENT_STATE_CHANGED, _async_state_changed)
+    events = int(rate * duration)
+    for _ in range(events):
+        idx = random.randrange(zones)
+        state.zones[idx] = not state.zones[idx]
+        pending.setdefault(idx + 1, []).append((time.monotonic(), state.zones[idx]))
+        await asyncio.sleep(1 / rate)
+
+    # Let the last changes be written
+    await asyncio.sleep(2)
+    unsubscribe()
+    state.zones[:] = [False] * len(state.zones)
+    await asyncio.sleep(2)
+    return StormResult(zones, events, latencies, writes)
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=18899)
+    parser.add_argument(
+        "--model", default=CpVersion.S16_V14.name, choices=CpVersion.__members__
+    )
+    parser.add_argument(
+        "--zones",
+        type=int,
+        nargs="+",
+        default=[4, 8, 16],
+        help="Numbers of zones toggled by the storms",
+    )
+    parser.add_argument(
+        "--rate", type=float, default=5, help="Zone changes per second"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=20, help="Duration (in seconds)"
+    )
+    parser.add_argument(
+        "--options",
+        default="{}",
+        help="JSON options of the entry, e.g. '{\"polling_period\": 500}'",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+
+    model = CpVersion[args.model].value
+    zone_counts = sorted({min(zones, model.n_zones) for zones in args.zones})
+    if max(args.zones) > model.n_zones:
+        _LOGGER.warning(
+            "The %s model supports %d zones: capped", args.model, model.n_zones
+        )
+
+    simulator = Simulator(PanelState(model, "1234", 2.0), INSTALLER_CODE)
+    server = await asyncio.start_server(simulator.handle_client, HOST, args.port)
+    async with server, async_test_hass() as hass:
+        entry = await async_add_entry(
+            hass,
+            DOMAIN,
+            {
+                "host": HOST,
+                "port": args.port,
+                "model": args.model,
+                "installer_code": INSTALLER_CODE,
+            },
+            json.loads(args.options),
+            version=2,
+        )
+        registry = er.async_get(hass)
+        entities = er.async_entries_for_config_entry(registry, entry.entry_id)
+        zone_unique_id = re.compile(rf"{entry.entry_id}_zone_(\d+)")
+        zone_entities = {
+            entity.entity_id: int(match.group(1))
+            for entity in entities
+            if (match := zone_unique_id.fullmatch(entity.unique_id))
+        }
+        entry_entities = {entity.entity_id for entity in entities}
+        # Wait for the zones to be polled off
+        await asyncio.sleep(2)
+
+        print("zones events written  p50(ms)  p95(ms)  p99(ms) writes/event")
+        for zones in zone_counts:
+            result = await async_run_storm(
+                hass,
+                simulator,
+                zone_entities,
+                entry_entities,
+                zones,
+                args.rate,
+                args.duration,
+            )
+            print(result)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,335 @@
+"""Local simulator of the Bosch CC880P control panel.
+
+Emulates the TCP protocol of the control panel (zones, outputs, siren, areas
+and clock) so that the bosch_control_panel_cc880 integration can be exercised
+without the real hardware. Scripted event storms can be replayed on top of it.
+
+Usage:
+    python tools/cc880p_simulator.py [--port 8899] [--script storm.json]
+
+The script is a JSON list of steps executed in order. Each step waits for
+"delay" seconds (default 0) and then applies its changes, e.g.:
+
+    [
+        {"delay": 1, "zone": 3, "triggered": true},
+        {"delay": 0.5, "zone": 3, "triggered": false},
+        {"output": 2, "on": true},
+        {"siren": true},
+        {"area": 1, "mode": "ARMED_AWAY"},
+        {"storm": {"rate": 20, "duration": 10, "zones": [1, 2, 3]}}
+    ]
+
+A storm toggles random zones at the given rate (events per second) during
+the given duration (in seconds).
+"""
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import datetime
+import json
+import logging
+import random
+from typing import Any
+
+from bosch.control_panel.cc880p.models.cp import ArmingMode, CpModel, CpVersion
+from bosch.control_panel.cc880p.models.requests import RequestsProps, StatusRequest
+from bosch.control_panel.cc880p.models.responses import ResponsesProps
+from bosch.control_panel.cc880p.utils import checksum
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8899
+REQUEST_SIZE = RequestsProps.StatusRequestSize.value
+
+# Sub-commands of the 0E requests
+SET_AREA_ARMED = 0x01
+SET_AREA_DISARMED = 0x02
+SET_OUTPUT_ON = 0x03
+SET_OUTPUT_OFF = 0x04
+SET_SIREN_ON = 0x05
+SET_SIREN_OFF = 0x06
+SET_TIME = 0x0C
+
+# Encoded keys
+KEY_ARM_STAY = 0x1B  # '*'
+KEY_ENTER = 0x1A  # '#'
+
+
+@dataclass
+class PanelState:
+    """State of the simulated control panel."""
+
+    model: CpModel
+    user_code: str
+    arm_delay: float
+    siren: bool = False
+    outputs: list[bool] = field(default_factory=list)
+    zones: list[bool] = field(default_factory=list)
+    zones_stay: list[bool] = field(default_factory=list)
+    areas: list[ArmingMode] = field(default_factory=list)
+    # Offset of the panel clock relative to the host clock
+    clock_offset: datetime.timedelta = datetime.timedelta()
+    keys: str = ""
+
+    def __post_init__(self):
+        """Initialize the entities of the model."""
+        self.outputs = [False] * self.model.n_outputs
+        self.zones = [False] * self.model.n_zones
+        self.zones_stay = [True] * self.model.n_zones
+        self.areas = [ArmingMode.DISARMED] * self.model.n_areas
+
+    @property
+    def time(self) -> datetime.datetime:
+        """Current time of the panel clock."""
+        return datetime.datetime.now() + self.clock_offset
+
+    def encode_status(self) -> bytes:
+        """Encode the current state as a status response."""
+        data = bytearray(ResponsesProps.StatusSize.value - 1)
+        data[0] = int(ResponsesProps.StatusCode.value, 16)
+
+        for i, on in enumerate(self.outputs):
+            if on:
+                data[2 - i // 8] |= 1 << (i % 8)
+
+        for i, (triggered, stay) in enumerate(zip(self.zones, self.zones_stay)):
+            if triggered:
+                data[3 + i // 8] |= 1 << (i % 8)
+            if stay:
+                data[5 + i // 8] |= 1 << (i % 8)
+
+        for i, mode in enumerate(self.areas):
+            if mode == ArmingMode.ARMED_AWAY:
+                data[9] |= 1 << (i % 4)
+            elif mode == ArmingMode.ARMED_STAY:
+                data[9] |= 1 << (i % 4 + 4)
+
+        now = self.time
+        data[10] = now.hour | (0x40 if self.siren else 0x00)
+        data[11] = now.minute
+
+        return bytes(data) + bytes([checksum(data)])
+
+
+class Simulator:
+    """TCP server answering the requests as the control panel would."""
+
+    def __init__(self, state: PanelState, installer_code: str | None) -> None:
+        """Initialize the simulator.
+
+        Args:
+            state (PanelState): State of the simulated control panel
+            installer_code (str | None): Installer code expected in the status
+                requests, or None to accept any
+        """
+        self.state = state
+        self._installer_code = installer_code
+        self._pending: set[asyncio.Task] = set()
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve the requests of a client until it disconnects."""
+        peer = writer.get_extra_info("peername")
+        _LOGGER.info("Client %s connected", peer)
+        try:
+            while True:
+                request = await reader.readexactly(REQUEST_SIZE)
+                if (response := self.handle_request(request)) is not None:
+                    writer.write(response)
+                    await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            _LOGGER.info("Client %s disconnected", peer)
+
+    def handle_request(self, request: bytes) -> bytes | None:
+        """Handle a request, returning its response (None if not answered).
+
+        Args:
+            request (bytes): The raw request
+
+        Returns:
+            bytes | None: The raw status response
+        """
+        if checksum(request[:-1]) != request[-1]:
+            _LOGGER.warning("Invalid checksum: %s", request.hex(" "))
+            return None
+
+        code = f"{request[0]:02X}"
+        if code == RequestsProps.StatusRequestCode.value:
+            if self._installer_code is not None and request[4:8] != (
+                StatusRequest(self._installer_code).encode()[4:8]
+            ):
+                # The real panel doesn't answer to a wrong installer code
+                _LOGGER.warning("Wrong installer code")
+                return None
+        elif code == RequestsProps.KeysRequestCode.value:
+            self._handle_keys(request[1 : 1 + request[9]])
+        elif code == RequestsProps.SetOutRequestCode.value:
+            self._handle_set(request[1], request)
+        else:
+            _LOGGER.warning("Unknown request: %s", request.hex(" "))
+            return None
+
+        return self.state.encode_status()
+
+    def _handle_keys(self, keys: bytes):
+        state = self.state
+        for key in keys:
+            if key <= 9:
+                state.keys += str(key)
+                continue
+
+            code, state.keys = state.keys, ""
+            if not code.endswith(state.user_code):
+                _LOGGER.info("Wrong user code")
+                continue
+
+            if state.areas[0] != ArmingMode.DISARMED:
+                mode = ArmingMode.DISARMED
+                # Disarming also silences the siren
+                state.siren = False
+            elif key == KEY_ARM_STAY:
+                mode = ArmingMode.ARMED_STAY
+            else:
+                mode = ArmingMode.ARMED_AWAY
+            # The panel only reports the new mode after a while
+            self._later(state.arm_delay, self._set_areas, mode)
+
+    def _handle_set(self, command: int, request: bytes):
+        state = self.state
+        idx = request[2]
+        if command in (SET_OUTPUT_ON, SET_OUTPUT_OFF) and idx < len(state.outputs):
+            state.outputs[idx] = command == SET_OUTPUT_ON
+        elif command in (SET_AREA_ARMED, SET_AREA_DISARMED) and idx < len(
+            state.areas
+        ):
+            state.areas[idx] = (
+                ArmingMode.ARMED_AWAY
+                if command == SET_AREA_ARMED
+                else ArmingMode.DISARMED
+            )
+        elif command in (SET_SIREN_ON, SET_SIREN_OFF):
+            state.siren = command == SET_SIREN_ON
+        elif command == SET_TIME:
+            hour, minute, year, month, day = request[2:7]
+            new_time = datetime.datetime(2000 + year, month, day, hour, minute)
+            state.clock_offset = new_time - datetime.datetime.now().replace(
+                second=0, microsecond=0
+            )
+        else:
+            _LOGGER.warning("Unknown command: %s", request.hex(" "))
+
+    def _set_areas(self, mode: ArmingMode):
+        self.state.areas = [mode] * len(self.state.areas)
+        _LOGGER.info("Areas changed to %s", mode.name)
+
+    def _later(self, delay: float, func, *args):
+        async def run():
+            await asyncio.sleep(delay)
+            func(*args)
+
+        task = asyncio.create_task(run())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def run_script(self, steps: list[dict[str, Any]]) -> None:
+        """Replay a script of events.
+
+        Args:
+            steps (list[dict[str, Any]]): The steps of the script
+        """
+        state = self.state
+        for step in steps:
+            await asyncio.sleep(step.get("delay", 0))
+            if "zone" in step:
+                state.zones[step["zone"] - 1] = step.get("triggered", True)
+            if "output" in step:
+                state.outputs[step["output"] - 1] = step.get("on", True)
+            if "siren" in step:
+                state.siren = step["siren"]
+            if "area" in step:
+                state.areas[step["area"] - 1] = ArmingMode[step["mode"]]
+            if "storm" in step:
+                await self.run_storm(**step["storm"])
+            _LOGGER.debug("Step %s applied", step)
+
+    async def run_storm(
+        self, rate: float, duration: float, zones: list[int] | None = None
+    ) -> None:
+        """Toggle random zones at a given rate.
+
+        Args:
+            rate (float): Number of zone changes per second
+            duration (float): Duration of the storm (in seconds)
+            zones (list[int], optional): The zones to toggle. Defaults to all.
+        """
+        state = self.state
+        zones = zones or list(range(1, len(state.zones) + 1))
+        events = int(rate * duration)
+        _LOGGER.info("Starting a storm of %d zone changes", events)
+        for _ in range(events):
+            idx = random.choice(zones) - 1
+            state.zones[idx] = not state.zones[idx]
+            await asyncio.sleep(1 / rate)
+        _LOGGER.info("Storm finished")
+
+
+async def main() -> None:
+    """Run the simulator."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--model", default=CpVersion.S16_V14.name, choices=CpVersion.__members__
+    )
+    parser.add_argument("--installer-code", default=None)
+    parser.add_argument("--user-code", default="1234")
+    parser.add_argument(
+        "--arm-delay",
+        type=float,
+        default=2.0,
+        help="Time (in seconds) the panel takes to report a new arming mode",
+    )
+    parser.add_argument(
+        "--clock-drift",
+        type=float,
+        default=0.0,
+        help="Initial offset (in minutes) of the panel clock",
+    )
+    parser.add_argument("--script", help="JSON file with the events to replay")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+
+    state = PanelState(
+        model=CpVersion[args.model].value,
+        user_code=args.user_code,
+        arm_delay=args.arm_delay,
+        clock_offset=datetime.timedelta(minutes=args.clock_drift),
+    )
+    simulator = Simulator(state, args.installer_code)
+    server = await asyncio.start_server(simulator.handle_client, args.host, args.port)
+    _LOGGER.info(
+        "Simulating a %s control panel on %s:%d", args.model, args.host, args.port
+    )
+
+    async with server:
+        if args.script:
+            with open(args.script, encoding="utf-8") as file:
+                await simulator.run_script(json.load(file))
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,140 @@
+"""Check of the discovery of the Bosch CC880P control panels.
+
+Starts simulated panels on a few loopback addresses (127.0.0.x), along with
+a server sending a banner and a server closing the connections, which aren't
+panels, scans the loopback network with the discovery of the
+bosch_control_panel_cc880 integration and checks that exactly the simulated
+panels are found, without any request being sent to them, reporting the time
+taken by the scan.
+
+Usage:
+    python tools/discovery_check.py [--panels 3] [--network 127.0.0.0/27]
+
+The loopback addresses other than 127.0.0.1 are available on Linux. Other
+systems may need them to be added as aliases of the loopback interface.
+"""
+
+import argparse
+import asyncio
+from ipaddress import ip_network
+import logging
+import os
+import sys
+
+from bosch.control_panel.cc880p.models.cp import CpVersion
+from cc880p_simulator import PanelState, Simulator
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable-next=wrong-import-position
+from custom_components.bosch_control_panel_cc880.discovery import (  # noqa: E402
+    async_scan,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+INSTALLER_CODE = "1111"
+
+
+class CountingSimulator(Simulator):
+    """Simulator counting the requests received."""
+
+    requests = 0
+
+    def handle_request(self, request: bytes) -> bytes | None:
+        """Count and handle a request."""
+        CountingSimulator.requests += 1
+        return super().handle_request(request)
+
+
+async def handle_banner_client(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    """Greet with a banner, as a service other than a control panel."""
+    writer.write(b"SSH-2.0-OpenSSH_9.6\r\n")
+    await writer.drain()
+    await reader.read(64)
+    writer.close()
+
+
+async def handle_closing_client(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    """Close the connection, as a service other than a control panel."""
+    writer.close()
+
+
+async def main() -> None:
+    """Run the check."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=18899)
+    parser.add_argument(
+        "--panels", type=int, default=3, help="Number of simulated panels"
+    )
+    parser.add_argument("--network", default="127.0.0.0/27")
+    parser.add_argument("--concurrency", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=None)
+    parser.add_argument("--listen-timeout", type=float, default=None)
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+
+    network = ip_network(args.network)
+    addresses = [str(host) for host in network.hosts() if str(host) != "127.0.0.1"]
+    if len(addresses) < args.panels + 2:
+        parser.error(f"{args.network} is too small for {args.panels} panels")
+    # Spread over the network, the others between them
+    step = len(addresses) // (args.panels + 2)
+    picked = addresses[::step][: args.panels + 2]
+    panels, banner_service, closing_service = picked[:-2], picked[-2], picked[-1]
+
+    servers: list[asyncio.Server] = []
+    for host in panels:
+        simulator = CountingSimulator(
+            PanelState(CpVersion.S16_V14.value, "1234", 2.0), INSTALLER_CODE
+        )
+        servers.append(
+            await asyncio.start_server(simulator.handle_client, host, args.port)
+        )
+    servers.append(
+        await asyncio.start_server(handle_banner_client, banner_service, args.port)
+    )
+    servers.append(
+        await asyncio.start_server(
+            handle_closing_client, closing_service, args.port
+        )
+    )
+    print(f"Panels:                  {', '.join(panels)}")
+    print(f"Service with a banner:   {banner_service}")
+    print(f"Service closing:         {closing_service}")
+
+    options = {
+        key: value
+        for key, value in (
+            ("concurrency", args.concurrency),
+            ("timeout", args.timeout),
+            ("listen_timeout", args.listen_timeout),
+        )
+        if value is not None
+    }
+    result = await async_scan([network], port=args.port, **options)
+    for server in servers:
+        server.close()
+        await server.wait_closed()
+
+    print(f"Found:                   {', '.join(result.hosts) or '-'}")
+    print(f"Scanned {result.scanned} hosts in {result.duration:.2f}s")
+    print(f"Requests to the panels:  {CountingSimulator.requests}")
+    if sorted(result.hosts) != sorted(panels):
+        sys.exit("FAILED: the hosts found aren't the simulated panels")
+    if CountingSimulator.requests:
+        sys.exit("FAILED: the panels were sent requests")
+    print("OK")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+"""Home Assistant instance running the integrations of this repository.
+
+Used by the benchmarks of the tools: a minimal Home Assistant is started in a
+temporary configuration directory linking the custom_components of this
+repository, so that the real setup of the config entries and the real entity
+classes are exercised.
+"""
+
+from collections.abc import AsyncIterator
+import contextlib
+import os
+import tempfile
+from typing import Any
+
+from homeassistant import bootstrap, config_entries, loader
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CoreState, HomeAssistant
+
+CUSTOM_COMPONENTS = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "custom_components"
+)
+
+
+@contextlib.asynccontextmanager
+async def async_test_hass(
+    components: tuple[str, ...] = ("network",)
+) -> AsyncIterator[HomeAssistant]:
+    """Run a Home Assistant instance, stopped on exit.
+
+    Args:
+        components (tuple[str, ...], optional): Components considered loaded,
+            without being set up. Defaults to the network, whose setup needs
+            the http server.
+
+    Yields:
+        HomeAssistant: The running instance
+    """
+    with tempfile.TemporaryDirectory() as config_dir:
+        os.symlink(CUSTOM_COMPONENTS, os.path.join(config_dir, "custom_components"))
+        hass = HomeAssistant(config_dir)
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await bootstrap.async_load_base_functionality(hass)
+        hass.set_state(CoreState.running)
+        hass.config.components.update(components)
+        try:
+            yield hass
+        finally:
+            for entry in hass.config_entries.async_entries():
+                await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_stop(force=True)
+
+
+async def async_add_entry(
+    hass: HomeAssistant,
+    domain: str,
+    data: dict[str, Any],
+    options: dict[str, Any] | None = None,
+    version: int = 1,
+    entry_id: str | None = None,
+) -> ConfigEntry:
+    """Add a config entry and wait for its setup.
+
+    Args:
+        hass (HomeAssistant): Homeassistant object
+        domain (str): Domain of the integration
+        data (dict[str, Any]): Data of the entry
+        options (dict[str, Any], optional): Options of the entry
+        version (int, optional): Version of the entry. Defaults to 1.
+        entry_id (str, optional): Id of the entry. Defaults to a random one.
+
+    Returns:
+        ConfigEntry: The entry, set up
+    """
+    entry = ConfigEntry(
+        version=version,
+        minor_version=1,
+        domain=domain,
+        title=domain,
+        data=data,
+        source=config_entries.SOURCE_USER,
+        options=options or {},
+        entry_id=entry_id,
+    )
+    await hass.config_entries.async_add(entry)
+    await hass.async_block_till_done()
+    return entry
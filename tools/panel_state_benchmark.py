@@ -0,0 +1,105 @@
+"""Micro-benchmark of the zone/output attributes of the control panel entity.
+
+Compares, for each zone event, the cost of the attributes built from the
+PanelStateBits bitmasks against joining the states of every zone and output
+of the control panel model into strings, as done before the bitmasks.
+
+Usage:
+    python tools/panel_state_benchmark.py [--zones 16 64 256] [--number 10000]
+
+The control panel models are built with the given number of zones, beyond the
+16 of the real panel, to show how each path scales.
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+from bosch.control_panel.cc880p.models.cp import ControlPanel, CpModel
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable-next=wrong-import-position
+from custom_components.bosch_control_panel_cc880.panel_state import (  # noqa: E402
+    PanelStateBits,
+)
+
+
+def join_attributes(control_panel: ControlPanel) -> dict[str, str]:
+    """Build the attributes joining the states of the model."""
+    c_p = control_panel
+    return {
+        "outputs": " ".join([str(int(out.on)) for _, out in c_p.outputs.items()]),
+        "zones_triggered": " ".join(
+            [str(int(zone.triggered)) for _, zone in c_p.zones.items()]
+        ),
+        "zones_enabled": " ".join(
+            [str(int(zone.enabled)) for _, zone in c_p.zones.items()]
+        ),
+    }
+
+
+def bits_attributes(bits: PanelStateBits) -> dict[str, str]:
+    """Build the attributes from the bitmasks."""
+    return {
+        "outputs": bits.outputs_str,
+        "zones_triggered": bits.zones_triggered_str,
+        "zones_enabled": bits.zones_enabled_str,
+    }
+
+
+def main() -> None:
+    """Run the micro-benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--zones", type=int, nargs="+", default=[16, 64, 256])
+    parser.add_argument(
+        "--number", type=int, default=10000, help="Zone events per measure"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Measures, the best is reported"
+    )
+    args = parser.parse_args()
+
+    print("zones   join(us)  bits(us)  bits unchanged(us)")
+    for n_zones in args.zones:
+        control_panel = ControlPanel.build(
+            CpModel(n_zones=n_zones, n_areas=1, n_outputs=5)
+        )
+        bits = PanelStateBits(control_panel)
+        zones = list(control_panel.zones.items())
+        events = iter(range(2**62))
+
+        def join_event():
+            # Every event rebuilds the attributes
+            _, zone = zones[next(events) % n_zones]
+            zone.triggered = not zone.triggered
+            return join_attributes(control_panel)
+
+        def bits_event():
+            # Only the events changing a bit rebuild the attributes
+            idd, zone = zones[next(events) % n_zones]
+            zone.triggered = not zone.triggered
+            if bits.set_zone(idd, zone):
+                return bits_attributes(bits)
+            return None
+
+        def bits_unchanged_event():
+            # Zone notifications not flipping any bit (e.g. repeated states)
+            idd, zone = zones[next(events) % n_zones]
+            if bits.set_zone(idd, zone):
+                return bits_attributes(bits)
+            return None
+
+        results = [
+            min(timeit.repeat(func, number=args.number, repeat=args.repeat))
+            / args.number
+            * 1e6
+            for func in (join_event, bits_event, bits_unchanged_event)
+        ]
+        join_us, bits_us, unchanged_us = results
+        print(f"{n_zones:>5} {join_us:>10.2f} {bits_us:>9.2f} {unchanged_us:>19.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Benchmark of the shared poller of the Bosch CC880P integration.
+
+Sets up one config entry of the bosch_control_panel_cc880 integration per
+simulated panel in a local Home Assistant instance, all of them polled by
+the shared poller, and measures while the panels are idle: the CPU time of
+the process, the wake-ups of the shared poller and of the event loop, and
+the requests received by the panels.
+
+Usage:
+    python tools/poller_benchmark.py [--panels 1 10 50] [--duration 30]
+
+The simulated panels run in the same process and event loop, so their
+requests are part of the CPU time and of the event loop wake-ups.
+"""
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+import json
+import logging
+import time
+
+from bosch.control_panel.cc880p.models.cp import CpVersion
+from cc880p_simulator import PanelState, Simulator
+from ha_harness import async_add_entry, async_test_hass
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "bosch_control_panel_cc880"
+HOST = "127.0.0.1"
+INSTALLER_CODE = "1111"
+
+
+class CountingSimulator(Simulator):
+    """Simulator counting the requests received."""
+
+    requests = 0
+
+    def handle_request(self, request: bytes) -> bytes | None:
+        """Count and handle a request."""
+        CountingSimulator.requests += 1
+        return super().handle_request(request)
+
+
+@dataclass
+class LoopWakeups:
+    """Counter of the wake-ups of the event loop."""
+
+    count: int = 0
+
+    def install(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Count the returns of the selector of the loop."""
+        selector = loop._selector  # pylint: disable=protected-access
+        select = selector.select
+
+        def _select(timeout=None):
+            events = select(timeout)
+            self.count += 1
+            return events
+
+        selector.select = _select
+
+
+async def async_measure(
+    hass: HomeAssistant,
+    panels: int,
+    port: int,
+    options: dict,
+    duration: float,
+    wakeups: LoopWakeups,
+) -> str:
+    """Set up the panels and measure them while idle.
+
+    Args:
+        hass (HomeAssistant): Homeassistant object
+        panels (int): Number of simulated panels
+        port (int): Port of the first simulated panel
+        options (dict): Options of the entries
+        duration (float): Duration of the measure (in seconds)
+        wakeups (LoopWakeups): Counter of the event loop wake-ups
+
+    Returns:
+        str: The line of the report
+    """
+    servers: list[asyncio.Server] = []
+    entries = []
+    for i in range(panels):
+        simulator = CountingSimulator(
+            PanelState(CpVersion.S16_V14.value, "1234", 2.0), INSTALLER_CODE
+        )
+        servers.append(
+            await asyncio.start_server(simulator.handle_client, HOST, port + i)
+        )
+        entries.append(
+            await async_add_entry(
+                hass,
+                DOMAIN,
+                {
+                    "host": HOST,
+                    "port": port + i,
+                    "model": CpVersion.S16_V14.name,
+                    "installer_code": INSTALLER_CODE,
+                },
+                options,
+                version=2,
+            )
+        )
+    poller = hass.data[DOMAIN]["poller"]
+    # Past the first polls of the setup
+    await asyncio.sleep(10)
+
+    requests = CountingSimulator.requests
+    poller_wakeups = poller.wakeups
+    loop_wakeups = wakeups.count
+    cpu = time.process_time()
+    started = time.monotonic()
+    await asyncio.sleep(duration)
+    elapsed = time.monotonic() - started
+    cpu = time.process_time() - cpu
+    requests = CountingSimulator.requests - requests
+    poller_wakeups = poller.wakeups - poller_wakeups
+    loop_wakeups = wakeups.count - loop_wakeups
+
+    # Measured again from scratch with the next number of panels
+    for entry in entries:
+        await hass.config_entries.async_remove(entry.entry_id)
+    for server in servers:
+        server.close()
+        await server.wait_closed()
+
+    return (
+        f"{panels:>6} {cpu / elapsed * 100:>7.2f} {requests / elapsed:>12.2f} "
+        f"{poller_wakeups / elapsed:>15.2f} {loop_wakeups / elapsed:>13.2f}"
+    )
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=18900)
+    parser.add_argument("--panels", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument(
+        "--duration", type=float, default=30, help="Duration (in seconds)"
+    )
+    parser.add_argument(
+        "--options",
+        default="{}",
+        help="JSON options of the entries, e.g. '{\"idle_polling_period\": 1000}'",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.ERROR,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+
+    wakeups = LoopWakeups()
+    wakeups.install(asyncio.get_running_loop())
+    print("panels  cpu(%)  requests/s  poller wakes/s  loop wakes/s")
+    async with async_test_hass() as hass:
+        for panels in args.panels:
+            print(
+                await async_measure(
+                    hass,
+                    panels,
+                    args.port,
+                    json.loads(args.options),
+                    args.duration,
+                    wakeups,
+                )
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
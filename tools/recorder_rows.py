@@ -0,0 +1,166 @@
+"""Recorder rows of the Bosch CC880P integration, with and without the clock.
+
+Sets up two config entries of the bosch_control_panel_cc880 integration, each
+one against its own simulated panel, in a local Home Assistant instance with
+the recorder. The clock sensor is left disabled (its default) in the first
+entry and enabled in the second one. After the given time, reports the state
+rows and the new attribute rows recorded for each entity of both entries,
+extrapolated to a day.
+
+Usage:
+    python tools/recorder_rows.py [--minutes 5]
+
+The panel clock only has minutes, so the run should last a few minutes.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import sqlite3
+import time
+import uuid
+
+from bosch.control_panel.cc880p.models.cp import CpVersion
+from cc880p_simulator import PanelState, Simulator
+from ha_harness import async_add_entry, async_test_hass
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er, recorder
+from homeassistant.setup import async_setup_component
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "bosch_control_panel_cc880"
+HOST = "127.0.0.1"
+INSTALLER_CODE = "1111"
+_DAY = 24 * 60 * 60
+
+# The attribute rows are shared by the states with the same attributes, so
+# only the ones first used since the timestamp are new
+_ROWS_QUERY = """
+    SELECT states_meta.entity_id, COUNT(*), COUNT(DISTINCT CASE
+        WHEN states.attributes_id NOT IN (
+            SELECT attributes_id FROM states
+            WHERE last_updated_ts < :since AND attributes_id IS NOT NULL
+        ) THEN states.attributes_id END)
+    FROM states JOIN states_meta USING (metadata_id)
+    WHERE states.last_updated_ts >= :since
+    GROUP BY states_meta.entity_id
+"""
+
+
+def _count_rows(db_path: str, since: float) -> dict[str, tuple[int, int]]:
+    """Count the new state and attribute rows of each entity since a time."""
+    with contextlib.closing(sqlite3.connect(db_path)) as connection:
+        return {
+            entity_id: (states, attributes)
+            for entity_id, states, attributes in connection.execute(
+                _ROWS_QUERY, {"since": since}
+            )
+        }
+
+
+async def async_add_panel(
+    hass: HomeAssistant, port: int, clock_enabled: bool
+) -> tuple[set[str], asyncio.Server]:
+    """Start a simulated panel and set up its entry.
+
+    Args:
+        hass (HomeAssistant): Homeassistant object
+        port (int): Port of the simulated panel
+        clock_enabled (bool): Whether the clock sensor is enabled
+
+    Returns:
+        tuple[set[str], asyncio.Server]: The entities of the entry, and the
+            server of the simulated panel
+    """
+    simulator = Simulator(
+        PanelState(CpVersion.S16_V14.value, "1234", 2.0), INSTALLER_CODE
+    )
+    server = await asyncio.start_server(simulator.handle_client, HOST, port)
+    entry_id = uuid.uuid4().hex
+    registry = er.async_get(hass)
+    if clock_enabled:
+        # Registered beforehand, the sensor isn't disabled by default
+        registry.async_get_or_create(
+            "sensor", DOMAIN, f"{entry_id}_clock", suggested_object_id="bosch_clock"
+        )
+    entry = await async_add_entry(
+        hass,
+        DOMAIN,
+        {
+            "host": HOST,
+            "port": port,
+            "model": CpVersion.S16_V14.name,
+            "installer_code": INSTALLER_CODE,
+        },
+        version=2,
+        entry_id=entry_id,
+    )
+    entities = {
+        entity.entity_id
+        for entity in er.async_entries_for_config_entry(registry, entry.entry_id)
+        if not entity.disabled
+    }
+    return entities, server
+
+
+async def main() -> None:
+    """Run the comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=18899)
+    parser.add_argument(
+        "--minutes", type=float, default=5, help="Duration of the measure"
+    )
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+
+    async with async_test_hass() as hass:
+        db_path = os.path.join(hass.config.config_dir, "home-assistant_v2.db")
+        recorder.async_initialize_recorder(hass)
+        if not await async_setup_component(
+            hass, "recorder", {"recorder": {"db_url": f"sqlite:///{db_path}"}}
+        ):
+            raise RuntimeError("The recorder couldn't be set up")
+        disabled, server_disabled = await async_add_panel(hass, args.port, False)
+        enabled, server_enabled = await async_add_panel(hass, args.port + 1, True)
+        async with server_disabled, server_enabled:
+            # Rows of the setup left out
+            await asyncio.sleep(5)
+            started = time.time()
+            _LOGGER.warning("Measuring for %.1f minutes", args.minutes)
+            await asyncio.sleep(args.minutes * 60)
+            duration = time.time() - started
+            await get_instance(hass).async_block_till_done()
+            rows = await hass.async_add_executor_job(_count_rows, db_path, started)
+
+            print(f"Rows per day, extrapolated from {duration:.0f}s")
+            for title, entities in (
+                ("Clock sensor disabled (default)", disabled),
+                ("Clock sensor enabled", enabled),
+            ):
+                print(f"\n{title}")
+                print(f"{'entity':<48} {'states':>8} {'attributes':>11}")
+                total = 0.0
+                for entity_id in sorted(entities):
+                    states, attributes = rows.get(entity_id, (0, 0))
+                    states_day = states * _DAY / duration
+                    total += states_day
+                    if states:
+                        print(
+                            f"{entity_id:<48} {states_day:>8.0f} "
+                            f"{attributes * _DAY / duration:>11.0f}"
+                        )
+                print(f"{'total':<48} {total:>8.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())